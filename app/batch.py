@@ -0,0 +1,105 @@
+"""Batch summarization CLI.
+
+Reads one JSON item per line and writes one JSON result per line:
+
+    python -m app.batch items.jsonl -o results.jsonl
+
+Each item has `input_data` and optionally `id`, `mode`, `detail`,
+`locale` and `model`; unknown fields are ignored. Results are written
+as items complete, with the item's position among valid items.
+"""
+import argparse
+import asyncio
+import json
+import sys
+from typing import AsyncIterator, TextIO
+from pydantic import ValidationError
+from loguru import logger
+
+from .config import settings
+from .core.entities import BatchItem, BatchItemResult
+from .core.usecases import prompt_loader
+from .infra.cache import redis_cache, summary_cache
+from .infra.llm import llm_factory
+from .infra.transcript import url_reader, whisper_pool, audio_downloader
+from .web.dependencies import get_batch_usecase
+
+
+logger.remove()
+logger.add(sys.stderr, format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}", level="INFO")
+
+
+async def read_items(source: TextIO, output: TextIO, counts: dict[str, int]) -> AsyncIterator[BatchItem]:
+    """Read batch items, writing a failed result (index -1) for each invalid line.
+    
+    Lines are read in a thread, so a slow pipe does not stall the event loop.
+    """
+    number = 0
+    while line := await asyncio.to_thread(source.readline):
+        number += 1
+        if not line.strip():
+            continue
+        try:
+            yield BatchItem.model_validate(json.loads(line))
+        except (json.JSONDecodeError, ValidationError) as e:
+            counts["failed"] += 1
+            write_result(output, BatchItemResult(index=-1, status="failed", error=f"Invalid item on line {number}: {e}"))
+
+
+def write_result(output: TextIO, result: BatchItemResult) -> None:
+    """Write one result line right away."""
+    output.write(result.model_dump_json() + "\n")
+    output.flush()
+
+
+async def run(args: argparse.Namespace) -> int:
+    """Run batch and return exit code (1 if any item failed)."""
+    prompt_loader.load()
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    
+    await redis_cache.connect()
+    await summary_cache.start()
+    
+    counts = {"done": 0, "cached": 0, "failed": 0}
+    try:
+        usecase = get_batch_usecase(args.model, max_concurrency=args.concurrency)
+        async for result in usecase.run(read_items(source, output, counts)):
+            counts[result.status] += 1
+            write_result(output, result)
+    finally:
+        await llm_factory.close()
+        await url_reader.close()
+        whisper_pool.close()
+        audio_downloader.close()
+        await summary_cache.close()
+        await redis_cache.disconnect()
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+    
+    logger.info(f"Batch finished: {counts['done']} done, {counts['cached']} cached, {counts['failed']} failed")
+    return 1 if counts["failed"] else 0
+
+
+def main() -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(prog="python -m app.batch", description="Summarize inputs from a JSONL file.")
+    parser.add_argument("input", help="JSONL file with one item per line ('-' for stdin)")
+    parser.add_argument("-o", "--output", default="-", help="JSONL file for results (default: stdout)")
+    parser.add_argument(
+        "-c", "--concurrency", type=int, default=settings.batch_max_concurrency,
+        help="Items processed at once"
+    )
+    parser.add_argument(
+        "-m", "--model", default=settings.llm_default,
+        help="Model for items without one ('auto' routes between providers)"
+    )
+    args = parser.parse_args()
+    
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -28,13 +28,92 @@ class Settings(BaseSettings):
     # Redis
     redis_url: str = Field(default="redis://localhost:6379/0", alias="REDIS_URL")
     cache_max_items: int = Field(default=50, alias="CACHE_MAX_ITEMS")
+    cache_ttl: int = Field(default=0, alias="CACHE_TTL")
+    cache_compression: Literal["zstd", "zlib", "none"] = Field(default="zstd", alias="CACHE_COMPRESSION")
+    l1_cache_max_bytes: int = Field(default=50_000_000, alias="L1_CACHE_MAX_BYTES")
+    l1_cache_ttl: int = Field(default=300, alias="L1_CACHE_TTL")
+    source_cache_ttl: int = Field(default=604800, alias="SOURCE_CACHE_TTL")
+    source_cache_max_bytes: int = Field(default=500_000_000, alias="SOURCE_CACHE_MAX_BYTES")
+    source_cache_entry_max_bytes: int = Field(default=5_000_000, alias="SOURCE_CACHE_ENTRY_MAX_BYTES")
+    similarity_enabled: bool = Field(default=True, alias="SIMILARITY_ENABLED")
+    similarity_threshold: float = Field(default=0.9, alias="SIMILARITY_THRESHOLD")
+    similarity_min_chars: int = Field(default=500, alias="SIMILARITY_MIN_CHARS")
+    similarity_ttl: int = Field(default=2592000, alias="SIMILARITY_TTL")
+    similarity_flag_approximate: bool = Field(default=True, alias="SIMILARITY_FLAG_APPROXIMATE")
+    jobs_enabled: bool = Field(default=False, alias="JOBS_ENABLED")
+    job_ttl: int = Field(default=86400, alias="JOB_TTL")
+    job_claim_idle: int = Field(default=300, alias="JOB_CLAIM_IDLE")
+    job_max_attempts: int = Field(default=3, alias="JOB_MAX_ATTEMPTS")
+    job_queue_max_length: int = Field(default=1000, alias="JOB_QUEUE_MAX_LENGTH")
+    job_worker_concurrency: int = Field(default=8, alias="JOB_WORKER_CONCURRENCY")
+    stage_fetch_concurrency: int = Field(default=16, alias="STAGE_FETCH_CONCURRENCY")
+    stage_transcribe_concurrency: int = Field(default=2, alias="STAGE_TRANSCRIBE_CONCURRENCY")
+    stage_llm_concurrency: int = Field(default=8, alias="STAGE_LLM_CONCURRENCY")
+    single_flight_timeout: int = Field(default=300, alias="SINGLE_FLIGHT_TIMEOUT")
+    
+    # Article fetching
+    url_max_connections: int = Field(default=50, alias="URL_MAX_CONNECTIONS")
+    url_max_connections_per_host: int = Field(default=4, alias="URL_MAX_CONNECTIONS_PER_HOST")
+    url_cache_ttl: int = Field(default=86400, alias="URL_CACHE_TTL")
+    url_cache_fresh_seconds: int = Field(default=600, alias="URL_CACHE_FRESH_SECONDS")
+    url_cache_max_bytes: int = Field(default=2_000_000, alias="URL_CACHE_MAX_BYTES")
+    html_extract_workers: int = Field(default=2, alias="HTML_EXTRACT_WORKERS")
+    html_max_chars: int = Field(default=10_000_000, alias="HTML_MAX_CHARS")
     
     # LLM Provider
+    llm_default: str = Field(default="openai:gpt-4o-mini", alias="LLM_DEFAULT")
+    llm_route_models: str = Field(default="openai:gpt-4o-mini", alias="LLM_ROUTE_MODELS")
+    llm_hedge_enabled: bool = Field(default=False, alias="LLM_HEDGE_ENABLED")
+    llm_hedge_min_samples: int = Field(default=20, alias="LLM_HEDGE_MIN_SAMPLES")
+    llm_hedge_max_ratio: float = Field(default=0.1, alias="LLM_HEDGE_MAX_RATIO")
     openai_api_key: str = Field(default="", alias="OPENAI_API_KEY")
+    anthropic_api_key: str = Field(default="", alias="ANTHROPIC_API_KEY")
+    anthropic_base_url: str = Field(default="https://api.anthropic.com", alias="ANTHROPIC_BASE_URL")
+    local_llm_base_url: str = Field(default="http://localhost:11434/v1", alias="LOCAL_LLM_BASE_URL")
+    local_llm_api_key: str = Field(default="", alias="LOCAL_LLM_API_KEY")
+    llm_http2: bool = Field(default=True, alias="LLM_HTTP2")
+    llm_max_connections: int = Field(default=20, alias="LLM_MAX_CONNECTIONS")
+    llm_max_keepalive: int = Field(default=10, alias="LLM_MAX_KEEPALIVE")
+    llm_keepalive_expiry: float = Field(default=60.0, alias="LLM_KEEPALIVE_EXPIRY")
+    llm_connect_timeout: float = Field(default=10.0, alias="LLM_CONNECT_TIMEOUT")
+    llm_read_timeout: float = Field(default=600.0, alias="LLM_READ_TIMEOUT")
+    llm_rpm_limit: int = Field(default=500, alias="LLM_RPM_LIMIT")
+    llm_tpm_limit: int = Field(default=200_000, alias="LLM_TPM_LIMIT")
+    llm_max_retries: int = Field(default=4, alias="LLM_MAX_RETRIES")
+    llm_backoff_base: float = Field(default=1.0, alias="LLM_BACKOFF_BASE")
+    llm_backoff_max: float = Field(default=30.0, alias="LLM_BACKOFF_MAX")
+    llm_breaker_threshold: int = Field(default=5, alias="LLM_BREAKER_THRESHOLD")
+    llm_breaker_cooldown: float = Field(default=30.0, alias="LLM_BREAKER_COOLDOWN")
+    llm_context_tokens: int = Field(default=8192, alias="LLM_CONTEXT_TOKENS")
+    
+    # Summarization
+    summary_chunk_chars: int = Field(default=24000, alias="SUMMARY_CHUNK_CHARS")
+    summary_max_concurrency: int = Field(default=4, alias="SUMMARY_MAX_CONCURRENCY")
+    transcript_block_seconds: int = Field(default=30, alias="TRANSCRIPT_BLOCK_SECONDS")
+    transcript_max_block_seconds: int = Field(default=240, alias="TRANSCRIPT_MAX_BLOCK_SECONDS")
+    transcript_reserved_tokens: int = Field(default=4096, alias="TRANSCRIPT_RESERVED_TOKENS")
+    prompts_watch: bool = Field(default=False, alias="PROMPTS_WATCH")
+    prompts_watch_interval: float = Field(default=2.0, alias="PROMPTS_WATCH_INTERVAL")
+    batch_max_items: int = Field(default=1000, alias="BATCH_MAX_ITEMS")
+    batch_max_concurrency: int = Field(default=8, alias="BATCH_MAX_CONCURRENCY")
+    batch_per_host_concurrency: int = Field(default=2, alias="BATCH_PER_HOST_CONCURRENCY")
+    batch_host_delay: float = Field(default=1.0, alias="BATCH_HOST_DELAY")
     
     # Whisper
     whisper_mode: Literal["local", "openai"] = Field(default="local", alias="WHISPER_MODE")
     whisper_model: str = Field(default="base", alias="WHISPER_MODEL")
+    whisper_workers: int = Field(default=0, alias="WHISPER_WORKERS")
+    whisper_queue_depth: int = Field(default=4, alias="WHISPER_QUEUE_DEPTH")
+    whisper_preload: bool = Field(default=False, alias="WHISPER_PRELOAD")
+    whisper_segment_seconds: int = Field(default=300, alias="WHISPER_SEGMENT_SECONDS")
+    whisper_openai_concurrency: int = Field(default=4, alias="WHISPER_OPENAI_CONCURRENCY")
+    audio_download_workers: int = Field(default=2, alias="AUDIO_DOWNLOAD_WORKERS")
+    audio_download_queue_depth: int = Field(default=8, alias="AUDIO_DOWNLOAD_QUEUE_DEPTH")
+    
+    # Metrics
+    metrics_enabled: bool = Field(default=False, alias="METRICS_ENABLED")
+    metrics_token: str = Field(default="", alias="METRICS_TOKEN")
+    metrics_worker_port: int = Field(default=0, alias="METRICS_WORKER_PORT")
     
     @property
     def is_dev(self) -> bool:
@@ -51,6 +130,11 @@ class Settings(BaseSettings):
         """Get list of allowed locales."""
         return [loc.strip() for loc in self.app_allowed_locales.split(",")]
     
+    @property
+    def llm_route_models_list(self) -> list[str]:
+        """Get models the router chooses from."""
+        return [m.strip() for m in self.llm_route_models.split(",") if m.strip()]
+    
     @property
     def session_cookie_name(self) -> str:
         """Get session cookie name."""
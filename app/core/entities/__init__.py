@@ -1,10 +1,19 @@
 """Core domain entities."""
 from .options import SummaryOptions, SummaryMode, DetailLevel
-from .summary import SummaryResult
+from .summary import SummaryResult, SummaryPreview
+from .job import Job, JobStatus
+from .batch import BatchItem, BatchItemResult
+from .prompt import PromptTemplate
 
 __all__ = [
     "SummaryOptions",
     "SummaryMode",
     "DetailLevel",
     "SummaryResult",
+    "SummaryPreview",
+    "Job",
+    "JobStatus",
+    "BatchItem",
+    "BatchItemResult",
+    "PromptTemplate",
 ]
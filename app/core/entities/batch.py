@@ -0,0 +1,25 @@
+"""Domain entities for batch summarization."""
+from typing import Literal, Optional
+from pydantic import BaseModel, Field
+from .options import SummaryMode, DetailLevel
+
+
+class BatchItem(BaseModel):
+    """One input of a batch."""
+    id: Optional[str] = Field(default=None, description="Caller's identifier, echoed in the result")
+    input_data: str = Field(description="Input text/URL/video_id")
+    mode: Optional[SummaryMode] = Field(default=None, description="Summarization mode (guessed from input if missing)")
+    detail: DetailLevel = DetailLevel.MEDIUM
+    locale: str = Field(default="en", description="UI locale for prompts")
+    model: Optional[str] = Field(default=None, description="LLM model in format 'provider:model'")
+
+
+class BatchItemResult(BaseModel):
+    """Outcome of one batch item."""
+    index: int = Field(description="Position of the item in the batch")
+    id: Optional[str] = Field(default=None, description="Caller's identifier of the item")
+    status: Literal["done", "cached", "failed"]
+    summary_id: Optional[str] = None
+    source: Optional[str] = None
+    content_md: Optional[str] = None
+    error: Optional[str] = None
@@ -0,0 +1,35 @@
+"""Domain entities for background summarization jobs."""
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+from pydantic import BaseModel, Field
+from .options import SummaryOptions
+
+
+class JobStatus(str, Enum):
+    """Job lifecycle states."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class Job(BaseModel):
+    """Summarization job processed by a background worker."""
+    id: str = Field(description="Unique identifier")
+    status: JobStatus = JobStatus.QUEUED
+    options: SummaryOptions
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    attempts: int = Field(default=0, description="Number of times a worker picked the job up")
+    result_id: Optional[str] = Field(default=None, description="Summary id once done")
+    cache_key: Optional[str] = Field(default=None, description="Summary cache key once done")
+    error: Optional[str] = Field(default=None, description="Error message if failed")
+
+    @property
+    def finished(self) -> bool:
+        """Check if job is done or failed."""
+        return self.status in (JobStatus.DONE, JobStatus.FAILED)
+
+    class Config:
+        use_enum_values = True
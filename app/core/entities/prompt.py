@@ -0,0 +1,56 @@
+"""Domain entity for prompt templates."""
+from pydantic import BaseModel, Field
+
+
+CONTENT_PLACEHOLDER = "{content}"
+
+
+class PromptTemplate(BaseModel):
+    """Prompt split into static instructions and a content part.
+
+    Instructions are identical across calls with the same template, so
+    sending them first lets providers reuse their cached prompt prefix.
+    """
+    instructions: str = Field(description="Static instructions, sent before any content")
+    content_template: str = Field(default=CONTENT_PLACEHOLDER, description="Content part with {content} placeholder")
+
+    class Config:
+        frozen = True
+
+    @classmethod
+    def parse(cls, template: str) -> "PromptTemplate":
+        """Split template text at the paragraph holding the {content} placeholder.
+
+        Args:
+            template: Template text, e.g. "Summarize...\\n\\nTranscript:\\n{content}"
+
+        Returns:
+            PromptTemplate
+
+        Raises:
+            ValueError: If the placeholder is missing, appears more than once
+                or is not in the last paragraph
+        """
+        if template.count(CONTENT_PLACEHOLDER) != 1:
+            raise ValueError(f"Prompt template must contain {CONTENT_PLACEHOLDER} exactly once")
+
+        head, _, tail = template.partition(CONTENT_PLACEHOLDER)
+        if "\n\n" in tail.rstrip():
+            # Instructions after the content would not be part of the cached prefix
+            raise ValueError(f"Prompt template must have {CONTENT_PLACEHOLDER} in its last paragraph")
+        instructions, _, label = head.rpartition("\n\n")
+        if not instructions.strip():
+            # No paragraph break before the placeholder: it is all instructions
+            instructions, label = head, ""
+        return cls(
+            instructions=instructions.strip(),
+            content_template=f"{label.lstrip()}{CONTENT_PLACEHOLDER}{tail.rstrip()}"
+        )
+
+    def render(self, content: str) -> str:
+        """Get content part with content filled in."""
+        return self.content_template.replace(CONTENT_PLACEHOLDER, content, 1)
+
+    def estimate_chars(self, content: str) -> int:
+        """Get length of the full prompt for content."""
+        return len(self.instructions) + len(self.content_template) + len(content)
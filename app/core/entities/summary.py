@@ -20,3 +20,28 @@ class SummaryResult(BaseModel):
         json_encoders = {
             datetime: lambda v: v.isoformat()
         }
+
+
+class SummaryPreview(BaseModel):
+    """Lightweight projection of a summary for history listings."""
+    id: str = Field(description="Summary identifier")
+    created_at: datetime
+    mode: str = Field(description="Summarization mode")
+    detail: str = Field(description="Detail level")
+    title: str = Field(default="", description="Short title (first line of summary)")
+    source: Optional[str] = Field(default=None, description="Source URL: article URL or video link")
+    snippet: str = Field(default="", description="Beginning of summary content")
+
+    @classmethod
+    def from_result(cls, result: SummaryResult, snippet_chars: int = 200) -> "SummaryPreview":
+        """Build preview from full summary result."""
+        first_line = next((line for line in result.content_md.splitlines() if line.strip()), "")
+        return cls(
+            id=result.id,
+            created_at=result.created_at,
+            mode=result.mode,
+            detail=result.options.detail,
+            title=first_line.lstrip("#").strip()[:100],
+            source=result.source,
+            snippet=result.content_md[:snippet_chars]
+        )
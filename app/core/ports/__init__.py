@@ -2,9 +2,19 @@
 from .llm import LLMClient
 from .transcript import TranscriptProvider
 from .cache import CacheProvider
+from .coalescer import RequestCoalescer
+from .normalizer import InputNormalizer
+from .similarity import SimilarityIndex
+from .compactor import InputCompactor
+from .metrics import PipelineMetrics
 
 __all__ = [
     "LLMClient",
     "TranscriptProvider",
     "CacheProvider",
+    "RequestCoalescer",
+    "InputNormalizer",
+    "SimilarityIndex",
+    "InputCompactor",
+    "PipelineMetrics",
 ]
@@ -1,6 +1,6 @@
 """Port interface for cache providers."""
 from typing import Protocol, Optional
-from ..entities import SummaryResult
+from ..entities import SummaryResult, SummaryPreview
 
 
 class CacheProvider(Protocol):
@@ -17,24 +17,42 @@ class CacheProvider(Protocol):
         """
         ...
 
-    async def set(self, key: str, value: SummaryResult, add_to_history: bool = False) -> None:
+    async def get_many(self, keys: list[str]) -> list[Optional[SummaryResult]]:
+        """Get several cached summaries in one round trip.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            SummaryResult or None for each key, in the same order
+        """
+        ...
+
+    async def set(
+        self,
+        key: str,
+        value: SummaryResult,
+        add_to_history: bool = False,
+        ttl: int | None = None
+    ) -> None:
         """Store summary in cache.
         
         Args:
             key: Cache key
             value: SummaryResult to cache
             add_to_history: If True, add to recent history list
+            ttl: Optional expiry in seconds (provider default if None)
         """
         ...
 
-    async def list_recent(self, limit: int) -> list[SummaryResult]:
+    async def list_recent(self, limit: int) -> list[SummaryPreview]:
         """Get list of recent summaries.
         
         Args:
             limit: Maximum number of results
             
         Returns:
-            List of recent SummaryResults, newest first
+            List of recent summary previews, newest first
         """
         ...
 
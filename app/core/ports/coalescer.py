@@ -0,0 +1,26 @@
+"""Port interface for request coalescing."""
+from typing import AsyncContextManager, Protocol
+
+
+class RequestCoalescer(Protocol):
+    """Interface for single-flight deduplication of identical requests."""
+
+    def flight(self, key: str) -> AsyncContextManager[bool]:
+        """Enter single-flight section for key.
+        
+        Only one caller per key (across all workers) runs as leader at a
+        time; other callers wait until the leader leaves the section. If
+        the leader fails, one of the waiters becomes the next leader.
+        
+        Args:
+            key: Deduplication key (summary cache key)
+            
+        Returns:
+            Async context manager yielding True for the leader, which should
+            compute and cache the result, or False for a waiter after a
+            leader succeeded, which should re-read the cache
+            
+        Raises:
+            TimeoutError: If the leader is still working after the timeout
+        """
+        ...
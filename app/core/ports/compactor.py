@@ -0,0 +1,20 @@
+"""Port interface for input compaction."""
+from typing import Protocol
+
+
+class InputCompactor(Protocol):
+    """Interface for shrinking fetched content before it is summarized."""
+
+    def compact(self, text: str, metadata: dict, model: str) -> tuple[str, dict]:
+        """Compact content to fit the model's token budget.
+        
+        Args:
+            text: Fetched text content
+            metadata: Metadata of the content
+            model: LLM model string the text will be sent to
+            
+        Returns:
+            Tuple of (compacted text, updated metadata); unchanged if the
+            content cannot be compacted
+        """
+        ...
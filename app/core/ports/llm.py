@@ -1,20 +1,33 @@
 """Port interface for LLM clients."""
-from typing import Protocol
-from ..entities import SummaryOptions
+from typing import AsyncIterator, Protocol
+from ..entities import SummaryOptions, PromptTemplate
 
 
 class LLMClient(Protocol):
     """Interface for LLM clients."""
 
-    async def summarize(self, text: str, options: SummaryOptions, prompt_template: str) -> str:
+    async def summarize(self, text: str, options: SummaryOptions, prompt_template: PromptTemplate) -> str:
         """Generate summary using LLM.
         
         Args:
             text: Text to summarize
             options: Summarization options
-            prompt_template: Prompt template with placeholders
+            prompt_template: Prompt with static instructions and content part
             
         Returns:
             Generated summary text
         """
         ...
+
+    def summarize_stream(self, text: str, options: SummaryOptions, prompt_template: PromptTemplate) -> AsyncIterator[str]:
+        """Generate summary using LLM, yielding text as it is produced.
+        
+        Args:
+            text: Text to summarize
+            options: Summarization options
+            prompt_template: Prompt with static instructions and content part
+            
+        Yields:
+            Fragments of generated summary text
+        """
+        ...
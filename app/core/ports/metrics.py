@@ -0,0 +1,27 @@
+"""Port interface for pipeline metrics."""
+from typing import AsyncContextManager, Protocol
+
+
+class PipelineMetrics(Protocol):
+    """Interface for recording pipeline stage timings and cache outcomes."""
+
+    def stage(self, stage: str, mode: str) -> AsyncContextManager[None]:
+        """Time a pipeline stage while inside the block.
+        
+        Args:
+            stage: Stage name ("request", "cache_lookup", "content", ...)
+            mode: Summarization mode of the request
+            
+        Returns:
+            Async context manager counting the stage as in flight
+        """
+        ...
+
+    def cache_result(self, cache: str, result: str) -> None:
+        """Count a cache lookup.
+        
+        Args:
+            cache: Cache name
+            result: Lookup outcome ("hit", "miss", ...)
+        """
+        ...
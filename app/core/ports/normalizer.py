@@ -0,0 +1,19 @@
+"""Port interface for input normalization."""
+from typing import Protocol
+from ..entities import SummaryMode
+
+
+class InputNormalizer(Protocol):
+    """Interface for mapping equivalent inputs to one canonical form."""
+
+    def normalize(self, input_data: str, mode: SummaryMode) -> str:
+        """Normalize input before it is hashed or fetched.
+        
+        Args:
+            input_data: Raw input text/URL/video_id
+            mode: Summary mode of the input
+            
+        Returns:
+            Canonical input (equivalent inputs give the same result)
+        """
+        ...
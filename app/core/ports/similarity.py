@@ -0,0 +1,28 @@
+"""Port interface for near-duplicate detection."""
+from typing import Optional, Protocol
+
+
+class SimilarityIndex(Protocol):
+    """Interface for finding summarized inputs similar to a new one."""
+
+    async def find(self, text: str, scope: str) -> Optional[tuple[str, float]]:
+        """Find most similar indexed text above the similarity threshold.
+        
+        Args:
+            text: Input text
+            scope: Only entries added with the same scope are considered
+            
+        Returns:
+            Tuple of (cache key, estimated similarity) or None if no match
+        """
+        ...
+
+    async def add(self, text: str, scope: str, key: str) -> None:
+        """Index text whose summary is cached under key.
+        
+        Args:
+            text: Input text
+            scope: Scope of the entry (e.g. detail level and locale)
+            key: Cache key of the summary
+        """
+        ...
@@ -1,9 +1,14 @@
 """Use cases."""
 from .summarize import SummarizeUseCase
+from .batch import BatchSummarizeUseCase, infer_mode
+from .chunker import TextChunker
 from .prompt_loader import prompt_loader, PromptLoader
 
 __all__ = [
     "SummarizeUseCase",
+    "BatchSummarizeUseCase",
+    "infer_mode",
+    "TextChunker",
     "prompt_loader",
     "PromptLoader",
 ]
@@ -0,0 +1,123 @@
+"""Batch summarization use case."""
+import asyncio
+import re
+from typing import AsyncIterable, AsyncIterator, Callable, Iterable
+from loguru import logger
+from ..entities import BatchItem, BatchItemResult, SummaryOptions, SummaryMode
+from .summarize import SummarizeUseCase
+
+
+_YOUTUBE = re.compile(r"^(https?://)?([\w-]+\.)?(youtube\.com|youtu\.be)/", re.IGNORECASE)
+_VIDEO_ID = re.compile(r"^[A-Za-z0-9_-]{11}$")
+
+
+def infer_mode(input_data: str) -> SummaryMode:
+    """Guess summarization mode from input (YouTube link or video ID, other URL or text)."""
+    value = input_data.strip()
+    if _YOUTUBE.match(value) or _VIDEO_ID.match(value):
+        return SummaryMode.YOUTUBE
+    if value.startswith(("http://", "https://")) and not any(c.isspace() for c in value):
+        return SummaryMode.URL
+    return SummaryMode.TEXT
+
+
+class BatchSummarizeUseCase:
+    """Summarizes many inputs with bounded concurrency.
+    
+    Cached inputs are answered right away. Other items are processed by
+    at most `max_concurrency` workers. Per-host politeness belongs to the
+    transcript provider the factory wires in, so it only covers upstream
+    requests. Results are yielded as they complete.
+    """
+    
+    def __init__(
+        self,
+        usecase_factory: Callable[[str], SummarizeUseCase],
+        default_model: str,
+        max_concurrency: int = 8
+    ):
+        self.usecase_factory = usecase_factory
+        self.default_model = default_model
+        self.max_concurrency = max_concurrency
+    
+    async def run(
+        self,
+        items: Iterable[BatchItem] | AsyncIterable[BatchItem]
+    ) -> AsyncIterator[BatchItemResult]:
+        """Summarize items.
+        
+        Args:
+            items: Batch items (read lazily, so large inputs stream through)
+        
+        Yields:
+            BatchItemResult for each item, in completion order
+        """
+        pending: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrency * 2)
+        results: asyncio.Queue = asyncio.Queue()
+        
+        async def feed() -> None:
+            try:
+                index = 0
+                if isinstance(items, AsyncIterable):
+                    async for item in items:
+                        await pending.put((index, item))
+                        index += 1
+                else:
+                    for item in items:
+                        await pending.put((index, item))
+                        index += 1
+            finally:
+                for _ in range(self.max_concurrency):
+                    await pending.put(None)
+        
+        async def work() -> None:
+            try:
+                while (entry := await pending.get()) is not None:
+                    await results.put(await self._run_item(*entry))
+            finally:
+                await results.put(None)
+        
+        feeder = asyncio.create_task(feed())
+        workers = [asyncio.create_task(work()) for _ in range(self.max_concurrency)]
+        finished = 0
+        try:
+            while finished < len(workers):
+                result = await results.get()
+                if result is None:
+                    finished += 1
+                    continue
+                yield result
+            await feeder
+        finally:
+            for task in (feeder, *workers):
+                task.cancel()
+    
+    async def _run_item(self, index: int, item: BatchItem) -> BatchItemResult:
+        """Summarize one item, reporting failure instead of raising."""
+        try:
+            options = SummaryOptions(
+                mode=item.mode or infer_mode(item.input_data),
+                detail=item.detail,
+                model=item.model or self.default_model,
+                locale=item.locale
+            )
+            usecase = self.usecase_factory(options.model)
+            
+            # Cached items skip fetching and LLM calls
+            result = await usecase.get_cached(item.input_data, options)
+            status = "cached"
+            if result is None:
+                result = await usecase.execute(item.input_data, options)
+                status = "done"
+            
+            return BatchItemResult(
+                index=index,
+                id=item.id,
+                status=status,
+                summary_id=result.id,
+                source=result.source,
+                content_md=result.content_md
+            )
+        except Exception as e:
+            logger.error(f"Batch item {index} failed: {e}")
+            return BatchItemResult(index=index, id=item.id, status="failed", error=str(e))
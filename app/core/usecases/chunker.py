@@ -0,0 +1,72 @@
+"""Text chunking for map-reduce summarization."""
+import re
+
+
+# Boundaries tried from coarsest to finest: paragraphs, lines (one transcript
+# timestamp per line), sentences, words.
+_SEPARATORS = (
+    (re.compile(r"\n\s*\n"), "\n\n"),
+    (re.compile(r"\n"), "\n"),
+    (re.compile(r"(?<=[.!?])\s+"), " "),
+    (re.compile(r"\s+"), " "),
+)
+
+
+class TextChunker:
+    """Splits long text into chunks on natural boundaries."""
+    
+    def __init__(self, max_chars: int = 24000):
+        if max_chars <= 0:
+            raise ValueError("max_chars must be positive")
+        self.max_chars = max_chars
+    
+    def split(self, text: str) -> list[str]:
+        """Split text into chunks of at most max_chars characters.
+        
+        Paragraph and line boundaries are preferred, so transcript lines
+        like "[mm:ss] text" are never cut in the middle. No text is dropped.
+        
+        Args:
+            text: Text to split
+        
+        Returns:
+            List of chunks in original order
+        """
+        text = text.strip()
+        if not text:
+            return []
+        return self._split(text, 0)
+    
+    def _split(self, text: str, level: int) -> list[str]:
+        """Recursively split text using separator at given level."""
+        if len(text) <= self.max_chars:
+            return [text]
+        
+        if level >= len(_SEPARATORS):
+            # No natural boundary left: hard split
+            return [text[i:i + self.max_chars] for i in range(0, len(text), self.max_chars)]
+        
+        pattern, joiner = _SEPARATORS[level]
+        parts = [part for part in pattern.split(text) if part.strip()]
+        
+        chunks: list[str] = []
+        current = ""
+        for part in parts:
+            if len(part) > self.max_chars:
+                if current:
+                    chunks.append(current)
+                    current = ""
+                chunks.extend(self._split(part, level + 1))
+                continue
+            
+            candidate = f"{current}{joiner}{part}" if current else part
+            if len(candidate) > self.max_chars:
+                chunks.append(current)
+                current = part
+            else:
+                current = candidate
+        
+        if current:
+            chunks.append(current)
+        
+        return chunks
@@ -1,17 +1,48 @@
 """Prompt template loader."""
+import asyncio
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
 from loguru import logger
-from ..entities import SummaryMode, DetailLevel
+from ..entities import SummaryMode, DetailLevel, PromptTemplate
+
+
+# Registry key: (mode, detail, locale)
+PromptKey = tuple[str, str, str]
+
+DEFAULT_LOCALE = "en"
 
 
 class PromptLoader:
-    """Loads prompt templates for different modes and detail levels."""
+    """Loads prompt templates for different modes and detail levels.
+    
+    All templates are read, parsed and validated once by `load()` into an
+    immutable registry; looking a prompt up does no filesystem I/O. An
+    optional watcher rebuilds the registry when files change and swaps it
+    in as a whole, so requests see either the old or the new set.
+    """
     
     def __init__(self, prompts_dir: str = "prompts"):
         self.prompts_dir = Path(prompts_dir)
+        self._registry: Mapping[PromptKey, PromptTemplate] | None = None
+        self._watcher: asyncio.Task | None = None
     
-    def load_prompt(self, mode: SummaryMode, detail: DetailLevel, locale: str) -> str:
-        """Load prompt template.
+    def load(self) -> None:
+        """Load and validate all templates, replacing the registry.
+        
+        Raises:
+            ValueError: If a template file is invalid
+            OSError: If a template file cannot be read
+        """
+        registry = self._build_registry()
+        self._registry = registry
+        logger.info(f"Loaded {len(registry)} prompt templates from {self.prompts_dir}")
+    
+    def load_prompt(self, mode: SummaryMode, detail: DetailLevel, locale: str) -> PromptTemplate:
+        """Get prompt template.
+        
+        Template files put the {content} placeholder last; everything
+        before its paragraph is sent as static instructions.
         
         Args:
             mode: Summarization mode
@@ -19,34 +50,80 @@ class PromptLoader:
             locale: Locale code
             
         Returns:
-            Prompt template string
+            Prompt template split into instructions and content part
         """
-        # Build filename: mode_detail.txt (e.g., "text_short.txt")
-        # Note: mode and detail are already strings due to use_enum_values=True in SummaryOptions
-        mode_str = mode if isinstance(mode, str) else mode.value
-        detail_str = detail if isinstance(detail, str) else detail.value
-        filename = f"{mode_str}_{detail_str}.txt"
-        filepath = self.prompts_dir / locale / filename
+        if self._registry is None:
+            # Not preloaded at startup (e.g. scripts)
+            self.load()
         
-        if filepath.exists():
-            try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    return f.read()
-            except Exception as e:
-                logger.error(f"Error loading prompt {filepath}: {e}")
+        # Accepts enum members and plain strings (use_enum_values=True in SummaryOptions)
+        mode_str = SummaryMode(mode).value
+        detail_str = DetailLevel(detail).value
         
-        # Fallback to default English prompt
-        if locale != "en":
-            filepath = self.prompts_dir / "en" / filename
-            if filepath.exists():
-                try:
-                    with open(filepath, "r", encoding="utf-8") as f:
-                        return f.read()
-                except Exception as e:
-                    logger.error(f"Error loading fallback prompt {filepath}: {e}")
+        # Unknown locales fall back to English (which always has every prompt)
+        registry = self._registry
+        return registry.get((mode_str, detail_str, locale)) or registry[(mode_str, detail_str, DEFAULT_LOCALE)]
+    
+    def _build_registry(self) -> Mapping[PromptKey, PromptTemplate]:
+        """Read templates of all locales, filling gaps with English and default prompts."""
+        files: dict[PromptKey, PromptTemplate] = {}
+        for filepath in sorted(self.prompts_dir.glob("*/*.txt")):
+            mode_str, _, detail_str = filepath.stem.partition("_")
+            if mode_str not in {m.value for m in SummaryMode} or detail_str not in {d.value for d in DetailLevel}:
+                logger.warning(f"Ignoring unknown prompt template {filepath}")
+                continue
+            try:
+                files[(mode_str, detail_str, filepath.parent.name)] = PromptTemplate.parse(
+                    filepath.read_text(encoding="utf-8")
+                )
+            except ValueError as e:
+                raise ValueError(f"Invalid prompt template {filepath}: {e}") from e
         
-        # Final fallback: generic prompt
-        return self._get_default_prompt(mode, detail)
+        locales = {DEFAULT_LOCALE} | {locale for _, _, locale in files}
+        registry: dict[PromptKey, PromptTemplate] = {}
+        for mode in SummaryMode:
+            for detail in DetailLevel:
+                fallback = files.get((mode.value, detail.value, DEFAULT_LOCALE)) or PromptTemplate.parse(
+                    self._get_default_prompt(mode.value, detail.value)
+                )
+                for locale in locales:
+                    registry[(mode.value, detail.value, locale)] = files.get((mode.value, detail.value, locale), fallback)
+        return MappingProxyType(registry)
+    
+    def _snapshot(self) -> dict[str, float]:
+        """Get modification times of template files."""
+        return {str(path): path.stat().st_mtime for path in self.prompts_dir.glob("*/*.txt")}
+    
+    def start_watching(self, interval: float = 2.0) -> None:
+        """Reload templates in the background when files change."""
+        if self._watcher is None:
+            self._watcher = asyncio.create_task(self._watch(interval))
+    
+    async def stop_watching(self) -> None:
+        """Stop background reloading."""
+        if self._watcher is not None:
+            self._watcher.cancel()
+            try:
+                await self._watcher
+            except asyncio.CancelledError:
+                pass
+            self._watcher = None
+    
+    async def _watch(self, interval: float) -> None:
+        """Poll template files and swap in a new registry on change."""
+        snapshot = await asyncio.to_thread(self._snapshot)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                current = await asyncio.to_thread(self._snapshot)
+                if current == snapshot:
+                    continue
+                snapshot = current
+                self._registry = await asyncio.to_thread(self._build_registry)
+                logger.info(f"Reloaded {len(self._registry)} prompt templates")
+            except Exception as e:
+                # Keep serving the previous templates
+                logger.error(f"Error reloading prompt templates: {e}")
     
     def _get_default_prompt(self, mode: SummaryMode, detail: DetailLevel) -> str:
         """Get default prompt as fallback."""
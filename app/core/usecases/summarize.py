@@ -1,9 +1,16 @@
 """Unified summarization use case."""
+import asyncio
 import hashlib
 import uuid
+from contextlib import nullcontext
+from typing import AsyncContextManager, AsyncIterator
 from loguru import logger
-from ..entities import SummaryOptions, SummaryResult, SummaryMode
-from ..ports import LLMClient, TranscriptProvider, CacheProvider
+from ..entities import SummaryOptions, SummaryResult, SummaryMode, DetailLevel, PromptTemplate
+from ..ports import (
+    LLMClient, TranscriptProvider, CacheProvider, RequestCoalescer, InputNormalizer, SimilarityIndex, InputCompactor,
+    PipelineMetrics
+)
+from .chunker import TextChunker
 from .prompt_loader import prompt_loader
 
 
@@ -14,11 +21,27 @@ class SummarizeUseCase:
         self,
         llm_client: LLMClient,
         transcript_provider: TranscriptProvider,
-        cache_provider: CacheProvider
+        cache_provider: CacheProvider,
+        coalescer: RequestCoalescer | None = None,
+        normalizer: InputNormalizer | None = None,
+        similarity_index: SimilarityIndex | None = None,
+        flag_approximate: bool = True,
+        compactor: InputCompactor | None = None,
+        metrics: PipelineMetrics | None = None,
+        chunk_max_chars: int = 24000,
+        max_concurrency: int = 4
     ):
         self.llm_client = llm_client
         self.transcript_provider = transcript_provider
         self.cache_provider = cache_provider
+        self.coalescer = coalescer
+        self.normalizer = normalizer
+        self.similarity_index = similarity_index
+        self.flag_approximate = flag_approximate
+        self.compactor = compactor
+        self.metrics = metrics
+        self.chunker = TextChunker(chunk_max_chars)
+        self.max_concurrency = max_concurrency
     
     async def execute(self, input_data: str, options: SummaryOptions) -> SummaryResult:
         """Execute summarization.
@@ -30,32 +53,267 @@ class SummarizeUseCase:
         Returns:
             SummaryResult
         """
+        async with self._stage("request", options):
+            return await self._execute(input_data, options)
+    
+    async def _execute(self, input_data: str, options: SummaryOptions) -> SummaryResult:
+        """Run summarization (see execute)."""
+        # Equivalent inputs share one cache entry
+        input_data = self._normalize(input_data, options)
+        
         # Generate cache key from input and options
         cache_key = self._generate_cache_key(input_data, options)
         
-        # Check cache
-        cached = await self.cache_provider.get(cache_key)
+        # Check cache; slightly edited texts reuse the summary of the original
+        cached = await self._lookup(input_data, options, cache_key)
+        if cached:
+            return cached
+        
+        # Identical concurrent requests share one upstream call
+        while True:
+            async with self._flight(cache_key) as leader:
+                # Another request may have stored the result since the lookup above
+                cached = await self._lookup_coalesced(options, cache_key)
+                if cached:
+                    return cached
+                if not leader:
+                    # The request we waited for left no result; try to lead
+                    continue
+                
+                logger.info(f"Processing {options.mode} summarization")
+                
+                # Get text content based on mode
+                async with self._stage("content", options):
+                    text, metadata = await self._get_content(input_data, options)
+                
+                # Load appropriate prompt template
+                async with self._stage("prompt", options):
+                    prompt_template = prompt_loader.load_prompt(options.mode, options.detail, options.locale)
+                
+                # Generate summary (map-reduce over chunks for long inputs)
+                async with self._stage("llm", options):
+                    summary_text = await self._summarize_text(text, options, prompt_template)
+                
+                async with self._stage("cache_write", options):
+                    return await self._store_result(input_data, options, cache_key, summary_text, metadata)
+    
+    async def execute_stream(
+        self,
+        input_data: str,
+        options: SummaryOptions
+    ) -> AsyncIterator[str | SummaryResult]:
+        """Execute summarization, streaming the summary as it is generated.
+        
+        Args:
+            input_data: Input text/URL/video_id depending on mode
+            options: Summarization options
+            
+        Yields:
+            Summary text fragments, then the final (cached) SummaryResult
+        """
+        async with self._stage("request", options):
+            async for item in self._execute_stream(input_data, options):
+                yield item
+    
+    async def _execute_stream(
+        self,
+        input_data: str,
+        options: SummaryOptions
+    ) -> AsyncIterator[str | SummaryResult]:
+        """Run streaming summarization (see execute_stream)."""
+        input_data = self._normalize(input_data, options)
+        cache_key = self._generate_cache_key(input_data, options)
+        
+        cached = await self._lookup(input_data, options, cache_key)
+        if cached:
+            yield cached.content_md
+            yield cached
+            return
+        
+        while True:
+            async with self._flight(cache_key) as leader:
+                cached = await self._lookup_coalesced(options, cache_key)
+                if cached:
+                    yield cached.content_md
+                    yield cached
+                    return
+                if not leader:
+                    continue
+                
+                logger.info(f"Processing {options.mode} summarization (streaming)")
+                
+                async with self._stage("content", options):
+                    text, metadata = await self._get_content(input_data, options)
+                async with self._stage("prompt", options):
+                    prompt_template = prompt_loader.load_prompt(options.mode, options.detail, options.locale)
+                
+                # Map passes run to completion, only the final pass is streamed
+                # (the llm stage includes the time the caller takes to consume deltas)
+                parts = []
+                async with self._stage("llm", options):
+                    text = await self._condense(text, options)
+                    async for delta in self.llm_client.summarize_stream(text, options, prompt_template):
+                        parts.append(delta)
+                        yield delta
+                
+                async with self._stage("cache_write", options):
+                    result = await self._store_result(input_data, options, cache_key, "".join(parts), metadata)
+                yield result
+                return
+    
+    async def get_cached(self, input_data: str, options: SummaryOptions) -> SummaryResult | None:
+        """Get cached summary without running summarization.
+        
+        Args:
+            input_data: Input text/URL/video_id depending on mode
+            options: Summarization options
+            
+        Returns:
+            Cached (or near-duplicate) SummaryResult, or None
+        """
+        input_data = self._normalize(input_data, options)
+        cached = await self.cache_provider.get(self._generate_cache_key(input_data, options))
         if cached:
-            logger.info(f"Cache hit for key: {cache_key}")
+            await self._keep_in_history(cached)
             return cached
+        return await self._find_similar(input_data, options)
+    
+    async def get_by_key(self, cache_key: str) -> SummaryResult | None:
+        """Get cached summary by cache key, restoring its history entry.
+        
+        Args:
+            cache_key: Cache key of the input (SummaryResult.input_fingerprint)
+            
+        Returns:
+            Cached SummaryResult, or None
+        """
+        cached = await self.cache_provider.get(cache_key)
+        if cached:
+            await self._keep_in_history(cached)
+        return cached
+    
+    def _normalize(self, input_data: str, options: SummaryOptions) -> str:
+        """Get canonical input (unchanged without normalizer)."""
+        if self.normalizer is None:
+            return input_data
+        return self.normalizer.normalize(input_data, options.mode)
+    
+    def _similarity_scope(self, options: SummaryOptions) -> str:
+        """Get similarity index scope (summaries are only reused within it)."""
+        return f"{options.detail}:{options.locale}:{options.model}"
+    
+    async def _find_similar(self, input_data: str, options: SummaryOptions) -> SummaryResult | None:
+        """Get cached summary of a near-duplicate text input.
         
-        logger.info(f"Processing {options.mode} summarization")
+        Args:
+            input_data: Normalized input text
+            options: Summarization options
+            
+        Returns:
+            Cached SummaryResult (flagged as approximate if enabled) or None
+        """
+        if self.similarity_index is None or options.mode != SummaryMode.TEXT:
+            return None
         
-        # Get text content based on mode
-        text, metadata = await self._get_content(input_data, options)
+        match = await self.similarity_index.find(input_data, self._similarity_scope(options))
+        if not match:
+            return None
         
-        # Limit text size for safety
-        max_chars = 100000
-        if len(text) > max_chars:
-            logger.warning(f"Text too long ({len(text)} chars), truncating to {max_chars}")
-            text = text[:max_chars]
+        key, similarity = match
+        cached = await self.cache_provider.get(key)
+        if not cached:
+            return None
+        await self._keep_in_history(cached)
         
-        # Load appropriate prompt template
-        prompt_template = prompt_loader.load_prompt(options.mode, options.detail, options.locale)
+        logger.info(f"Near-duplicate hit for key: {key} (similarity {similarity:.2f})")
+        if self.flag_approximate:
+            cached = cached.model_copy(
+                update={"meta": {**cached.meta, "approximate": True, "similarity": round(similarity, 3)}}
+            )
+        return cached
+    
+    async def _lookup(self, input_data: str, options: SummaryOptions, cache_key: str) -> SummaryResult | None:
+        """Get cached summary of the input or of a near-duplicate text.
         
-        # Generate summary
-        summary_text = await self.llm_client.summarize(text, options, prompt_template)
+        Args:
+            input_data: Normalized input
+            options: Summarization options
+            cache_key: Cache key for the input
         
+        Returns:
+            Cached SummaryResult or None
+        """
+        async with self._stage("cache_lookup", options):
+            cached = await self.cache_provider.get(cache_key)
+            if cached:
+                logger.info(f"Cache hit for key: {cache_key}")
+                self._record_cache("hit")
+                await self._keep_in_history(cached)
+                return cached
+            
+            similar = await self._find_similar(input_data, options)
+        
+        self._record_cache("near_duplicate" if similar else "miss")
+        return similar
+    
+    async def _lookup_coalesced(self, options: SummaryOptions, cache_key: str) -> SummaryResult | None:
+        """Get summary stored by a concurrent identical request."""
+        async with self._stage("cache_lookup", options):
+            cached = await self.cache_provider.get(cache_key)
+            if cached:
+                await self._keep_in_history(cached)
+        if cached:
+            logger.info(f"Coalesced with in-flight request for key: {cache_key}")
+            self._record_cache("coalesced")
+        return cached
+    
+    async def _keep_in_history(self, result: SummaryResult) -> None:
+        """Re-add cached summary to history if its entry was trimmed.
+        
+        The cache key entry outlives the history entry, but results are
+        opened by their history id (e.g. /summary/{id}).
+        """
+        if await self.cache_provider.get(result.id) is None:
+            logger.info(f"Restoring trimmed history entry: {result.id}")
+            await self.cache_provider.set(result.id, result, add_to_history=True)
+    
+    def _stage(self, stage: str, options: SummaryOptions) -> AsyncContextManager[None]:
+        """Time pipeline stage (no-op without metrics)."""
+        if self.metrics is None:
+            return nullcontext()
+        return self.metrics.stage(stage, SummaryMode(options.mode).value)
+    
+    def _record_cache(self, result: str) -> None:
+        """Count summary cache lookup outcome."""
+        if self.metrics is not None:
+            self.metrics.cache_result("summary", result)
+    
+    def _flight(self, cache_key: str) -> AsyncContextManager[bool]:
+        """Enter single-flight section for cache key (always leader without coalescer)."""
+        if self.coalescer is None:
+            return nullcontext(True)
+        return self.coalescer.flight(cache_key)
+    
+    async def _store_result(
+        self,
+        input_data: str,
+        options: SummaryOptions,
+        cache_key: str,
+        summary_text: str,
+        metadata: dict
+    ) -> SummaryResult:
+        """Build SummaryResult and write it to cache.
+        
+        Args:
+            input_data: Input text/URL/video_id
+            options: Summarization options
+            cache_key: Cache key for the input
+            summary_text: Generated summary
+            metadata: Metadata dict with additional info
+            
+        Returns:
+            SummaryResult
+        """
         # Determine source URL
         source = self._get_source_url(input_data, options, metadata)
         
@@ -71,13 +329,83 @@ class SummarizeUseCase:
         )
         
         # Cache the result with both cache_key (hash) for deduplication and UUID for retrieval
-        # Only the UUID is added to history to avoid duplicates
+        # Only the UUID is added to history to avoid duplicates; the content itself is stored once
         await self.cache_provider.set(cache_key, result, add_to_history=False)
         await self.cache_provider.set(result.id, result, add_to_history=True)
         
+        if self.similarity_index is not None and options.mode == SummaryMode.TEXT:
+            await self.similarity_index.add(input_data, self._similarity_scope(options), cache_key)
+        
         logger.info(f"Summarization completed: {result.id}")
         return result
     
+    async def _summarize_text(self, text: str, options: SummaryOptions, prompt_template: PromptTemplate) -> str:
+        """Summarize text, splitting it into chunks if it is too long.
+        
+        Chunks are summarized concurrently (map), then the partial summaries
+        are summarized with the requested prompt (reduce).
+        
+        Args:
+            text: Text to summarize
+            options: Summarization options
+            prompt_template: Prompt template for the final summary
+            
+        Returns:
+            Summary text
+        """
+        text = await self._condense(text, options)
+        return await self.llm_client.summarize(text, options, prompt_template)
+    
+    async def _condense(self, text: str, options: SummaryOptions) -> str:
+        """Run map passes until text fits into a single LLM call.
+        
+        Args:
+            text: Text to condense
+            options: Summarization options
+            
+        Returns:
+            Original text if short enough, otherwise joined partial summaries,
+            in either case at most one chunk long
+        """
+        chunks = self.chunker.split(text)
+        while len(chunks) > 1:
+            logger.info(f"Text too long ({len(text)} chars), summarizing in {len(chunks)} chunks")
+            partials = await self._map_chunks(chunks, options)
+            combined = "\n\n".join(partials)
+            
+            if len(combined) >= len(text):
+                # Partial summaries did not shrink the input: cut each to an
+                # equal share so the reduce call still gets at most one chunk
+                logger.warning(f"Partial summaries did not shrink the text ({len(combined)} chars), truncating them")
+                share = max(self.chunker.max_chars // len(partials) - 2, 1)
+                return "\n\n".join(partial[:share] for partial in partials)
+            
+            text = combined
+            chunks = self.chunker.split(text)
+        
+        return text
+    
+    async def _map_chunks(self, chunks: list[str], options: SummaryOptions) -> list[str]:
+        """Summarize chunks concurrently with bounded parallelism.
+        
+        Args:
+            chunks: Text chunks
+            options: Summarization options
+            
+        Returns:
+            Partial summaries in chunk order
+        """
+        # Partial summaries use the detailed prompt so the reduce pass has enough to work with
+        map_options = options.model_copy(update={"detail": DetailLevel.LONG.value})
+        map_template = prompt_loader.load_prompt(options.mode, DetailLevel.LONG, options.locale)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def summarize_chunk(chunk: str) -> str:
+            async with semaphore:
+                return await self.llm_client.summarize(chunk, map_options, map_template)
+        
+        return await asyncio.gather(*(summarize_chunk(chunk) for chunk in chunks))
+    
     async def _get_content(self, input_data: str, options: SummaryOptions) -> tuple[str, dict]:
         """Get content based on mode.
         
@@ -103,6 +431,10 @@ class SummarizeUseCase:
             metadata.update(yt_metadata)
             metadata["video_id"] = input_data
             
+            # One timestamp per block instead of per caption snippet
+            if self.compactor is not None:
+                text, metadata = await asyncio.to_thread(self.compactor.compact, text, metadata, options.model)
+            
             # Update with_timestamps based on availability
             if yt_metadata.get("has_timestamps") and options.detail == "long":
                 options.with_timestamps = True
@@ -1,4 +1,22 @@
 """Cache infrastructure."""
 from .redis_cache import redis_cache, RedisCache
+from .single_flight import single_flight, SingleFlight
+from .http_cache import http_cache, HTTPResponseCache
+from .tiered_cache import summary_cache, TieredCache
+from .source_cache import source_cache, SourceCache
+from .similarity_index import similarity_index, MinHashIndex
 
-__all__ = ["redis_cache", "RedisCache"]
+__all__ = [
+    "redis_cache",
+    "RedisCache",
+    "single_flight",
+    "SingleFlight",
+    "http_cache",
+    "HTTPResponseCache",
+    "summary_cache",
+    "TieredCache",
+    "source_cache",
+    "SourceCache",
+    "similarity_index",
+    "MinHashIndex",
+]
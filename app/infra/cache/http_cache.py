@@ -0,0 +1,58 @@
+"""Redis cache of raw HTTP responses for conditional GET revalidation."""
+import hashlib
+import json
+from typing import Optional
+from loguru import logger
+from .redis_cache import RedisCache, redis_cache
+from ...config import settings
+
+
+class HTTPResponseCache:
+    """Stores fetched page bodies with their ETag/Last-Modified validators."""
+    
+    def __init__(self, cache: RedisCache, ttl: int | None = None, max_bytes: int | None = None):
+        self.cache = cache
+        self.ttl = ttl or settings.url_cache_ttl
+        self.max_bytes = max_bytes or settings.url_cache_max_bytes
+    
+    def _make_key(self, url: str) -> str:
+        """Make full Redis key."""
+        return f"page:{hashlib.sha256(url.encode()).hexdigest()[:16]}"
+    
+    async def get(self, url: str) -> Optional[dict]:
+        """Get cached response entry.
+        
+        Args:
+            url: Requested URL
+        
+        Returns:
+            Dict with body, etag, last_modified and fetched_at, or None
+        """
+        try:
+            client = await self.cache.get_client()
+            data = await client.get(self._make_key(url))
+            return json.loads(data) if data else None
+        except Exception as e:
+            logger.error(f"Error getting page from cache: {e}")
+            return None
+    
+    async def set(self, url: str, entry: dict) -> None:
+        """Store response entry (skipped for bodies above max_bytes).
+        
+        Args:
+            url: Requested URL
+            entry: Dict with body, etag, last_modified and fetched_at
+        """
+        if len(entry["body"]) > self.max_bytes:
+            logger.debug(f"Page too large to cache: {url}")
+            return
+        
+        try:
+            client = await self.cache.get_client()
+            await client.set(self._make_key(url), json.dumps(entry), ex=self.ttl)
+        except Exception as e:
+            logger.error(f"Error caching page: {e}")
+
+
+# Global HTTP response cache instance
+http_cache = HTTPResponseCache(redis_cache)
@@ -1,26 +1,191 @@
 """Redis cache provider implementation."""
-import json
+import hashlib
+import time
 from typing import Optional
 from datetime import datetime
 import redis.asyncio as aioredis
+from redis.asyncio.client import Pipeline
 from loguru import logger
-from ...core.entities import SummaryResult
+from ...core.entities import SummaryResult, SummaryPreview
 from ...config import settings
+from ..metrics import metrics
+from .serializer import Serializer, get_serializer
+
+
+# Content-addressed layout: summary:{key} holds "ref:<digest>" pointing to a
+# blob stored once under summary:blob:<digest>. summary:refs:<digest> maps each
+# alias key to its expiry (0 = never); the blob is deleted when no live alias
+# is left and otherwise expires together with its longest-lived alias.
+# Evicted, overwritten and deleted keys are published on summary:invalidate
+# for in-process cache tiers. Scripts touch derived keys, so they require a
+# non-cluster Redis.
+_LUA_REFS = """
+local prefix = ARGV[1]
+local now = tonumber(ARGV[2])
+
+local function sync_blob(digest)
+    local blob_key = prefix .. "blob:" .. digest
+    local refs_key = prefix .. "refs:" .. digest
+    local refs = redis.call("HGETALL", refs_key)
+    local live = 0
+    local max_exp = -1
+    for i = 1, #refs, 2 do
+        local exp = tonumber(refs[i + 1])
+        if exp > 0 and exp <= now then
+            redis.call("HDEL", refs_key, refs[i])
+        else
+            live = live + 1
+            if exp == 0 then
+                max_exp = 0
+            elseif max_exp ~= 0 and exp > max_exp then
+                max_exp = exp
+            end
+        end
+    end
+    if live == 0 then
+        redis.call("DEL", blob_key, refs_key)
+    elseif max_exp == 0 then
+        redis.call("PERSIST", blob_key)
+        redis.call("PERSIST", refs_key)
+    else
+        redis.call("EXPIREAT", blob_key, max_exp)
+        redis.call("EXPIREAT", refs_key, max_exp)
+    end
+end
+
+local function release(alias_key)
+    local value = redis.call("GET", alias_key)
+    if value and string.sub(value, 1, 4) == "ref:" then
+        local digest = string.sub(value, 5)
+        redis.call("HDEL", prefix .. "refs:" .. digest, alias_key)
+        sync_blob(digest)
+    end
+    redis.call("DEL", alias_key)
+end
+
+local function resolve(alias_key)
+    local value = redis.call("GET", alias_key)
+    if value and string.sub(value, 1, 4) == "ref:" then
+        return redis.call("GET", prefix .. "blob:" .. string.sub(value, 5))
+    end
+    return value
+end
+
+local function trim(zset_key, previews_key, limit)
+    local evicted = {}
+    local count = redis.call("ZCARD", zset_key)
+    if count > limit then
+        evicted = redis.call("ZRANGE", zset_key, 0, count - limit - 1)
+        for _, member in ipairs(evicted) do
+            redis.call("ZREM", zset_key, member)
+            redis.call("HDEL", previews_key, member)
+            release(prefix .. member)
+        end
+        redis.call("PUBLISH", prefix .. "invalidate", table.concat(evicted, ","))
+    end
+    return evicted
+end
+"""
+
+# KEYS: alias keys; ARGV: prefix, now
+_GET_LUA = _LUA_REFS + """
+local values = {}
+for i, key in ipairs(KEYS) do
+    values[i] = resolve(key) or false
+end
+return values
+"""
+
+# Store entry, optionally index it in history and trim, all in one call.
+# KEYS: alias key, recent zset, previews hash
+# ARGV: prefix, now, data, digest, ttl (0 = none), add_to_history (1/0), member, score, preview, limit
+_SET_LUA = _LUA_REFS + """
+local digest = ARGV[4]
+local ttl = tonumber(ARGV[5])
+local blob_key = prefix .. "blob:" .. digest
+local previous = redis.call("GET", KEYS[1])
+release(KEYS[1])
+if redis.call("EXISTS", blob_key) == 0 then
+    redis.call("SET", blob_key, ARGV[3])
+end
+local expiry = 0
+if ttl > 0 then
+    expiry = now + ttl
+    redis.call("SET", KEYS[1], "ref:" .. digest, "EX", ttl)
+else
+    redis.call("SET", KEYS[1], "ref:" .. digest)
+end
+redis.call("HSET", prefix .. "refs:" .. digest, KEYS[1], expiry)
+sync_blob(digest)
+if previous and previous ~= "ref:" .. digest then
+    redis.call("PUBLISH", prefix .. "invalidate", ARGV[7])
+end
+if ARGV[6] ~= "1" then
+    return {}
+end
+redis.call("ZADD", KEYS[2], ARGV[8], ARGV[7])
+redis.call("HSET", KEYS[3], ARGV[7], ARGV[9])
+return trim(KEYS[2], KEYS[3], tonumber(ARGV[10]))
+"""
+
+# KEYS: recent zset, previews hash; ARGV: prefix, now, limit
+_TRIM_LUA = _LUA_REFS + """
+return trim(KEYS[1], KEYS[2], tonumber(ARGV[3]))
+"""
+
+# KEYS: alias key, recent zset, previews hash; ARGV: prefix, now, member
+_DELETE_LUA = _LUA_REFS + """
+redis.call("ZREM", KEYS[2], ARGV[3])
+redis.call("HDEL", KEYS[3], ARGV[3])
+release(KEYS[1])
+redis.call("PUBLISH", prefix .. "invalidate", ARGV[3])
+return 1
+"""
+
+
+class TimedPipeline(Pipeline):
+    """Pipeline whose execution is recorded as one round trip."""
+    
+    async def execute(self, raise_on_error: bool = True):
+        with metrics.redis_call("PIPELINE"):
+            return await super().execute(raise_on_error)
+
+
+class TimedRedis(aioredis.Redis):
+    """Redis client recording round-trip time of every command.
+    
+    Scripts run as EVALSHA; the blocking reads of the job queue are not
+    recorded.
+    """
+    
+    async def execute_command(self, *args, **options):
+        with metrics.redis_call(str(args[0]).upper()):
+            return await super().execute_command(*args, **options)
+    
+    def pipeline(self, transaction: bool = True, shard_hint: Optional[str] = None) -> TimedPipeline:
+        return TimedPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
 
 
 class RedisCache:
     """Redis-based cache provider."""
     
-    def __init__(self, redis_url: str | None = None):
+    def __init__(self, redis_url: str | None = None, serializer: Serializer | None = None):
         self.redis_url = redis_url or settings.redis_url
         self.max_items = settings.cache_max_items
+        self.default_ttl = settings.cache_ttl
+        self.serializer = serializer or get_serializer(settings.cache_compression)
         self._client: Optional[aioredis.Redis] = None
+        # Summary blobs are binary, so they are read through a non-decoding client
+        self._raw_client: Optional[aioredis.Redis] = None
         self.recent_zset_key = "summary:recent"
+        self.previews_hash_key = "summary:previews"
+        self.key_prefix = "summary:"
+        self.invalidate_channel = "summary:invalidate"
     
     async def connect(self) -> None:
         """Establish Redis connection."""
         if self._client is None:
-            self._client = await aioredis.from_url(
+            self._client = await TimedRedis.from_url(
                 self.redis_url,
                 encoding="utf-8",
                 decode_responses=True
@@ -34,17 +199,33 @@ class RedisCache:
                 await self._client.close()
                 self._client = None
                 raise
+            self._raw_client = await TimedRedis.from_url(self.redis_url, decode_responses=False)
+            self._get_script = self._raw_client.register_script(_GET_LUA)
+            self._set_script = self._client.register_script(_SET_LUA)
+            self._trim_script = self._client.register_script(_TRIM_LUA)
+            self._delete_script = self._client.register_script(_DELETE_LUA)
     
     async def disconnect(self) -> None:
         """Close Redis connection."""
         if self._client:
             await self._client.close()
+            await self._raw_client.close()
             self._client = None
+            self._raw_client = None
             logger.info("Disconnected from Redis")
     
+    async def get_client(self) -> aioredis.Redis:
+        """Get connected Redis client (shared with other Redis-backed helpers)."""
+        await self.connect()
+        return self._client
+    
     def _make_key(self, key: str) -> str:
         """Make full Redis key."""
-        return f"summary:{key}"
+        return f"{self.key_prefix}{key}"
+    
+    def _script_args(self) -> list:
+        """Common leading arguments for cache scripts."""
+        return [self.key_prefix, int(time.time())]
     
     async def get(self, key: str) -> Optional[SummaryResult]:
         """Get cached summary by key.
@@ -58,50 +239,102 @@ class RedisCache:
         await self.connect()
         
         try:
-            data = await self._client.get(self._make_key(key))
+            data, = await self._get_script(keys=[self._make_key(key)], args=self._script_args())
             if data:
-                return SummaryResult(**json.loads(data))
+                return self.serializer.loads(data)
             return None
         except Exception as e:
             logger.error(f"Error getting from cache: {e}")
             return None
     
-    async def set(self, key: str, value: SummaryResult, add_to_history: bool = False) -> None:
+    async def get_many(self, keys: list[str]) -> list[Optional[SummaryResult]]:
+        """Get several cached summaries in one round trip.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            SummaryResult or None for each key, in the same order
+        """
+        if not keys:
+            return []
+        
+        await self.connect()
+        
+        try:
+            values = await self._get_script(
+                keys=[self._make_key(key) for key in keys],
+                args=self._script_args()
+            )
+        except Exception as e:
+            logger.error(f"Error getting many from cache: {e}")
+            return [None] * len(keys)
+        
+        results = []
+        for key, data in zip(keys, values):
+            try:
+                results.append(self.serializer.loads(data) if data else None)
+            except Exception as e:
+                logger.error(f"Error decoding cache entry {key}: {e}")
+                results.append(None)
+        return results
+    
+    async def set(
+        self,
+        key: str,
+        value: SummaryResult,
+        add_to_history: bool = False,
+        ttl: int | None = None
+    ) -> None:
         """Store summary in cache.
         
+        Store, history index and eviction run atomically in one Lua script.
+        Identical content written under several keys is stored once.
+        
         Args:
             key: Cache key
             value: SummaryResult to cache
             add_to_history: If True, add to recent history list
+            ttl: Expiry in seconds; defaults to CACHE_TTL for entries outside
+                history (history entries are bounded by CACHE_MAX_ITEMS)
         """
         await self.connect()
         
+        if ttl is None:
+            ttl = 0 if add_to_history else self.default_ttl
+        
         try:
-            # Store the summary
-            data = value.model_dump_json()
-            await self._client.set(self._make_key(key), data)
+            data = self.serializer.dumps(value)
+            digest = hashlib.sha256(data).hexdigest()[:32]
+            preview = SummaryPreview.from_result(value).model_dump_json() if add_to_history else ""
+            score = datetime.utcnow().timestamp()
             
-            # Only add to recent list if explicitly requested (for UUID keys only)
-            if add_to_history:
-                score = datetime.utcnow().timestamp()
-                await self._client.zadd(self.recent_zset_key, {key: score})
-                
-                # Trim to max items
-                await self.trim_to_limit(self.max_items)
+            evicted = await self._set_script(
+                keys=[self._make_key(key), self.recent_zset_key, self.previews_hash_key],
+                args=[
+                    *self._script_args(), data, digest, ttl,
+                    int(add_to_history), key, score, preview, self.max_items
+                ]
+            )
             
-            logger.info(f"Cached summary with key: {key} (history: {add_to_history})")
+            if evicted:
+                logger.info(f"Trimmed {len(evicted)} old cache entries")
+            logger.info(f"Cached summary with key: {key} (history: {add_to_history}, {len(data)} bytes)")
             
         except Exception as e:
             logger.error(f"Error setting cache: {e}")
     
-    async def list_recent(self, limit: int) -> list[SummaryResult]:
+    async def list_recent(self, limit: int) -> list[SummaryPreview]:
         """Get list of recent summaries.
         
+        Reads the ZSET and the preview hash only (two round trips); full
+        results are loaded just for entries that have no preview yet.
+        
         Args:
             limit: Maximum number of results
             
         Returns:
-            List of recent SummaryResults, newest first
+            List of recent summary previews, newest first
         """
         await self.connect()
         
@@ -112,14 +345,27 @@ class RedisCache:
             if not keys:
                 return []
             
-            # Get all summaries
-            summaries = []
-            for key in keys:
-                summary = await self.get(key)
-                if summary:
-                    summaries.append(summary)
+            raw_previews = await self._client.hmget(self.previews_hash_key, keys)
+            
+            previews: dict[str, SummaryPreview] = {}
+            missing = []
+            for key, data in zip(keys, raw_previews):
+                if data:
+                    previews[key] = SummaryPreview.model_validate_json(data)
+                else:
+                    missing.append(key)
+            
+            # Entries cached before previews existed: build and backfill
+            if missing:
+                backfill = {}
+                for key, summary in zip(missing, await self.get_many(missing)):
+                    if summary:
+                        previews[key] = SummaryPreview.from_result(summary)
+                        backfill[key] = previews[key].model_dump_json()
+                if backfill:
+                    await self._client.hset(self.previews_hash_key, mapping=backfill)
             
-            return summaries
+            return [previews[key] for key in keys if key in previews]
             
         except Exception as e:
             logger.error(f"Error listing recent: {e}")
@@ -134,22 +380,12 @@ class RedisCache:
         await self.connect()
         
         try:
-            # Get total count
-            count = await self._client.zcard(self.recent_zset_key)
-            
-            if count > limit:
-                # Get keys to remove (oldest ones)
-                to_remove = await self._client.zrange(self.recent_zset_key, 0, count - limit - 1)
-                
-                # Remove from ZSET
-                if to_remove:
-                    await self._client.zrem(self.recent_zset_key, *to_remove)
-                    
-                    # Remove actual summary data
-                    for key in to_remove:
-                        await self._client.delete(self._make_key(key))
-                    
-                    logger.info(f"Trimmed {len(to_remove)} old cache entries")
+            evicted = await self._trim_script(
+                keys=[self.recent_zset_key, self.previews_hash_key],
+                args=[*self._script_args(), limit]
+            )
+            if evicted:
+                logger.info(f"Trimmed {len(evicted)} old cache entries")
                     
         except Exception as e:
             logger.error(f"Error trimming cache: {e}")
@@ -163,11 +399,11 @@ class RedisCache:
         await self.connect()
         
         try:
-            # Remove from ZSET
-            await self._client.zrem(self.recent_zset_key, key)
-            
-            # Remove actual data
-            await self._client.delete(self._make_key(key))
+            # Remove from ZSET, previews and release the content blob
+            await self._delete_script(
+                keys=[self._make_key(key), self.recent_zset_key, self.previews_hash_key],
+                args=[*self._script_args(), key]
+            )
             
             logger.info(f"Deleted cache entry: {key}")
             
@@ -0,0 +1,101 @@
+"""Serialization of cached summaries."""
+import zlib
+from typing import Protocol
+from loguru import logger
+from ...core.entities import SummaryResult
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# Compressed entries start with magic + format version + codec id;
+# plain JSON entries (including all legacy ones) start with "{".
+_MAGIC = b"CZ"
+_VERSION = 1
+_CODEC_ZSTD = b"z"
+_CODEC_ZLIB = b"d"
+
+
+class Serializer(Protocol):
+    """Interface for cache serializers."""
+    
+    def dumps(self, value: SummaryResult) -> bytes:
+        """Serialize summary to bytes."""
+        ...
+    
+    def loads(self, data: bytes) -> SummaryResult:
+        """Deserialize summary from bytes."""
+        ...
+
+
+class JSONSerializer:
+    """Plain JSON, compatible with entries written before compression."""
+    
+    def dumps(self, value: SummaryResult) -> bytes:
+        return value.model_dump_json().encode()
+    
+    def loads(self, data: bytes) -> SummaryResult:
+        return decode(data)
+
+
+class CompressedSerializer:
+    """JSON compressed with zstd (or zlib if zstandard is not installed)."""
+    
+    def __init__(self, codec: str = "zstd", level: int = 3):
+        if codec == "zstd" and zstandard is None:
+            logger.warning("zstandard is not installed, falling back to zlib compression")
+            codec = "zlib"
+        self.codec = codec
+        self.level = level
+        self._header = _MAGIC + bytes([_VERSION]) + (_CODEC_ZSTD if codec == "zstd" else _CODEC_ZLIB)
+    
+    def dumps(self, value: SummaryResult) -> bytes:
+        raw = value.model_dump_json().encode()
+        if self.codec == "zstd":
+            body = zstandard.ZstdCompressor(level=self.level).compress(raw)
+        else:
+            body = zlib.compress(raw, self.level)
+        return self._header + body
+    
+    def loads(self, data: bytes) -> SummaryResult:
+        return decode(data)
+
+
+def decode(data: bytes | str) -> SummaryResult:
+    """Decode any supported entry format in a single validation pass.
+    
+    Args:
+        data: Stored entry (compressed with header, or plain JSON)
+    
+    Returns:
+        SummaryResult
+    
+    Raises:
+        ValueError: If the format or codec is not supported
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    
+    if data.startswith(_MAGIC):
+        version, codec, body = data[2], data[3:4], data[4:]
+        if version != _VERSION:
+            raise ValueError(f"Unsupported cache entry version: {version}")
+        if codec == _CODEC_ZSTD:
+            if zstandard is None:
+                raise ValueError("zstandard is required to read this cache entry")
+            data = zstandard.ZstdDecompressor().decompress(body)
+        elif codec == _CODEC_ZLIB:
+            data = zlib.decompress(body)
+        else:
+            raise ValueError(f"Unsupported cache entry codec: {codec!r}")
+    
+    return SummaryResult.model_validate_json(data)
+
+
+def get_serializer(compression: str) -> Serializer:
+    """Get serializer for compression setting ("zstd", "zlib" or "none")."""
+    if compression == "none":
+        return JSONSerializer()
+    return CompressedSerializer(codec=compression)
@@ -0,0 +1,177 @@
+"""MinHash LSH index of summarized texts for near-duplicate detection."""
+import asyncio
+import hashlib
+import re
+from functools import lru_cache
+from typing import Optional
+from loguru import logger
+from .redis_cache import RedisCache, redis_cache
+from ...config import settings
+
+
+_WORD = re.compile(r"\w+")
+_EMPTY = (1 << 64) - 1
+
+
+def _hash64(value: str) -> int:
+    """Stable 64-bit hash (built-in hash() differs between processes)."""
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+@lru_cache(maxsize=16)
+def minhash_signature(text: str, num_perm: int, shingle_words: int) -> tuple[int, ...]:
+    """Compute MinHash signature of text's word shingles.
+    
+    Uses one-permutation hashing: each shingle hash falls into one of
+    `num_perm` bins and every bin keeps its minimum. Empty bins borrow
+    the value of the next non-empty bin.
+    
+    Args:
+        text: Input text
+        num_perm: Signature length
+        shingle_words: Words per shingle
+    
+    Returns:
+        Signature (empty tuple for texts without words)
+    """
+    words = _WORD.findall(text.lower())
+    if not words:
+        return ()
+    
+    count = max(len(words) - shingle_words + 1, 1)
+    bins = [_EMPTY] * num_perm
+    for i in range(count):
+        h = _hash64(" ".join(words[i:i + shingle_words]))
+        index, value = h % num_perm, h // num_perm
+        if value < bins[index]:
+            bins[index] = value
+    
+    for i in range(num_perm):
+        if bins[i] == _EMPTY:
+            for offset in range(1, num_perm):
+                donor = bins[(i + offset) % num_perm]
+                if donor != _EMPTY:
+                    # Mix in the offset so borrowed bins of different texts rarely collide
+                    bins[i] = donor + offset
+                    break
+    return tuple(bins)
+
+
+class MinHashIndex:
+    """Near-duplicate index with LSH band buckets stored in Redis.
+    
+    A signature is split into `bands` bands; texts sharing any band bucket
+    become candidates, and the best candidate whose estimated Jaccard
+    similarity reaches `threshold` is returned.
+    """
+    
+    def __init__(
+        self,
+        cache: RedisCache,
+        threshold: float | None = None,
+        min_chars: int | None = None,
+        ttl: int | None = None,
+        bands: int = 16,
+        rows: int = 8,
+        shingle_words: int = 5
+    ):
+        self.cache = cache
+        self.threshold = threshold or settings.similarity_threshold
+        self.min_chars = min_chars or settings.similarity_min_chars
+        self.ttl = ttl or settings.similarity_ttl
+        self.bands = bands
+        self.rows = rows
+        self.shingle_words = shingle_words
+        self.key_prefix = "similar:"
+    
+    async def _signature(self, text: str) -> tuple[int, ...]:
+        """Compute signature off the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, minhash_signature, text, self.bands * self.rows, self.shingle_words
+        )
+    
+    def _bucket_keys(self, signature: tuple[int, ...], scope: str) -> list[str]:
+        """Get Redis keys of the band buckets for signature."""
+        keys = []
+        for band in range(self.bands):
+            rows = signature[band * self.rows:(band + 1) * self.rows]
+            digest = hashlib.sha1(",".join(map(str, rows)).encode()).hexdigest()[:16]
+            keys.append(f"{self.key_prefix}{scope}:{band}:{digest}")
+        return keys
+    
+    def _signature_key(self, key: str) -> str:
+        """Get Redis key of stored signature."""
+        return f"{self.key_prefix}sig:{key}"
+    
+    async def find(self, text: str, scope: str) -> Optional[tuple[str, float]]:
+        """Find most similar indexed text above the similarity threshold.
+        
+        Args:
+            text: Input text
+            scope: Only entries added with the same scope are considered
+        
+        Returns:
+            Tuple of (cache key, estimated similarity) or None if no match
+        """
+        if len(text) < self.min_chars:
+            return None
+        
+        try:
+            signature = await self._signature(text)
+            if not signature:
+                return None
+            
+            client = await self.cache.get_client()
+            pipe = client.pipeline(transaction=False)
+            for bucket_key in self._bucket_keys(signature, scope):
+                pipe.smembers(bucket_key)
+            candidates = sorted(set().union(*await pipe.execute()))
+            if not candidates:
+                return None
+            
+            stored = await client.mget([self._signature_key(key) for key in candidates])
+            best = None
+            for key, data in zip(candidates, stored):
+                if not data:
+                    continue
+                other = [int(value, 16) for value in data.split(",")]
+                if len(other) != len(signature):
+                    continue
+                similarity = sum(a == b for a, b in zip(signature, other)) / len(signature)
+                if similarity >= self.threshold and (best is None or similarity > best[1]):
+                    best = (key, similarity)
+            return best
+        except Exception as e:
+            logger.error(f"Error searching similarity index: {e}")
+            return None
+    
+    async def add(self, text: str, scope: str, key: str) -> None:
+        """Index text whose summary is cached under key.
+        
+        Args:
+            text: Input text
+            scope: Scope of the entry (e.g. detail level and locale)
+            key: Cache key of the summary
+        """
+        if len(text) < self.min_chars:
+            return
+        
+        try:
+            signature = await self._signature(text)
+            if not signature:
+                return
+            
+            client = await self.cache.get_client()
+            pipe = client.pipeline(transaction=False)
+            pipe.set(self._signature_key(key), ",".join(f"{value:x}" for value in signature), ex=self.ttl)
+            for bucket_key in self._bucket_keys(signature, scope):
+                pipe.sadd(bucket_key, key)
+                pipe.expire(bucket_key, self.ttl)
+            await pipe.execute()
+        except Exception as e:
+            logger.error(f"Error updating similarity index: {e}")
+
+
+# Global similarity index instance
+similarity_index = MinHashIndex(redis_cache)
@@ -0,0 +1,222 @@
+"""Single-flight request coalescing (in-process + Redis)."""
+import asyncio
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from loguru import logger
+from .redis_cache import RedisCache, redis_cache
+from ...config import settings
+
+
+# Delete lock only if it is still owned by us
+_RELEASE_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+# Extend lock only if it is still owned by us
+_EXTEND_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("PEXPIRE", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# Lock lifetime without renewal; the leader renews it while it works, so
+# a crashed leader is noticed after this long
+LOCK_TTL = 30.0
+
+# Completion messages
+_SUCCEEDED = "1"
+_FAILED = "0"
+
+
+class _Flight:
+    """In-process state of a key being worked on."""
+    
+    def __init__(self):
+        self.done = asyncio.Event()
+        self.succeeded = False
+
+
+class SingleFlight:
+    """Coalesces identical in-flight summarizations.
+    
+    Within a worker, callers share one in-process flight per key. Across
+    workers, the leader holds a Redis lock, renews it while it works and
+    publishes on a completion channel when it is done; waiters subscribe
+    to it and also poll the lock, so a crashed leader only delays them
+    until the lock expires.
+    
+    Waiters are released as waiters only after a successful leader. If the
+    leader fails or disappears, one waiter takes over as the new leader
+    while the others keep waiting, so a failure never lets all of them
+    compute at once.
+    """
+    
+    def __init__(self, cache: RedisCache, timeout: int | None = None, lock_ttl: float = LOCK_TTL):
+        self.cache = cache
+        self.timeout = timeout or settings.single_flight_timeout
+        self.lock_ttl = lock_ttl
+        self._local: dict[str, _Flight] = {}
+    
+    def _lock_key(self, key: str) -> str:
+        """Make Redis lock key."""
+        return f"summary:lock:{key}"
+    
+    def _channel(self, key: str) -> str:
+        """Make Redis completion channel name."""
+        return f"summary:done:{key}"
+    
+    @asynccontextmanager
+    async def flight(self, key: str) -> AsyncIterator[bool]:
+        """Enter single-flight section for key.
+        
+        Args:
+            key: Deduplication key (summary cache key)
+        
+        Yields:
+            True if caller is the leader, False if another caller finished
+            the work successfully while it waited
+        
+        Raises:
+            TimeoutError: If the work is still in progress elsewhere after
+                the single-flight timeout
+        """
+        deadline = time.monotonic() + self.timeout
+        
+        flight = self._local.get(key)
+        while flight is not None:
+            # Another request in this worker is already working on it
+            logger.info(f"Waiting for in-flight request: {key}")
+            await self._wait_local(key, flight, deadline)
+            if flight.succeeded:
+                yield False
+                return
+            # Leader failed: the first waiter to get here takes over
+            flight = self._local.get(key)
+        
+        flight = _Flight()
+        self._local[key] = flight
+        try:
+            while True:
+                token = await self._acquire(key)
+                if token is not None:
+                    break
+                if await self._wait_remote(key, deadline):
+                    flight.succeeded = True
+                    yield False
+                    return
+                logger.info(f"In-flight request in another worker did not finish, taking over: {key}")
+            
+            renewal = asyncio.create_task(self._renew(key, token))
+            try:
+                yield True
+                flight.succeeded = True
+            finally:
+                renewal.cancel()
+                await self._release(key, token, flight.succeeded)
+        finally:
+            flight.done.set()
+            if self._local.get(key) is flight:
+                del self._local[key]
+    
+    async def _wait_local(self, key: str, flight: _Flight, deadline: float) -> None:
+        """Wait until the flight of another request in this worker ends."""
+        try:
+            await asyncio.wait_for(flight.done.wait(), timeout=max(deadline - time.monotonic(), 0))
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Timed out waiting for in-flight request: {key}") from None
+    
+    async def _acquire(self, key: str) -> str | None:
+        """Try to take the cross-worker lock.
+        
+        Returns:
+            Lock token if acquired (or Redis unavailable), None if held elsewhere
+        """
+        token = uuid.uuid4().hex
+        try:
+            client = await self.cache.get_client()
+            acquired = await client.set(self._lock_key(key), token, nx=True, px=int(self.lock_ttl * 1000))
+            return token if acquired else None
+        except Exception as e:
+            # Degrade to in-process coalescing only
+            logger.error(f"Error acquiring single-flight lock: {e}")
+            return token
+    
+    async def _renew(self, key: str, token: str) -> None:
+        """Keep extending the lock while the leader works."""
+        while True:
+            await asyncio.sleep(self.lock_ttl / 3)
+            try:
+                client = await self.cache.get_client()
+                extended = await client.eval(
+                    _EXTEND_SCRIPT, 1, self._lock_key(key), token, int(self.lock_ttl * 1000)
+                )
+                if not extended:
+                    logger.warning(f"Lost single-flight lock: {key}")
+                    return
+            except Exception as e:
+                logger.error(f"Error renewing single-flight lock: {e}")
+    
+    async def _release(self, key: str, token: str, succeeded: bool) -> None:
+        """Release the lock and notify waiters in other workers."""
+        try:
+            client = await self.cache.get_client()
+            await client.eval(_RELEASE_SCRIPT, 1, self._lock_key(key), token)
+            await client.publish(self._channel(key), _SUCCEEDED if succeeded else _FAILED)
+        except Exception as e:
+            logger.error(f"Error releasing single-flight lock: {e}")
+    
+    async def _wait_remote(self, key: str, deadline: float) -> bool:
+        """Wait until the leader in another worker finishes.
+        
+        Returns:
+            True if the leader succeeded, False if it failed or its lock is
+            gone without a result (the caller should try to lead)
+        
+        Raises:
+            TimeoutError: If the leader is still working at the deadline
+        """
+        logger.info(f"Waiting for in-flight request in another worker: {key}")
+        
+        try:
+            client = await self.cache.get_client()
+            pubsub = client.pubsub()
+            await pubsub.subscribe(self._channel(key))
+        except Exception as e:
+            logger.error(f"Error waiting for single-flight completion: {e}")
+            # Poll instead of spinning on the lock
+            await asyncio.sleep(1.0)
+            return False
+        
+        # Poll the lock often enough to notice a crashed leader soon after it expires
+        poll_interval = min(1.0, self.lock_ttl / 3)
+        try:
+            # Checked after subscribing so a completion cannot slip in between
+            while await client.exists(self._lock_key(key)):
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Timed out waiting for in-flight request: {key}")
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=poll_interval)
+                if message is not None:
+                    data = message["data"]
+                    return (data.decode() if isinstance(data, bytes) else data) == _SUCCEEDED
+            return False
+        except TimeoutError:
+            raise
+        except Exception as e:
+            logger.error(f"Error waiting for single-flight completion: {e}")
+            return False
+        finally:
+            try:
+                await pubsub.unsubscribe(self._channel(key))
+                await pubsub.close()
+            except Exception as e:
+                logger.error(f"Error closing single-flight subscription: {e}")
+
+
+# Global single-flight instance
+single_flight = SingleFlight(redis_cache)
@@ -0,0 +1,139 @@
+"""Redis cache of extracted source text (article text, video transcripts)."""
+import hashlib
+import json
+import time
+from typing import Optional
+from loguru import logger
+from .redis_cache import RedisCache, redis_cache
+from ..metrics import metrics
+from ...config import settings
+
+
+# Store entry and evict the oldest ones until the total size fits the budget.
+# Entries are indexed by store time in a zset; sizes are kept in a hash.
+# KEYS: entry key, index zset, sizes hash, total bytes key
+# ARGV: data, now, ttl, budget
+_SET_LUA = """
+local key, index_key, sizes_key, total_key = KEYS[1], KEYS[2], KEYS[3], KEYS[4]
+local now = tonumber(ARGV[2])
+local ttl = tonumber(ARGV[3])
+local budget = tonumber(ARGV[4])
+
+local function drop(member)
+    local size = tonumber(redis.call("HGET", sizes_key, member) or "0")
+    redis.call("HDEL", sizes_key, member)
+    redis.call("ZREM", index_key, member)
+    redis.call("DEL", member)
+    return size
+end
+
+local total = tonumber(redis.call("GET", total_key) or "0")
+-- Entries stored more than ttl ago have already expired
+for _, member in ipairs(redis.call("ZRANGEBYSCORE", index_key, "-inf", now - ttl)) do
+    total = total - drop(member)
+end
+total = total - drop(key)
+
+local size = string.len(ARGV[1])
+redis.call("SET", key, ARGV[1], "EX", ttl)
+redis.call("ZADD", index_key, now, key)
+redis.call("HSET", sizes_key, key, size)
+total = total + size
+
+local evicted = 0
+while total > budget do
+    local oldest = redis.call("ZRANGE", index_key, 0, 0)
+    if #oldest == 0 or oldest[1] == key then
+        break
+    end
+    total = total - drop(oldest[1])
+    evicted = evicted + 1
+end
+redis.call("SET", total_key, math.max(total, 0))
+return evicted
+"""
+
+
+class SourceCache:
+    """Stores extracted source text keyed only on the normalized source.
+    
+    Summaries of the same source at another detail level or with another
+    model reuse the text instead of fetching or transcribing it again.
+    Entries expire after `ttl`; the oldest ones are evicted once the
+    total size exceeds `max_bytes`.
+    """
+    
+    def __init__(
+        self,
+        cache: RedisCache,
+        ttl: int | None = None,
+        max_bytes: int | None = None,
+        entry_max_bytes: int | None = None
+    ):
+        self.cache = cache
+        self.ttl = ttl or settings.source_cache_ttl
+        self.max_bytes = max_bytes or settings.source_cache_max_bytes
+        self.entry_max_bytes = entry_max_bytes or settings.source_cache_entry_max_bytes
+        self.key_prefix = "source:"
+        self.index_key = "source:index"
+        self.sizes_key = "source:sizes"
+        self.total_key = "source:bytes"
+        self._set_script = None
+    
+    def _make_key(self, kind: str, source: str) -> str:
+        """Make full Redis key."""
+        return f"{self.key_prefix}{kind}:{hashlib.sha256(source.encode()).hexdigest()[:16]}"
+    
+    async def get(self, kind: str, source: str) -> Optional[tuple[str, dict]]:
+        """Get cached source text.
+        
+        Args:
+            kind: Source kind ("url" or "youtube")
+            source: Normalized source (URL or video ID)
+        
+        Returns:
+            Tuple of (text, metadata dict), or None if not cached
+        """
+        try:
+            client = await self.cache.get_client()
+            data = await client.get(self._make_key(kind, source))
+            metrics.cache_result(f"source_{kind}", "hit" if data else "miss")
+            if not data:
+                return None
+            entry = json.loads(data)
+            return entry["text"], entry["metadata"]
+        except Exception as e:
+            logger.error(f"Error getting source text from cache: {e}")
+            return None
+    
+    async def set(self, kind: str, source: str, text: str, metadata: dict) -> None:
+        """Store source text (skipped for entries above entry_max_bytes).
+        
+        Args:
+            kind: Source kind ("url" or "youtube")
+            source: Normalized source (URL or video ID)
+            text: Extracted text
+            metadata: Metadata dict returned with the text
+        """
+        # Stored as UTF-8; the budget counts bytes, as the set script does
+        data = json.dumps({"text": text, "metadata": metadata}, ensure_ascii=False)
+        if len(data.encode()) > self.entry_max_bytes:
+            logger.debug(f"Source text too large to cache: {kind}:{source}")
+            return
+        
+        try:
+            client = await self.cache.get_client()
+            if self._set_script is None:
+                self._set_script = client.register_script(_SET_LUA)
+            evicted = await self._set_script(
+                keys=[self._make_key(kind, source), self.index_key, self.sizes_key, self.total_key],
+                args=[data, round(time.time(), 3), self.ttl, self.max_bytes]
+            )
+            if evicted:
+                logger.debug(f"Evicted {evicted} source text entries to stay within budget")
+        except Exception as e:
+            logger.error(f"Error caching source text: {e}")
+
+
+# Global source text cache instance
+source_cache = SourceCache(redis_cache)
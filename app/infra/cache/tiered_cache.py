@@ -0,0 +1,193 @@
+"""Two-tier cache: in-process LRU in front of Redis."""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Optional
+from loguru import logger
+from .redis_cache import RedisCache, redis_cache
+from ..metrics import metrics
+from ...core.entities import SummaryResult, SummaryPreview
+from ...config import settings
+
+
+class TieredCache:
+    """Cache provider with a byte-bounded in-process LRU/TTL tier over Redis.
+    
+    Keys evicted, overwritten or deleted in Redis (by any worker) are
+    announced on a pub/sub channel and dropped from every worker's local
+    tier. Entries written with a Redis TTL shorter than the local one expire
+    locally with it. Callers get copies, so mutating a result does not
+    change the cache.
+    """
+    
+    def __init__(self, backend: RedisCache, max_bytes: int | None = None, ttl: int | None = None):
+        self.backend = backend
+        self.max_bytes = max_bytes or settings.l1_cache_max_bytes
+        self.ttl = ttl or settings.l1_cache_ttl
+        self._entries: OrderedDict[str, tuple[SummaryResult, int, float]] = OrderedDict()
+        self._size = 0
+        self._listener: Optional[asyncio.Task] = None
+    
+    async def start(self) -> None:
+        """Start listening for invalidations from other workers."""
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+    
+    async def close(self) -> None:
+        """Stop invalidation listener and drop local entries."""
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self._clear()
+    
+    async def _listen(self) -> None:
+        """Drop local entries announced on the invalidation channel."""
+        while True:
+            try:
+                client = await self.backend.get_client()
+                pubsub = client.pubsub()
+                await pubsub.subscribe(self.backend.invalidate_channel)
+                try:
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            for key in message["data"].split(","):
+                                self._discard(key)
+                finally:
+                    await pubsub.close()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Invalidations may have been missed, start over with an empty tier
+                logger.error(f"Cache invalidation listener error: {e}")
+                self._clear()
+                await asyncio.sleep(1)
+    
+    def _lookup(self, key: str) -> Optional[SummaryResult]:
+        """Get live local entry and mark it as recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, _, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._discard(key)
+            return None
+        self._entries.move_to_end(key)
+        return value.model_copy(deep=True)
+    
+    def _store(self, key: str, value: SummaryResult, ttl: int | None = None) -> None:
+        """Put copy of entry in local tier, evicting least recently used ones."""
+        size = len(value.model_dump_json())
+        if size > self.max_bytes:
+            return
+        self._discard(key)
+        ttl = min(self.ttl, ttl) if ttl else self.ttl
+        self._entries[key] = (value.model_copy(deep=True), size, time.monotonic() + ttl)
+        self._size += size
+        while self._size > self.max_bytes:
+            _, (_, evicted_size, _) = self._entries.popitem(last=False)
+            self._size -= evicted_size
+    
+    def _discard(self, key: str) -> None:
+        """Remove entry from local tier."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[1]
+    
+    def _clear(self) -> None:
+        """Remove all local entries."""
+        self._entries.clear()
+        self._size = 0
+    
+    async def get(self, key: str) -> Optional[SummaryResult]:
+        """Get cached summary by key (local tier first).
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Cached SummaryResult or None if not found
+        """
+        value = self._lookup(key)
+        if value is not None:
+            metrics.cache_result("summary_local", "hit")
+            return value
+        metrics.cache_result("summary_local", "miss")
+        
+        value = await self.backend.get(key)
+        if value is not None:
+            self._store(key, value)
+        return value
+    
+    async def get_many(self, keys: list[str]) -> list[Optional[SummaryResult]]:
+        """Get several cached summaries, fetching local misses in one call.
+        
+        Args:
+            keys: Cache keys
+        
+        Returns:
+            SummaryResult or None for each key, in the same order
+        """
+        results = [self._lookup(key) for key in keys]
+        missing = [key for key, value in zip(keys, results) if value is None]
+        if not missing:
+            return results
+        
+        fetched = dict(zip(missing, await self.backend.get_many(missing)))
+        for key, value in fetched.items():
+            if value is not None:
+                self._store(key, value)
+        return [value if value is not None else fetched.get(key) for key, value in zip(keys, results)]
+    
+    async def set(
+        self,
+        key: str,
+        value: SummaryResult,
+        add_to_history: bool = False,
+        ttl: int | None = None
+    ) -> None:
+        """Store summary in Redis and in the local tier.
+        
+        Args:
+            key: Cache key
+            value: SummaryResult to cache
+            add_to_history: If True, add to recent history list
+            ttl: Optional expiry in seconds for the Redis entry
+        """
+        await self.backend.set(key, value, add_to_history=add_to_history, ttl=ttl)
+        self._store(key, value, ttl)
+    
+    async def list_recent(self, limit: int) -> list[SummaryPreview]:
+        """Get list of recent summaries (served by Redis).
+        
+        Args:
+            limit: Maximum number of results
+        
+        Returns:
+            List of recent summary previews, newest first
+        """
+        return await self.backend.list_recent(limit)
+    
+    async def trim_to_limit(self, limit: int) -> None:
+        """Remove old entries beyond limit (evictions are broadcast by Redis).
+        
+        Args:
+            limit: Maximum number of entries to keep
+        """
+        await self.backend.trim_to_limit(limit)
+    
+    async def delete(self, key: str) -> None:
+        """Delete summary from both tiers.
+        
+        Args:
+            key: Cache key
+        """
+        self._discard(key)
+        await self.backend.delete(key)
+
+
+# Global two-tier summary cache instance
+summary_cache = TieredCache(redis_cache)
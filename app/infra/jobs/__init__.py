@@ -0,0 +1,11 @@
+"""Background job infrastructure."""
+from .queue import JobQueue, job_queue
+from .stages import StageLimiter, StageLimitedLLMClient, stage_limiter
+
+__all__ = [
+    "JobQueue",
+    "job_queue",
+    "StageLimiter",
+    "StageLimitedLLMClient",
+    "stage_limiter",
+]
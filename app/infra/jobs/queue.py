@@ -0,0 +1,180 @@
+"""Redis stream job queue for background summarization."""
+import uuid
+from datetime import datetime
+from typing import Optional
+from redis.exceptions import ResponseError
+from loguru import logger
+from ..cache import redis_cache, RedisCache
+from ...core.entities import Job, JobStatus, SummaryOptions
+from ...config import settings
+
+
+class JobQueue:
+    """Queue of summarization jobs on a Redis stream with a consumer group.
+    
+    Job records live under job:{id} (JSON, expiring after `ttl`); stream
+    messages carry the job id and input. A message stays pending until
+    the worker acknowledges it; messages left idle longer than
+    `claim_idle` (worker died) are claimed by another worker.
+    """
+    
+    def __init__(
+        self,
+        cache: RedisCache,
+        ttl: int | None = None,
+        claim_idle: int | None = None,
+        max_attempts: int | None = None,
+        max_length: int | None = None
+    ):
+        self.cache = cache
+        self.ttl = ttl or settings.job_ttl
+        self.claim_idle = claim_idle or settings.job_claim_idle
+        self.max_attempts = max_attempts or settings.job_max_attempts
+        self.max_length = max_length or settings.job_queue_max_length
+        self.stream_key = "jobs:stream"
+        self.group = "summarizers"
+        self.key_prefix = "job:"
+        self._group_ready = False
+    
+    def _make_key(self, job_id: str) -> str:
+        """Make full Redis key."""
+        return f"{self.key_prefix}{job_id}"
+    
+    async def _ensure_group(self) -> None:
+        """Create stream and consumer group if missing."""
+        if self._group_ready:
+            return
+        client = await self.cache.get_client()
+        try:
+            await client.xgroup_create(self.stream_key, self.group, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_ready = True
+    
+    async def enqueue(self, input_data: str, options: SummaryOptions) -> Job:
+        """Add summarization job to the queue.
+        
+        Args:
+            input_data: Input text/URL/video_id depending on mode
+            options: Summarization options
+        
+        Returns:
+            Queued job
+        
+        Raises:
+            RuntimeError: If the queue is full
+        """
+        await self._ensure_group()
+        client = await self.cache.get_client()
+        
+        if await client.xlen(self.stream_key) >= self.max_length:
+            raise RuntimeError("Job queue is full, please try again later")
+        
+        job = Job(id=str(uuid.uuid4()), options=options)
+        pipe = client.pipeline(transaction=True)
+        pipe.set(self._make_key(job.id), job.model_dump_json(), ex=self.ttl)
+        pipe.xadd(self.stream_key, {"job_id": job.id, "input_data": input_data})
+        await pipe.execute()
+        
+        logger.info(f"Enqueued {options.mode} job: {job.id}")
+        return job
+    
+    async def get(self, job_id: str) -> Optional[Job]:
+        """Get job by id.
+        
+        Args:
+            job_id: Job id
+        
+        Returns:
+            Job or None if unknown or expired
+        """
+        try:
+            client = await self.cache.get_client()
+            data = await client.get(self._make_key(job_id))
+            return Job.model_validate_json(data) if data else None
+        except Exception as e:
+            logger.error(f"Error getting job: {e}")
+            return None
+    
+    async def update(self, job: Job, **changes) -> Job:
+        """Store updated job record.
+        
+        Args:
+            job: Job to update
+            **changes: Fields to change
+        
+        Returns:
+            Updated job
+        """
+        job = job.model_copy(update={**changes, "updated_at": datetime.utcnow()})
+        client = await self.cache.get_client()
+        await client.set(self._make_key(job.id), job.model_dump_json(), ex=self.ttl)
+        return job
+    
+    async def claim(self, consumer: str, count: int, block_ms: int = 5000) -> list[tuple[str, str, str]]:
+        """Take jobs for a worker: abandoned ones first, then new ones.
+        
+        Args:
+            consumer: Unique worker name
+            count: Maximum number of jobs
+            block_ms: How long to wait for new jobs
+        
+        Returns:
+            List of (message id, job id, input data)
+        """
+        await self._ensure_group()
+        client = await self.cache.get_client()
+        
+        _, messages, *_ = await client.xautoclaim(
+            self.stream_key, self.group, consumer,
+            min_idle_time=int(self.claim_idle * 1000), start_id="0-0", count=count
+        )
+        if messages:
+            logger.warning(f"Claimed {len(messages)} abandoned job(s)")
+        else:
+            response = await client.xreadgroup(
+                self.group, consumer, {self.stream_key: ">"}, count=count, block=block_ms
+            )
+            messages = response[0][1] if response else []
+        
+        return [
+            (message_id, fields["job_id"], fields["input_data"])
+            for message_id, fields in messages
+            if fields
+        ]
+    
+    async def touch(self, consumer: str, message_id: str) -> None:
+        """Reset idle time of a job in progress so it is not claimed by others."""
+        client = await self.cache.get_client()
+        await client.xclaim(
+            self.stream_key, self.group, consumer,
+            min_idle_time=0, message_ids=[message_id], justid=True
+        )
+    
+    async def ack(self, message_id: str) -> None:
+        """Remove finished job message from the stream."""
+        client = await self.cache.get_client()
+        pipe = client.pipeline(transaction=True)
+        pipe.xack(self.stream_key, self.group, message_id)
+        pipe.xdel(self.stream_key, message_id)
+        await pipe.execute()
+    
+    async def start(self, job: Job) -> Optional[Job]:
+        """Mark job as running.
+        
+        Args:
+            job: Claimed job
+        
+        Returns:
+            Running job, or None if it ran out of attempts (it is marked failed)
+        """
+        attempts = job.attempts + 1
+        if attempts > self.max_attempts:
+            await self.update(job, status=JobStatus.FAILED, error="Job failed repeatedly, giving up")
+            return None
+        return await self.update(job, status=JobStatus.RUNNING, attempts=attempts, error=None)
+
+
+# Global job queue instance
+job_queue = JobQueue(redis_cache)
@@ -0,0 +1,57 @@
+"""Per-stage concurrency limits (fetch, transcribe, LLM)."""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from ...config import settings
+
+
+class StageLimiter:
+    """Limits how many operations of each pipeline stage run at once.
+    
+    Limits apply per process, so each worker process gets its own share.
+    A limit of 0 means unlimited.
+    """
+    
+    def __init__(self, limits: dict[str, int] | None = None):
+        self.limits = limits if limits is not None else {
+            "fetch": settings.stage_fetch_concurrency,
+            "transcribe": settings.stage_transcribe_concurrency,
+            "llm": settings.stage_llm_concurrency,
+        }
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+    
+    @asynccontextmanager
+    async def limit(self, stage: str) -> AsyncIterator[None]:
+        """Hold a slot of the stage while inside the block."""
+        limit = self.limits.get(stage, 0)
+        if limit <= 0:
+            yield
+            return
+        
+        semaphore = self._semaphores.get(stage)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(limit)
+            self._semaphores[stage] = semaphore
+        async with semaphore:
+            yield
+
+
+class StageLimitedLLMClient:
+    """LLMClient wrapper that runs every call in the "llm" stage."""
+    
+    def __init__(self, client, limiter: StageLimiter):
+        self.client = client
+        self.limiter = limiter
+    
+    async def summarize(self, text: str, options, prompt_template) -> str:
+        async with self.limiter.limit("llm"):
+            return await self.client.summarize(text, options, prompt_template)
+    
+    async def summarize_stream(self, text: str, options, prompt_template) -> AsyncIterator[str]:
+        async with self.limiter.limit("llm"):
+            async for delta in self.client.summarize_stream(text, options, prompt_template):
+                yield delta
+
+
+# Global stage limiter instance
+stage_limiter = StageLimiter()
@@ -1,9 +1,21 @@
 """LLM infrastructure."""
 from .openai_client import OpenAIClient
-from .factory import llm_factory, LLMFactory
+from .anthropic_client import AnthropicClient
+from .factory import llm_factory, LLMFactory, ROUTED_MODEL
+from .router import LLMRouter
+from .usage import UsageRecorder, llm_usage
+from .resilience import ResilientLLMClient, RedisRateLimiter, CircuitBreaker
 
 __all__ = [
     "OpenAIClient",
+    "AnthropicClient",
     "llm_factory",
     "LLMFactory",
+    "ROUTED_MODEL",
+    "LLMRouter",
+    "UsageRecorder",
+    "llm_usage",
+    "ResilientLLMClient",
+    "RedisRateLimiter",
+    "CircuitBreaker",
 ]
@@ -0,0 +1,182 @@
+"""Anthropic LLM client implementation (Messages API over httpx)."""
+import json
+from typing import AsyncIterator
+import httpx
+from loguru import logger
+from .openai_client import SYSTEM_PROMPT
+from .usage import llm_usage, usage_field
+from ...core.entities import SummaryOptions, PromptTemplate
+from ...config import settings
+
+
+ANTHROPIC_VERSION = "2023-06-01"
+
+# Shortest prompt prefix Anthropic caches, in tokens (Haiku models need more);
+# below it a cache breakpoint is ignored
+_MIN_CACHE_TOKENS = 1024
+_MIN_CACHE_TOKENS_HAIKU = 2048
+
+
+class AnthropicClient:
+    """Anthropic LLM client."""
+    
+    def __init__(
+        self,
+        api_key: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        base_url: str | None = None
+    ):
+        self.api_key = api_key or settings.anthropic_api_key
+        self.base_url = (base_url or settings.anthropic_base_url).rstrip("/")
+        self.client = http_client or httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.llm_read_timeout, connect=settings.llm_connect_timeout)
+        )
+    
+    async def close(self) -> None:
+        """Close underlying HTTP connection pool."""
+        await self.client.aclose()
+    
+    def _headers(self) -> dict:
+        """Build request headers."""
+        return {
+            "x-api-key": self.api_key,
+            "anthropic-version": ANTHROPIC_VERSION,
+            "content-type": "application/json"
+        }
+    
+    def _build_request(self, text: str, options: SummaryOptions, prompt_template: PromptTemplate) -> dict:
+        """Build Messages API request body.
+        
+        Static instructions go into the system prompt and the content last.
+        The system prompt is marked as a cache breakpoint when it is long
+        enough to be cached.
+        
+        Args:
+            text: Text to summarize
+            options: Summarization options
+            prompt_template: Prompt with static instructions and content part
+        
+        Returns:
+            JSON body for /v1/messages
+        """
+        # Extract model name from options.model (format: "anthropic:claude-3-5-haiku-latest")
+        model_parts = options.model.split(":", 1)
+        model_name = model_parts[1] if len(model_parts) > 1 else "claude-3-5-haiku-latest"
+        
+        system = {"type": "text", "text": f"{SYSTEM_PROMPT}\n\n{prompt_template.instructions}"}
+        min_cache_tokens = _MIN_CACHE_TOKENS_HAIKU if "haiku" in model_name else _MIN_CACHE_TOKENS
+        if len(system["text"]) // 4 >= min_cache_tokens:
+            system["cache_control"] = {"type": "ephemeral"}
+        
+        return {
+            "model": model_name,
+            "system": [system],
+            "messages": [
+                {"role": "user", "content": prompt_template.render(text)}
+            ],
+            "temperature": 0.7,
+            "max_tokens": 2000 if options.detail == "long" else 1000
+        }
+    
+    def estimate_tokens(self, text: str, options: SummaryOptions, prompt_template: PromptTemplate) -> int:
+        """Estimate tokens a request may consume (prompt plus completion limit).
+        
+        Args:
+            text: Text to summarize
+            options: Summarization options
+            prompt_template: Prompt with static instructions and content part
+        
+        Returns:
+            Approximate token count
+        """
+        request = self._build_request(text, options, prompt_template)
+        prompt_chars = len(request["system"][0]["text"]) + sum(len(message["content"]) for message in request["messages"])
+        return prompt_chars // 4 + request["max_tokens"]
+    
+    async def summarize(self, text: str, options: SummaryOptions, prompt_template: PromptTemplate) -> str:
+        """Generate summary using Anthropic.
+        
+        Args:
+            text: Text to summarize
+            options: Summarization options
+            prompt_template: Prompt with static instructions and content part
+        
+        Returns:
+            Generated summary text
+        """
+        request = self._build_request(text, options, prompt_template)
+        
+        try:
+            logger.info(f"Calling Anthropic API with model: {request['model']}")
+            
+            response = await self.client.post(f"{self.base_url}/v1/messages", headers=self._headers(), json=request)
+            response.raise_for_status()
+            data = response.json()
+            
+            summary = "".join(block.get("text", "") for block in data["content"] if block.get("type") == "text")
+            self._record_usage(options.model, data.get("usage", {}))
+            
+            return summary
+        
+        except Exception as e:
+            logger.error(f"Anthropic API error: {e}")
+            raise RuntimeError(f"Failed to generate summary with Anthropic: {str(e)}") from e
+    
+    async def summarize_stream(self, text: str, options: SummaryOptions, prompt_template: PromptTemplate) -> AsyncIterator[str]:
+        """Generate summary using Anthropic, yielding text as it arrives.
+        
+        Args:
+            text: Text to summarize
+            options: Summarization options
+            prompt_template: Prompt with static instructions and content part
+        
+        Yields:
+            Fragments of generated summary text
+        """
+        request = self._build_request(text, options, prompt_template)
+        
+        try:
+            logger.info(f"Streaming Anthropic API call with model: {request['model']}")
+            
+            async with self.client.stream(
+                "POST",
+                f"{self.base_url}/v1/messages",
+                headers=self._headers(),
+                json={**request, "stream": True}
+            ) as response:
+                if response.is_error:
+                    await response.aread()
+                    response.raise_for_status()
+                
+                usage = {}
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    event = json.loads(line[5:])
+                    if event.get("type") == "error":
+                        raise RuntimeError(event.get("error", {}).get("message", "stream error"))
+                    if event.get("type") == "message_start":
+                        usage.update(event.get("message", {}).get("usage", {}))
+                    elif event.get("type") == "message_delta":
+                        usage.update(event.get("usage", {}))
+                    elif event.get("type") == "content_block_delta":
+                        delta = event["delta"].get("text")
+                        if delta:
+                            yield delta
+            
+            self._record_usage(options.model, usage)
+            logger.info("Anthropic streaming call completed")
+        
+        except Exception as e:
+            logger.error(f"Anthropic API error: {e}")
+            raise RuntimeError(f"Failed to generate summary with Anthropic: {str(e)}") from e
+    
+    def _record_usage(self, model: str, usage: dict) -> None:
+        """Record token usage (input_tokens excludes cache reads and writes)."""
+        cached = usage_field(usage, "cache_read_input_tokens")
+        llm_usage.record(
+            model,
+            prompt_tokens=usage_field(usage, "input_tokens") + cached + usage_field(usage, "cache_creation_input_tokens"),
+            completion_tokens=usage_field(usage, "output_tokens"),
+            cached_tokens=cached
+        )
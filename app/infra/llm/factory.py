@@ -1,29 +1,130 @@
 """LLM client factory."""
+import httpx
+from loguru import logger
 from .openai_client import OpenAIClient
+from .anthropic_client import AnthropicClient
+from .resilience import ResilientLLMClient, build_resilient_client
+from .router import LLMRouter
+from ...config import settings
+
+
+# Model string that routes between settings.llm_route_models
+ROUTED_MODEL = "auto"
 
 
 class LLMFactory:
-    """Factory for creating LLM clients based on model prefix."""
+    """Factory for LLM clients based on model prefix.
     
-    @staticmethod
-    def get_client(model: str):
-        """Get LLM client based on model prefix.
+    Clients are long-lived: one per provider, each with its own pooled
+    keep-alive HTTP/2 connections, reused across requests. Summarization
+    calls go through a shared rate limit, retries and a circuit breaker.
+    Providers: "openai", "anthropic" and "local" (OpenAI-compatible server).
+    """
+    
+    def __init__(self):
+        self._clients: dict[str, OpenAIClient | AnthropicClient] = {}
+        self._resilient: dict[str, ResilientLLMClient] = {}
+        self._router: LLMRouter | None = None
+    
+    def _provider(self, model: str) -> str:
+        """Get provider name from model string."""
+        return model.split(":", 1)[0] if ":" in model else "openai"
+    
+    def get_base_client(self, provider: str) -> OpenAIClient | AnthropicClient:
+        """Get pooled provider client without rate limiting and retries.
         
         Args:
-            model: Model string in format "provider:model"
+            provider: Provider name (e.g. "openai")
             
         Returns:
-            LLM client instance
+            Provider client instance (shared)
             
         Raises:
             ValueError: If provider is not supported
         """
-        provider = model.split(":", 1)[0] if ":" in model else "openai"
+        client = self._clients.get(provider)
+        if client is not None:
+            return client
         
+        # Retries are handled by ResilientLLMClient
         if provider == "openai":
-            return OpenAIClient()
+            client = OpenAIClient(http_client=self._build_http_client(), chat_max_retries=0)
+        elif provider == "anthropic":
+            client = AnthropicClient(http_client=self._build_http_client())
+        elif provider == "local":
+            client = OpenAIClient(
+                api_key=settings.local_llm_api_key or "local",
+                http_client=self._build_http_client(),
+                chat_max_retries=0,
+                base_url=settings.local_llm_base_url
+            )
         else:
             raise ValueError(f"Unsupported LLM provider: {provider}")
+        
+        self._clients[provider] = client
+        logger.info(f"Created pooled LLM client for provider: {provider}")
+        return client
+    
+    def get_client(self, model: str) -> ResilientLLMClient | LLMRouter:
+        """Get LLM client based on model prefix.
+        
+        Args:
+            model: Model string in format "provider:model", or "auto" to
+                route between settings.llm_route_models
+            
+        Returns:
+            LLM client instance (shared)
+            
+        Raises:
+            ValueError: If provider is not supported
+        """
+        if model == ROUTED_MODEL:
+            return self.get_router()
+        
+        provider = self._provider(model)
+        
+        client = self._resilient.get(provider)
+        if client is None:
+            # A local server has no account limits to respect
+            limits = {"rpm": 0, "tpm": 0} if provider == "local" else {}
+            client = build_resilient_client(self.get_base_client(provider), provider, **limits)
+            self._resilient[provider] = client
+        return client
+    
+    def get_router(self) -> LLMRouter:
+        """Get router between settings.llm_route_models (shared)."""
+        if self._router is None:
+            models = [m for m in settings.llm_route_models_list if m != ROUTED_MODEL]
+            # Fail at startup rather than on the first routed request
+            for model in models:
+                self.get_client(model)
+            self._router = LLMRouter(models, self.get_client)
+            logger.info(f"Created LLM router for models: {', '.join(models)}")
+        return self._router
+    
+    def _build_http_client(self) -> httpx.AsyncClient:
+        """Build pooled HTTP client for provider API calls."""
+        return httpx.AsyncClient(
+            http2=settings.llm_http2,
+            # httpx defaults to 5 s, far below the time a long summary takes
+            timeout=httpx.Timeout(settings.llm_read_timeout, connect=settings.llm_connect_timeout),
+            limits=httpx.Limits(
+                max_connections=settings.llm_max_connections,
+                max_keepalive_connections=settings.llm_max_keepalive,
+                keepalive_expiry=settings.llm_keepalive_expiry
+            )
+        )
+    
+    async def close(self) -> None:
+        """Close all clients and their connection pools."""
+        for provider, client in self._clients.items():
+            try:
+                await client.close()
+            except Exception as e:
+                logger.error(f"Error closing LLM client {provider}: {e}")
+        self._clients.clear()
+        self._resilient.clear()
+        self._router = None
 
 
 # Global factory instance
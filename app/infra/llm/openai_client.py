@@ -1,53 +1,151 @@
 """OpenAI LLM client implementation."""
+from typing import AsyncIterator
+import httpx
 from openai import AsyncOpenAI
 from loguru import logger
-from ...core.entities import SummaryOptions
+from .usage import llm_usage, usage_field
+from ...core.entities import SummaryOptions, PromptTemplate
 from ...config import settings
 
 
+SYSTEM_PROMPT = "You are a helpful assistant that creates concise and accurate summaries."
+
+
 class OpenAIClient:
-    """OpenAI LLM client."""
+    """OpenAI LLM client (also used for OpenAI-compatible servers via base_url)."""
     
-    def __init__(self, api_key: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        chat_max_retries: int | None = None,
+        base_url: str | None = None
+    ):
         self.api_key = api_key or settings.openai_api_key
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        self.client = AsyncOpenAI(api_key=self.api_key, http_client=http_client, base_url=base_url)
+        # Chat calls may leave retries to a wrapping layer; the copy shares the connection pool
+        chat_client = self.client if chat_max_retries is None else self.client.with_options(max_retries=chat_max_retries)
+        self._completions = chat_client.chat.completions
+        # OpenAI-compatible servers may not support usage in streams
+        self.stream_usage = base_url is None
     
-    async def summarize(self, text: str, options: SummaryOptions, prompt_template: str) -> str:
-        """Generate summary using OpenAI.
+    async def close(self) -> None:
+        """Close underlying HTTP connection pool."""
+        await self.client.close()
+    
+    def _build_request(self, text: str, options: SummaryOptions, prompt_template: PromptTemplate) -> dict:
+        """Build chat completion request parameters.
+        
+        Static instructions go into the system message and the content last,
+        so calls with the same template share a prefix the provider caches
+        once it reaches 1024 tokens.
         
         Args:
             text: Text to summarize
             options: Summarization options
-            prompt_template: Prompt template with placeholders
+            prompt_template: Prompt with static instructions and content part
             
         Returns:
-            Generated summary text
+            Keyword arguments for chat.completions.create
         """
         # Extract model name from options.model (format: "openai:gpt-4o-mini")
         model_parts = options.model.split(":", 1)
         model_name = model_parts[1] if len(model_parts) > 1 else "gpt-4o-mini"
         
-        # Format prompt with template
-        prompt = prompt_template.format(content=text)
+        return {
+            "model": model_name,
+            "messages": [
+                {"role": "system", "content": f"{SYSTEM_PROMPT}\n\n{prompt_template.instructions}"},
+                {"role": "user", "content": prompt_template.render(text)}
+            ],
+            "temperature": 0.7,
+            "max_tokens": 2000 if options.detail == "long" else 1000
+        }
+    
+    def estimate_tokens(self, text: str, options: SummaryOptions, prompt_template: PromptTemplate) -> int:
+        """Estimate tokens a request may consume (prompt plus completion limit).
+        
+        Args:
+            text: Text to summarize
+            options: Summarization options
+            prompt_template: Prompt with static instructions and content part
+            
+        Returns:
+            Approximate token count
+        """
+        request = self._build_request(text, options, prompt_template)
+        prompt_chars = sum(len(message["content"]) for message in request["messages"])
+        return prompt_chars // 4 + request["max_tokens"]
+    
+    async def summarize(self, text: str, options: SummaryOptions, prompt_template: PromptTemplate) -> str:
+        """Generate summary using OpenAI.
+        
+        Args:
+            text: Text to summarize
+            options: Summarization options
+            prompt_template: Prompt with static instructions and content part
+            
+        Returns:
+            Generated summary text
+        """
+        request = self._build_request(text, options, prompt_template)
         
         try:
-            logger.info(f"Calling OpenAI API with model: {model_name}")
-            
-            response = await self.client.chat.completions.create(
-                model=model_name,
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant that creates concise and accurate summaries."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=2000 if options.detail == "long" else 1000
-            )
+            logger.info(f"Calling OpenAI API with model: {request['model']}")
+            
+            response = await self._completions.create(**request)
             
             summary = response.choices[0].message.content
-            logger.info(f"OpenAI API call successful, tokens: {response.usage.total_tokens}")
+            self._record_usage(options.model, response.usage)
             
             return summary
             
         except Exception as e:
             logger.error(f"OpenAI API error: {e}")
-            raise RuntimeError(f"Failed to generate summary with OpenAI: {str(e)}")
+            raise RuntimeError(f"Failed to generate summary with OpenAI: {str(e)}") from e
+    
+    async def summarize_stream(self, text: str, options: SummaryOptions, prompt_template: PromptTemplate) -> AsyncIterator[str]:
+        """Generate summary using OpenAI, yielding tokens as they arrive.
+        
+        Args:
+            text: Text to summarize
+            options: Summarization options
+            prompt_template: Prompt with static instructions and content part
+            
+        Yields:
+            Fragments of generated summary text
+        """
+        request = self._build_request(text, options, prompt_template)
+        
+        try:
+            logger.info(f"Streaming OpenAI API call with model: {request['model']}")
+            
+            extra = {"extra_body": {"stream_options": {"include_usage": True}}} if self.stream_usage else {}
+            stream = await self._completions.create(**request, stream=True, **extra)
+            
+            async for chunk in stream:
+                # The last chunk carries usage and no choices
+                usage = getattr(chunk, "usage", None)
+                if usage:
+                    self._record_usage(options.model, usage)
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+            
+            logger.info("OpenAI streaming call completed")
+            
+        except Exception as e:
+            logger.error(f"OpenAI API error: {e}")
+            raise RuntimeError(f"Failed to generate summary with OpenAI: {str(e)}") from e
+    
+    def _record_usage(self, model: str, usage) -> None:
+        """Record token usage, including prompt tokens served from cache."""
+        details = usage_field(usage, "prompt_tokens_details", None)
+        llm_usage.record(
+            model,
+            prompt_tokens=usage_field(usage, "prompt_tokens"),
+            completion_tokens=usage_field(usage, "completion_tokens"),
+            cached_tokens=usage_field(details, "cached_tokens")
+        )
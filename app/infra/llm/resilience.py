@@ -0,0 +1,340 @@
+"""Rate limiting, retries and circuit breaking around LLM clients."""
+import asyncio
+import random
+import time
+from typing import AsyncIterator, Optional
+import httpx
+import openai
+from loguru import logger
+from ..cache import redis_cache, RedisCache
+from ...core.entities import SummaryOptions, PromptTemplate
+from ...config import settings
+
+
+# Token buckets (requests and tokens per minute) refilled continuously.
+# Returns "0" when the request is admitted (and debits both buckets) or the
+# number of seconds to wait otherwise.
+# KEYS: requests bucket, tokens bucket
+# ARGV: now, requests per minute, tokens per minute, tokens (0 limit = no bucket)
+_ACQUIRE_LUA = """
+local now = tonumber(ARGV[1])
+
+local function level(key, capacity)
+    local data = redis.call("HMGET", key, "level", "ts")
+    local current = tonumber(data[1]) or capacity
+    local ts = tonumber(data[2]) or now
+    return math.min(capacity, current + math.max(now - ts, 0) * capacity / 60)
+end
+
+local limits = {tonumber(ARGV[2]), tonumber(ARGV[3])}
+local costs = {1, tonumber(ARGV[4])}
+local levels = {}
+local wait = 0
+for i = 1, 2 do
+    if limits[i] > 0 then
+        costs[i] = math.min(costs[i], limits[i])
+        levels[i] = level(KEYS[i], limits[i])
+        if levels[i] < costs[i] then
+            wait = math.max(wait, (costs[i] - levels[i]) * 60 / limits[i])
+        end
+    end
+end
+if wait > 0 then
+    return tostring(wait)
+end
+for i = 1, 2 do
+    if limits[i] > 0 then
+        redis.call("HSET", KEYS[i], "level", levels[i] - costs[i], "ts", now)
+        redis.call("EXPIRE", KEYS[i], 120)
+    end
+end
+return "0"
+"""
+
+# Errors worth retrying: throttling, timeouts, connection and server errors
+# (529 is Anthropic's "overloaded")
+_RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+def retry_hint(error: BaseException) -> tuple[bool, Optional[float]]:
+    """Classify LLM error (wrapped errors are unwrapped via __cause__).
+    
+    Returns:
+        Tuple of (retryable, seconds requested by Retry-After or None)
+    """
+    while error is not None:
+        if isinstance(error, (openai.APITimeoutError, openai.APIConnectionError, httpx.TransportError)):
+            return True, None
+        if isinstance(error, (openai.APIStatusError, httpx.HTTPStatusError)):
+            retry_after = None
+            try:
+                retry_after = float(error.response.headers.get("retry-after"))
+            except (TypeError, ValueError):
+                pass
+            return error.response.status_code in _RETRYABLE_STATUS, retry_after
+        error = error.__cause__
+    return False, None
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    """Check if error (or its cause) is an HTTP 429."""
+    while error is not None:
+        if isinstance(error, openai.RateLimitError):
+            return True
+        if isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 429:
+            return True
+        error = error.__cause__
+    return False
+
+
+class RedisRateLimiter:
+    """Client-side requests/tokens per minute budget shared by all workers.
+    
+    Fails open: if Redis is unavailable, requests are not delayed.
+    """
+    
+    def __init__(self, cache: RedisCache, name: str, rpm: int, tpm: int):
+        self.cache = cache
+        self.rpm = rpm
+        self.tpm = tpm
+        self.requests_key = f"llm:bucket:{name}:requests"
+        self.tokens_key = f"llm:bucket:{name}:tokens"
+        self._script = None
+    
+    async def acquire(self, tokens: int) -> None:
+        """Wait until the request fits in the budget, then debit it.
+        
+        Args:
+            tokens: Estimated tokens of the request
+        """
+        if self.rpm <= 0 and self.tpm <= 0:
+            return
+        
+        while True:
+            try:
+                client = await self.cache.get_client()
+                if self._script is None:
+                    self._script = client.register_script(_ACQUIRE_LUA)
+                wait = float(await self._script(
+                    keys=[self.requests_key, self.tokens_key],
+                    args=[time.time(), self.rpm, self.tpm, tokens]
+                ))
+            except Exception as e:
+                logger.warning(f"LLM rate limiter unavailable: {e}")
+                return
+            if wait <= 0:
+                return
+            # Jitter spreads waiters so they do not retry in lockstep
+            await asyncio.sleep(min(wait, 5.0) * random.uniform(1.0, 1.2))
+    
+    async def throttle(self, seconds: float) -> None:
+        """Empty the budget after a 429 so every worker slows down."""
+        try:
+            client = await self.cache.get_client()
+            now = time.time() + seconds
+            pipe = client.pipeline(transaction=True)
+            for key in (self.requests_key, self.tokens_key):
+                pipe.hset(key, mapping={"level": 0, "ts": now})
+                pipe.expire(key, 120)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Could not throttle LLM rate limiter: {e}")
+
+
+class CircuitBreaker:
+    """Fails fast after repeated provider failures (per process).
+    
+    Opens after `threshold` consecutive failures; after `cooldown` seconds
+    one trial call is let through, which closes it again on success.
+    """
+    
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial = False
+    
+    @property
+    def is_open(self) -> bool:
+        """Check if calls would currently be rejected."""
+        if self._opened_at is None:
+            return False
+        return time.monotonic() - self._opened_at < self.cooldown or self._trial
+    
+    def before_call(self) -> bool:
+        """Check breaker before a call.
+        
+        Returns:
+            True if the call is the half-open trial
+        
+        Raises:
+            RuntimeError: If the breaker is open
+        """
+        if self._opened_at is None:
+            return False
+        if self.is_open:
+            raise RuntimeError("LLM provider is temporarily unavailable, please try again later")
+        self._trial = True
+        return True
+    
+    def record_success(self) -> None:
+        """Close breaker."""
+        self._failures = 0
+        self._opened_at = None
+        self._trial = False
+    
+    def record_abandoned(self, trial: bool) -> None:
+        """Forget a call that was cancelled before it finished.
+        
+        Args:
+            trial: What before_call() returned for the call; other calls
+                must not release a trial in progress
+        """
+        if trial:
+            self._trial = False
+    
+    def record_failure(self) -> None:
+        """Count failure, opening the breaker at the threshold."""
+        self._failures += 1
+        self._trial = False
+        if self._failures >= self.threshold:
+            if self._opened_at is None:
+                logger.error(f"LLM circuit breaker opened after {self._failures} failures")
+            self._opened_at = time.monotonic()
+
+
+class ResilientLLMClient:
+    """LLMClient wrapper with shared rate limits, retries and a circuit breaker."""
+    
+    def __init__(
+        self,
+        client,
+        limiter: RedisRateLimiter,
+        breaker: CircuitBreaker,
+        max_retries: int | None = None,
+        backoff_base: float | None = None,
+        backoff_max: float | None = None
+    ):
+        self.client = client
+        self.limiter = limiter
+        self.breaker = breaker
+        self.max_retries = settings.llm_max_retries if max_retries is None else max_retries
+        self.backoff_base = backoff_base or settings.llm_backoff_base
+        self.backoff_max = backoff_max or settings.llm_backoff_max
+    
+    def _estimate_tokens(self, text: str, options: SummaryOptions, prompt_template: PromptTemplate) -> int:
+        """Estimate tokens of a request."""
+        estimate = getattr(self.client, "estimate_tokens", None)
+        if estimate:
+            return estimate(text, options, prompt_template)
+        return prompt_template.estimate_chars(text) // 4
+    
+    async def _before_attempt(self, tokens: int) -> bool:
+        """Check breaker and wait for rate limit budget.
+        
+        Returns:
+            True if the attempt is the breaker's half-open trial
+        """
+        trial = self.breaker.before_call()
+        try:
+            await self.limiter.acquire(tokens)
+        except BaseException:
+            # Do not leave the half-open trial taken by a call that never ran
+            self.breaker.record_abandoned(trial)
+            raise
+        return trial
+    
+    async def _after_failure(self, error: Exception, attempt: int) -> None:
+        """Record failure and sleep before retrying.
+        
+        Raises:
+            Exception: The error itself if it should not be retried
+        """
+        retryable, retry_after = retry_hint(error)
+        if not retryable:
+            # The provider answered (e.g. bad request), so it is not down
+            self.breaker.record_success()
+            raise error
+        
+        self.breaker.record_failure()
+        if attempt >= self.max_retries:
+            raise error
+        
+        # Full jitter exponential backoff, at least as long as Retry-After
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        if is_rate_limited(error):
+            await self.limiter.throttle(delay)
+        
+        logger.warning(f"LLM call failed ({error}), retry {attempt + 1}/{self.max_retries} in {delay:.1f}s")
+        await asyncio.sleep(delay)
+    
+    async def summarize(self, text: str, options: SummaryOptions, prompt_template: PromptTemplate) -> str:
+        tokens = self._estimate_tokens(text, options, prompt_template)
+        attempt = 0
+        while True:
+            trial = await self._before_attempt(tokens)
+            try:
+                result = await self.client.summarize(text, options, prompt_template)
+            except asyncio.CancelledError:
+                self.breaker.record_abandoned(trial)
+                raise
+            except Exception as e:
+                await self._after_failure(e, attempt)
+                attempt += 1
+                continue
+            self.breaker.record_success()
+            return result
+    
+    async def summarize_stream(self, text: str, options: SummaryOptions, prompt_template: PromptTemplate) -> AsyncIterator[str]:
+        tokens = self._estimate_tokens(text, options, prompt_template)
+        attempt = 0
+        while True:
+            trial = await self._before_attempt(tokens)
+            started = False
+            try:
+                async for delta in self.client.summarize_stream(text, options, prompt_template):
+                    started = True
+                    yield delta
+            except (asyncio.CancelledError, GeneratorExit):
+                self.breaker.record_abandoned(trial)
+                raise
+            except Exception as e:
+                # Output already sent cannot be taken back, only retry before the first delta
+                if started:
+                    if retry_hint(e)[0]:
+                        self.breaker.record_failure()
+                    raise
+                await self._after_failure(e, attempt)
+                attempt += 1
+                continue
+            self.breaker.record_success()
+            return
+
+
+def build_resilient_client(
+    client,
+    name: str,
+    rpm: int | None = None,
+    tpm: int | None = None
+) -> ResilientLLMClient:
+    """Wrap client with limits from settings.
+    
+    Args:
+        client: LLM client to wrap
+        name: Provider name (rate limit budget is shared per name)
+        rpm: Requests per minute (defaults to settings, 0 = no limit)
+        tpm: Tokens per minute (defaults to settings, 0 = no limit)
+    
+    Returns:
+        ResilientLLMClient
+    """
+    rpm = settings.llm_rpm_limit if rpm is None else rpm
+    tpm = settings.llm_tpm_limit if tpm is None else tpm
+    return ResilientLLMClient(
+        client,
+        limiter=RedisRateLimiter(redis_cache, name, rpm, tpm),
+        breaker=CircuitBreaker(settings.llm_breaker_threshold, settings.llm_breaker_cooldown)
+    )
@@ -0,0 +1,226 @@
+"""Latency and error rate aware routing between LLM models."""
+import asyncio
+import random
+import time
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Optional
+from loguru import logger
+from ...core.entities import SummaryOptions, PromptTemplate
+from ...config import settings
+
+
+class ModelStats:
+    """Recent latencies and error rate of one model (per process)."""
+    
+    def __init__(self, window: int = 200, error_decay: float = 0.1):
+        self.error_decay = error_decay
+        self.error_rate = 0.0
+        # Full response time for summarize, time to first delta for streams
+        self._latencies = {"complete": deque(maxlen=window), "first_delta": deque(maxlen=window)}
+    
+    def samples(self, kind: str) -> int:
+        """Get number of recorded latencies."""
+        return len(self._latencies[kind])
+    
+    def record(self, kind: str, seconds: float, failed: bool = False) -> None:
+        """Record call outcome."""
+        if not failed:
+            self._latencies[kind].append(seconds)
+        self.error_rate += self.error_decay * ((1.0 if failed else 0.0) - self.error_rate)
+    
+    def percentile(self, kind: str, q: float) -> Optional[float]:
+        """Get latency percentile (None without samples)."""
+        latencies = sorted(self._latencies[kind])
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+    
+    def score(self, kind: str) -> float:
+        """Get routing score (lower is better, unmeasured models first)."""
+        median = self.percentile(kind, 0.5)
+        if median is None:
+            return 0.0
+        # An error costs a retry or fallback, so it is weighted like extra latency
+        return median * (1.0 + 4.0 * self.error_rate)
+
+
+class LLMRouter:
+    """LLMClient that picks a model per call by observed latency and error rate.
+    
+    Models whose circuit breaker is open are skipped; if the chosen model
+    fails, the next best one is tried. With hedging enabled, short summaries
+    send a second request to the next best model when the first one is
+    slower than its p95, at most for `hedge_max_ratio` of requests, so tail
+    latency drops while cost grows by only a few percent.
+    """
+    
+    def __init__(
+        self,
+        models: list[str],
+        get_client: Callable[[str], object],
+        hedge: bool | None = None,
+        hedge_min_samples: int | None = None,
+        hedge_max_ratio: float | None = None,
+        explore_ratio: float = 0.05
+    ):
+        if not models:
+            raise ValueError("LLM router needs at least one model")
+        self.models = models
+        self.get_client = get_client
+        self.hedge = settings.llm_hedge_enabled if hedge is None else hedge
+        self.hedge_min_samples = settings.llm_hedge_min_samples if hedge_min_samples is None else hedge_min_samples
+        self.hedge_max_ratio = settings.llm_hedge_max_ratio if hedge_max_ratio is None else hedge_max_ratio
+        self.explore_ratio = explore_ratio
+        self.stats = {model: ModelStats() for model in models}
+        self._requests = 0
+        self._hedges = 0
+    
+    def _ranked(self, kind: str) -> list[str]:
+        """Get models ordered by preference."""
+        available = [
+            model for model in self.models
+            if not getattr(getattr(self.get_client(model), "breaker", None), "is_open", False)
+        ] or list(self.models)
+        ranked = sorted(available, key=lambda model: self.stats[model].score(kind))
+        
+        # Occasionally try another model so its stats stay current
+        if len(ranked) > 1 and random.random() < self.explore_ratio:
+            ranked.insert(0, ranked.pop(random.randrange(1, len(ranked))))
+        return ranked
+    
+    def _hedge_delay(self, model: str, kind: str, options: SummaryOptions) -> Optional[float]:
+        """Get seconds after which to hedge a call (None to not hedge)."""
+        if not self.hedge or options.detail != "short":
+            return None
+        stats = self.stats[model]
+        if stats.samples(kind) < self.hedge_min_samples:
+            return None
+        if self._hedges >= self.hedge_max_ratio * self._requests:
+            return None
+        return stats.percentile(kind, 0.95)
+    
+    async def _timed(self, model: str, kind: str, call: Awaitable):
+        """Await call, recording its latency and outcome for model."""
+        started = time.monotonic()
+        try:
+            result = await call
+        except asyncio.CancelledError:
+            # A hedged call that lost is at least this slow
+            self.stats[model].record(kind, time.monotonic() - started)
+            raise
+        except Exception:
+            self.stats[model].record(kind, time.monotonic() - started, failed=True)
+            raise
+        self.stats[model].record(kind, time.monotonic() - started)
+        return result
+    
+    async def _race(
+        self,
+        ranked: list[str],
+        kind: str,
+        options: SummaryOptions,
+        start: Callable[[str], Awaitable],
+        discard: Callable[[object], Awaitable] | None = None
+    ):
+        """Run call on the best model, hedging or falling back to the others.
+        
+        Args:
+            ranked: Models by preference
+            kind: Latency kind
+            options: Summarization options
+            start: Makes the call for a model
+            discard: Releases a result that lost the race
+        
+        Returns:
+            Result of the first successful call
+        """
+        self._requests += 1
+        delay = self._hedge_delay(ranked[0], kind, options)
+        fallbacks = list(ranked[1:])
+        tasks = {asyncio.create_task(self._timed(ranked[0], kind, start(ranked[0])))}
+        error: BaseException | None = None
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done:
+                    backup = fallbacks.pop(0) if fallbacks else ranked[0]
+                    self._hedges += 1
+                    logger.info(f"Hedging slow LLM call to {ranked[0]} with {backup}")
+                    tasks.add(asyncio.create_task(self._timed(backup, kind, start(backup))))
+            
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                # A call cancelled from outside counts as failed
+                errors = [asyncio.CancelledError() if task.cancelled() else task.exception() for task in done]
+                results = [task.result() for task, failure in zip(done, errors) if failure is None]
+                if results:
+                    for result in results[1:]:
+                        if discard:
+                            await discard(result)
+                    return results[0]
+                error = errors[0]
+                if not tasks and fallbacks:
+                    fallback = fallbacks.pop(0)
+                    logger.warning(f"LLM call failed ({error}), falling back to {fallback}")
+                    tasks.add(asyncio.create_task(self._timed(fallback, kind, start(fallback))))
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    def _routed_options(self, model: str, options: SummaryOptions) -> SummaryOptions:
+        """Get options for a call to model."""
+        return options.model_copy(update={"model": model})
+    
+    async def summarize(self, text: str, options: SummaryOptions, prompt_template: PromptTemplate) -> str:
+        """Summarize with the best model, hedging or falling back as needed.
+        
+        Args:
+            text: Text to summarize
+            options: Summarization options (model is set per routed call)
+            prompt_template: Prompt with static instructions and content part
+        
+        Returns:
+            Summary from the first model that answered successfully
+        """
+        def start(model: str) -> Awaitable[str]:
+            return self.get_client(model).summarize(text, self._routed_options(model, options), prompt_template)
+        
+        return await self._race(self._ranked("complete"), "complete", options, start)
+    
+    async def summarize_stream(self, text: str, options: SummaryOptions, prompt_template: PromptTemplate) -> AsyncIterator[str]:
+        """Stream summary from the best model.
+        
+        Models race (hedge or fall back) only up to their first delta; the
+        rest of the summary comes from the stream that delivered it first.
+        
+        Args:
+            text: Text to summarize
+            options: Summarization options (model is set per routed call)
+            prompt_template: Prompt with static instructions and content part
+        
+        Yields:
+            Summary deltas
+        """
+        async def start(model: str) -> tuple[AsyncIterator[str], str]:
+            # Open stream and wait for its first delta (hedging races on time to first delta)
+            stream = self.get_client(model).summarize_stream(text, self._routed_options(model, options), prompt_template)
+            try:
+                return stream, await stream.__anext__()
+            except StopAsyncIteration:
+                return stream, ""
+            except BaseException:
+                await stream.aclose()
+                raise
+        
+        async def discard(result: tuple[AsyncIterator[str], str]) -> None:
+            await result[0].aclose()
+        
+        stream, first = await self._race(self._ranked("first_delta"), "first_delta", options, start, discard)
+        try:
+            if first:
+                yield first
+            async for delta in stream:
+                yield delta
+        finally:
+            await stream.aclose()
@@ -0,0 +1,108 @@
+"""Token counting and model context budgets."""
+import time
+from loguru import logger
+from .factory import ROUTED_MODEL
+from ...config import settings
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+# Context windows by model name prefix (first match wins); other models
+# use settings.llm_context_tokens
+_CONTEXT_TOKENS = (
+    ("gpt-4.1", 1_000_000),
+    ("gpt-4o", 128_000),
+    ("gpt-4-turbo", 128_000),
+    ("gpt-3.5-turbo", 16_385),
+    ("o1", 200_000),
+    ("o3", 200_000),
+    ("o4", 200_000),
+    ("claude", 200_000),
+)
+
+# Approximate characters per token when no tokenizer is available
+_CHARS_PER_TOKEN = 4
+
+# Seconds before loading an encoding is tried again after a failure
+_RETRY_SECONDS = 300.0
+
+_encodings: dict[str, object] = {}
+_retry_at: dict[str, float] = {}
+
+
+def _encoding(name: str):
+    """Load tiktoken encoding (None if unavailable, retried later)."""
+    if tiktoken is None:
+        return None
+    encoding = _encodings.get(name)
+    if encoding is not None or time.monotonic() < _retry_at.get(name, 0.0):
+        return encoding
+    try:
+        encoding = tiktoken.get_encoding(name)
+    except Exception as e:
+        # Encodings are downloaded on first use, which may fail only for a while
+        logger.warning(f"Tokenizer {name} unavailable, estimating tokens from length: {e}")
+        _retry_at[name] = time.monotonic() + _RETRY_SECONDS
+        return None
+    _encodings[name] = encoding
+    return encoding
+
+
+def _model_name(model: str) -> str:
+    """Get model name without provider prefix."""
+    return model.split(":", 1)[1] if ":" in model else model
+
+
+class TokenCounter:
+    """Counts tokens with the tokenizer of the model's family.
+    
+    OpenAI models use their own encoding; other providers use o200k_base,
+    which is close enough for budgeting. Without tiktoken, tokens are
+    estimated from text length.
+    """
+    
+    def count(self, text: str, model: str) -> int:
+        """Count tokens of text for model.
+        
+        Args:
+            text: Text to count
+            model: Model string in format "provider:model"
+        
+        Returns:
+            Token count
+        """
+        name = _model_name(model)
+        # Older GPT models use cl100k_base, newer ones o200k_base
+        legacy = name.startswith(("gpt-3.5", "gpt-4")) and not name.startswith(("gpt-4o", "gpt-4.1"))
+        encoding = _encoding("cl100k_base" if legacy else "o200k_base")
+        if encoding is None:
+            return len(text) // _CHARS_PER_TOKEN + 1
+        return len(encoding.encode(text, disallowed_special=()))
+    
+    def context_tokens(self, model: str) -> int:
+        """Get context window of model.
+        
+        Args:
+            model: Model string in format "provider:model", or "auto" for
+                the smallest window among routed models
+        
+        Returns:
+            Context window in tokens
+        """
+        if model == ROUTED_MODEL:
+            models = [m for m in settings.llm_route_models_list if m != ROUTED_MODEL]
+            if models:
+                return min(self.context_tokens(m) for m in models)
+        
+        name = _model_name(model)
+        for prefix, tokens in _CONTEXT_TOKENS:
+            if name.startswith(prefix):
+                return tokens
+        return settings.llm_context_tokens
+
+
+# Global token counter instance
+token_counter = TokenCounter()
@@ -0,0 +1,35 @@
+"""LLM token usage accounting."""
+from loguru import logger
+from ..metrics import metrics
+
+
+def usage_field(usage, name: str, default=0):
+    """Read field from provider usage (dict or object, missing fields allowed)."""
+    if usage is None:
+        return default
+    value = usage.get(name) if isinstance(usage, dict) else getattr(usage, name, None)
+    return default if value is None else value
+
+
+class UsageRecorder:
+    """Logs and exports token usage of LLM calls, including prompt cache hits."""
+    
+    def record(self, model: str, prompt_tokens: int, completion_tokens: int, cached_tokens: int = 0) -> None:
+        """Record usage of one LLM call.
+        
+        Args:
+            model: Model string in format "provider:model"
+            prompt_tokens: Prompt tokens, including cached ones
+            completion_tokens: Generated tokens
+            cached_tokens: Prompt tokens served from the provider's prompt cache
+        """
+        metrics.llm_usage(model, prompt_tokens, completion_tokens, cached_tokens)
+        
+        logger.info(
+            f"LLM usage {model}: {prompt_tokens} prompt ({cached_tokens} cached), "
+            f"{completion_tokens} completion tokens"
+        )
+
+
+# Global usage recorder instance
+llm_usage = UsageRecorder()
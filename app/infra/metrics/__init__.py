@@ -0,0 +1,7 @@
+"""Metrics infrastructure."""
+from .prometheus import PrometheusMetrics, metrics
+
+__all__ = [
+    "PrometheusMetrics",
+    "metrics",
+]
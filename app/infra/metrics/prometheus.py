@@ -0,0 +1,153 @@
+"""Prometheus metrics of the summarization pipeline."""
+import os
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator
+from loguru import logger
+
+try:
+    import prometheus_client
+    from prometheus_client import multiprocess
+except ImportError:
+    prometheus_client = None
+
+
+# From a local cache read up to a long Whisper transcription
+_STAGE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300, 600)
+_REDIS_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1)
+
+# Commands that wait server-side for data; their duration is not a round trip
+_BLOCKING_COMMANDS = frozenset({
+    "BLPOP", "BRPOP", "BRPOPLPUSH", "BLMOVE", "BLMPOP", "BZPOPMIN", "BZPOPMAX", "BZMPOP",
+    "XREAD", "XREADGROUP", "WAIT",
+})
+
+
+class PrometheusMetrics:
+    """Pipeline metrics exported in Prometheus format.
+    
+    Records stage latencies and in-flight counts, cache outcomes, LLM
+    token usage, Whisper fallbacks and Redis round trips. Without
+    prometheus_client installed every method is a no-op. Processes sharing
+    PROMETHEUS_MULTIPROC_DIR (e.g. several uvicorn workers) are exported
+    together.
+    """
+    
+    def __init__(self, namespace: str = "compresso"):
+        self.enabled = prometheus_client is not None
+        if not self.enabled:
+            logger.warning("prometheus_client is not installed, metrics are disabled")
+            return
+        
+        self.stage_seconds = prometheus_client.Histogram(
+            "stage_seconds", "Duration of pipeline stages",
+            ["stage", "mode"], namespace=namespace, buckets=_STAGE_BUCKETS
+        )
+        self.stage_errors = prometheus_client.Counter(
+            "stage_errors", "Pipeline stages that raised an error",
+            ["stage", "mode"], namespace=namespace
+        )
+        self.stage_in_flight = prometheus_client.Gauge(
+            "stage_in_flight", "Pipeline stages currently running",
+            ["stage"], namespace=namespace, multiprocess_mode="livesum"
+        )
+        self.cache_requests = prometheus_client.Counter(
+            "cache_requests", "Cache lookups by outcome",
+            ["cache", "result"], namespace=namespace
+        )
+        self.llm_calls = prometheus_client.Counter(
+            "llm_calls", "Completed LLM calls",
+            ["model"], namespace=namespace
+        )
+        self.llm_tokens = prometheus_client.Counter(
+            "llm_tokens", "LLM tokens (prompt includes cached)",
+            ["model", "kind"], namespace=namespace
+        )
+        self.whisper_fallbacks = prometheus_client.Counter(
+            "whisper_fallbacks", "Videos without captions that needed Whisper",
+            ["whisper_mode"], namespace=namespace
+        )
+        self.redis_seconds = prometheus_client.Histogram(
+            "redis_seconds", "Redis round-trip time",
+            ["command"], namespace=namespace, buckets=_REDIS_BUCKETS
+        )
+    
+    @asynccontextmanager
+    async def stage(self, stage: str, mode: str) -> AsyncIterator[None]:
+        """Time pipeline stage and count it as in flight while inside the block."""
+        if not self.enabled:
+            yield
+            return
+        
+        in_flight = self.stage_in_flight.labels(stage)
+        in_flight.inc()
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.stage_errors.labels(stage, mode).inc()
+            raise
+        finally:
+            self.stage_seconds.labels(stage, mode).observe(time.perf_counter() - start)
+            in_flight.dec()
+    
+    def cache_result(self, cache: str, result: str) -> None:
+        """Count cache lookup outcome ("hit", "miss", ...)."""
+        if self.enabled:
+            self.cache_requests.labels(cache, result).inc()
+    
+    def llm_usage(self, model: str, prompt_tokens: int, completion_tokens: int, cached_tokens: int = 0) -> None:
+        """Count tokens of one LLM call."""
+        if not self.enabled:
+            return
+        self.llm_calls.labels(model).inc()
+        self.llm_tokens.labels(model, "prompt").inc(prompt_tokens)
+        self.llm_tokens.labels(model, "cached").inc(cached_tokens)
+        self.llm_tokens.labels(model, "completion").inc(completion_tokens)
+    
+    def whisper_fallback(self, whisper_mode: str) -> None:
+        """Count video that had no captions."""
+        if self.enabled:
+            self.whisper_fallbacks.labels(whisper_mode).inc()
+    
+    @contextmanager
+    def redis_call(self, command: str) -> Iterator[None]:
+        """Time Redis command while inside the block (blocking reads are skipped)."""
+        if not self.enabled or command in _BLOCKING_COMMANDS:
+            yield
+            return
+        
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.redis_seconds.labels(command).observe(time.perf_counter() - start)
+    
+    def render(self) -> tuple[bytes, str]:
+        """Get metrics in Prometheus text format.
+        
+        Returns:
+            Tuple of (body, content type)
+        
+        Raises:
+            RuntimeError: If prometheus_client is not installed
+        """
+        if not self.enabled:
+            raise RuntimeError("prometheus_client is not installed")
+        
+        registry = prometheus_client.REGISTRY
+        if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+            registry = prometheus_client.CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+        return prometheus_client.generate_latest(registry), prometheus_client.CONTENT_TYPE_LATEST
+    
+    def start_server(self, port: int) -> None:
+        """Serve metrics over HTTP from a background thread (for the worker)."""
+        if not self.enabled:
+            return
+        prometheus_client.start_http_server(port)
+        logger.info(f"Serving metrics on port {port}")
+
+
+# Global metrics instance
+metrics = PrometheusMetrics()
@@ -1,8 +1,23 @@
 """Transcript infrastructure."""
-from .url_reader import URLReader
+from .host_limiter import HostLimiter
+from .url_reader import URLReader, url_reader
 from .youtube_provider import YouTubeProvider
+from .whisper_pool import WhisperPool, whisper_pool
+from .audio_downloader import AudioDownloader, audio_downloader
+from .normalizer import CanonicalInputNormalizer, input_normalizer
+from .compactor import TranscriptCompactor, transcript_compactor
 
 __all__ = [
+    "HostLimiter",
     "URLReader",
+    "url_reader",
     "YouTubeProvider",
+    "WhisperPool",
+    "whisper_pool",
+    "AudioDownloader",
+    "audio_downloader",
+    "CanonicalInputNormalizer",
+    "input_normalizer",
+    "TranscriptCompactor",
+    "transcript_compactor",
 ]
@@ -0,0 +1,126 @@
+"""YouTube audio download on a dedicated bounded thread pool."""
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+import yt_dlp
+from loguru import logger
+from ...config import settings
+from .audio_splitter import audio_splitter
+
+
+# Smallest audio-only stream is plenty for speech (YouTube serves ~30-50 kbps
+# opus/aac); very low bitrate variants are skipped if something better exists
+AUDIO_FORMAT = "worstaudio[abr>=24]/worstaudio/bestaudio/best"
+
+
+def _download(video_id: str, outtmpl: str) -> str:
+    """Download audio stream with yt-dlp (blocking).
+    
+    Returns:
+        Path of the downloaded file
+    """
+    ydl_opts = {
+        'format': AUDIO_FORMAT,
+        'outtmpl': outtmpl,
+        'quiet': True,
+        'no_warnings': True,
+        'noplaylist': True,
+        'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'extractor_args': {'youtube': {'player_client': ['android', 'web']}},
+    }
+    url = f"https://www.youtube.com/watch?v={video_id}"
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        info = ydl.extract_info(url, download=True)
+        return ydl.prepare_filename(info)
+
+
+def _remove_download(future: Future) -> None:
+    """Delete the file of a download nobody waits for any more."""
+    if not future.cancelled() and future.exception() is None:
+        Path(future.result()).unlink(missing_ok=True)
+
+
+class AudioDownloader:
+    """Downloads audio for Whisper on its own bounded pool of threads.
+    
+    Downloads do not compete with other work on the default loop executor.
+    At most `workers` + `queue_depth` downloads are admitted (a download
+    counts until its thread is done, even if the caller gave up); further
+    requests are rejected right away. Audio is stored as 16 kHz mono Opus,
+    the rate Whisper works at, so nothing is decoded twice and segments
+    stay small; at most `workers` encodes run at once.
+    """
+    
+    def __init__(self, workers: int | None = None, queue_depth: int | None = None):
+        self.workers = workers or settings.audio_download_workers
+        self.queue_depth = settings.audio_download_queue_depth if queue_depth is None else queue_depth
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._encodes = asyncio.Semaphore(self.workers)
+        self._pending = 0
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get thread pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="audio-download")
+        return self._executor
+    
+    def close(self) -> None:
+        """Shut down download threads."""
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    def _download_done(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Free the download's queue slot (called from its thread)."""
+        try:
+            loop.call_soon_threadsafe(self._release)
+        except RuntimeError:
+            # Loop already closed, nothing left to admit
+            pass
+    
+    def _release(self) -> None:
+        """Free one queue slot."""
+        self._pending -= 1
+    
+    async def download(self, video_id: str, directory: Path) -> Path:
+        """Download video audio as 16 kHz mono Opus.
+        
+        Args:
+            video_id: YouTube video ID
+            directory: Directory for the audio file
+        
+        Returns:
+            Path to the audio file
+        
+        Raises:
+            RuntimeError: If the download queue is full
+        """
+        if self._pending >= self.workers + self.queue_depth:
+            raise RuntimeError("Audio download queue is full, please try again later")
+        
+        self._pending += 1
+        loop = asyncio.get_running_loop()
+        future = self._get_executor().submit(_download, video_id, str(directory / "source.%(ext)s"))
+        future.add_done_callback(lambda _: self._download_done(loop))
+        try:
+            source = Path(await asyncio.wrap_future(future))
+        except asyncio.CancelledError:
+            # A running download cannot be stopped; drop its file once it ends
+            future.add_done_callback(_remove_download)
+            raise
+        
+        audio_path = directory / "audio.ogg"
+        try:
+            async with self._encodes:
+                await audio_splitter.encode_speech(source, audio_path)
+        finally:
+            # Only the compact copy is kept on disk
+            source.unlink(missing_ok=True)
+        
+        logger.info(f"Downloaded audio for {video_id}: {audio_path.stat().st_size / 1e6:.1f} MB")
+        return audio_path
+
+
+# Global audio downloader instance
+audio_downloader = AudioDownloader()
@@ -0,0 +1,140 @@
+"""Audio splitting at silence boundaries (ffmpeg)."""
+import asyncio
+import re
+from pathlib import Path
+from loguru import logger
+
+
+_SILENCE_START = re.compile(r"silence_start:\s*(-?[\d.]+)")
+_SILENCE_END = re.compile(r"silence_end:\s*(-?[\d.]+)")
+
+# Whisper resamples everything to 16 kHz mono; Opus at 24 kbps keeps speech intact
+SPEECH_SAMPLE_RATE = 16000
+SPEECH_BITRATE = "24k"
+
+
+def plan_segments(
+    duration: float,
+    silences: list[tuple[float, float]],
+    target_seconds: float,
+    max_seconds: float
+) -> list[tuple[float, float]]:
+    """Plan segment boundaries, cutting in the middle of silences.
+    
+    Args:
+        duration: Total audio duration in seconds
+        silences: Detected (start, end) silence intervals
+        target_seconds: Preferred segment length
+        max_seconds: Hard maximum segment length
+    
+    Returns:
+        List of (start, end) segments covering the whole audio
+    """
+    midpoints = sorted((start + end) / 2 for start, end in silences)
+    segments = []
+    start = 0.0
+    
+    while duration - start > max_seconds:
+        ideal = start + target_seconds
+        candidates = [m for m in midpoints if start + target_seconds / 2 <= m <= start + max_seconds]
+        # No silence in range: hard cut at target length
+        cut = min(candidates, key=lambda m: abs(m - ideal)) if candidates else ideal
+        segments.append((start, cut))
+        start = cut
+    
+    segments.append((start, duration))
+    return segments
+
+
+class AudioSplitter:
+    """Splits long audio files into segments at silence boundaries."""
+    
+    def __init__(self, noise_db: int = -30, min_silence: float = 0.5):
+        self.noise_db = noise_db
+        self.min_silence = min_silence
+    
+    async def _run(self, *args: str) -> str:
+        """Run ffmpeg/ffprobe command and return its stderr + stdout."""
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise RuntimeError(f"{args[0]} failed: {stderr.decode(errors='ignore')[-500:]}")
+        return stdout.decode(errors="ignore") + stderr.decode(errors="ignore")
+    
+    async def probe_duration(self, path: Path) -> float:
+        """Get audio duration in seconds."""
+        output = await self._run(
+            "ffprobe", "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            str(path)
+        )
+        return float(output.strip().splitlines()[0])
+    
+    async def encode_speech(self, source: Path, target: Path) -> None:
+        """Convert audio to 16 kHz mono Opus (target should end in .ogg)."""
+        await self._run(
+            "ffmpeg", "-v", "error", "-y",
+            "-i", str(source),
+            "-vn", "-ac", "1", "-ar", str(SPEECH_SAMPLE_RATE),
+            "-c:a", "libopus", "-b:a", SPEECH_BITRATE, "-application", "voip",
+            str(target)
+        )
+    
+    async def detect_silences(self, path: Path) -> list[tuple[float, float]]:
+        """Detect silence intervals with ffmpeg silencedetect."""
+        output = await self._run(
+            "ffmpeg", "-hide_banner", "-nostats",
+            "-i", str(path),
+            "-af", f"silencedetect=noise={self.noise_db}dB:d={self.min_silence}",
+            "-f", "null", "-"
+        )
+        starts = [float(m) for m in _SILENCE_START.findall(output)]
+        ends = [float(m) for m in _SILENCE_END.findall(output)]
+        return list(zip(starts, ends))
+    
+    async def split(
+        self,
+        path: Path,
+        target_seconds: float,
+        max_seconds: float
+    ) -> list[tuple[Path, float]]:
+        """Split audio into segments no longer than max_seconds.
+        
+        Args:
+            path: Audio file path (segments are written next to it)
+            target_seconds: Preferred segment length
+            max_seconds: Hard maximum segment length
+        
+        Returns:
+            List of (segment path, start offset in seconds); the original
+            file is returned as the only segment if it is short enough
+        """
+        duration = await self.probe_duration(path)
+        if duration <= max_seconds:
+            return [(path, 0.0)]
+        
+        silences = await self.detect_silences(path)
+        segments = plan_segments(duration, silences, target_seconds, max_seconds)
+        logger.info(f"Splitting {duration:.0f}s of audio into {len(segments)} segments")
+        
+        async def cut(index: int, start: float, end: float) -> tuple[Path, float]:
+            segment_path = path.with_name(f"{path.stem}_{index:03d}{path.suffix}")
+            await self._run(
+                "ffmpeg", "-v", "error", "-y",
+                "-ss", f"{start:.3f}", "-t", f"{end - start:.3f}",
+                "-i", str(path),
+                "-c", "copy",
+                str(segment_path)
+            )
+            return segment_path, start
+        
+        return await asyncio.gather(*(cut(i, start, end) for i, (start, end) in enumerate(segments)))
+
+
+# Global audio splitter instance
+audio_splitter = AudioSplitter()
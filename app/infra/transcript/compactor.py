@@ -0,0 +1,136 @@
+"""Transcript compaction before summarization."""
+import re
+from loguru import logger
+from ..llm.tokenizer import token_counter, TokenCounter
+from ...config import settings
+
+
+# Words compared when removing caption text repeated from the previous snippet
+_OVERLAP_WORDS = 20
+# Shorter overlaps are too likely to be real repetition ("that that")
+_MIN_OVERLAP_WORDS = 2
+
+_SENTENCE_END = re.compile(r"[.!?…][\"')\]]*$")
+_WORD_KEY = re.compile(r"[^\w]+")
+
+
+def format_timestamp(seconds: float) -> str:
+    """Format seconds as [mm:ss]."""
+    return f"[{int(seconds // 60):02d}:{int(seconds % 60):02d}]"
+
+
+def _new_words(tail: list[str], words: list[str]) -> list[str]:
+    """Drop leading words that repeat the end of the previous text.
+    
+    Auto-generated captions roll: each snippet often starts with the last
+    words of the one before, or repeats it entirely.
+    """
+    tail_keys = [_WORD_KEY.sub("", w.lower()) for w in tail[-_OVERLAP_WORDS:]]
+    keys = [_WORD_KEY.sub("", w.lower()) for w in words]
+    for size in range(min(len(tail_keys), len(keys)), _MIN_OVERLAP_WORDS - 1, -1):
+        if tail_keys[-size:] == keys[:size]:
+            return words[size:]
+    return words
+
+
+def build_blocks(entries: list[tuple[float, str]], block_seconds: float) -> list[tuple[float, str]]:
+    """Merge caption snippets into blocks with one start time each.
+    
+    A block ends at the first sentence end after `block_seconds`, and in
+    any case after twice that (auto captions have no punctuation).
+    
+    Args:
+        entries: List of (start seconds, text) in time order
+        block_seconds: Target block duration
+    
+    Returns:
+        List of (start seconds, text) blocks
+    """
+    blocks: list[tuple[float, list[str]]] = []
+    tail: list[str] = []
+    
+    for start, text in entries:
+        words = _new_words(tail, text.split())
+        if not words:
+            continue
+        tail = (tail + words)[-_OVERLAP_WORDS:]
+        
+        if blocks:
+            block_start, block_words = blocks[-1]
+            elapsed = start - block_start
+            sentence_done = bool(_SENTENCE_END.search(block_words[-1]))
+            if elapsed < block_seconds * 2 and (elapsed < block_seconds or not sentence_done):
+                block_words.extend(words)
+                continue
+        blocks.append((start, list(words)))
+    
+    return [(start, " ".join(words)) for start, words in blocks]
+
+
+class TranscriptCompactor:
+    """Shrinks timestamped transcripts to fit the model's token budget.
+    
+    Snippets (often 2-3 words each, every one with its own timestamp) are
+    deduplicated and merged into blocks. If the transcript still exceeds
+    the model's context minus `reserved_tokens`, or the `chunk_max_chars`
+    of map-reduce chunking, blocks are made longer (fewer timestamps) up
+    to `max_block_seconds`; anything larger is left to chunking.
+    """
+    
+    def __init__(
+        self,
+        counter: TokenCounter,
+        block_seconds: float | None = None,
+        max_block_seconds: float | None = None,
+        reserved_tokens: int | None = None,
+        chunk_max_chars: int | None = None
+    ):
+        self.counter = counter
+        self.block_seconds = block_seconds or settings.transcript_block_seconds
+        self.max_block_seconds = max_block_seconds or settings.transcript_max_block_seconds
+        self.reserved_tokens = settings.transcript_reserved_tokens if reserved_tokens is None else reserved_tokens
+        self.chunk_max_chars = chunk_max_chars or settings.summary_chunk_chars
+    
+    def compact(self, text: str, metadata: dict, model: str) -> tuple[str, dict]:
+        """Compact transcript from its timestamp metadata.
+        
+        Args:
+            text: Transcript text (one line per snippet)
+            metadata: Transcript metadata with "timestamps" snippets
+            model: LLM model string the transcript will be sent to
+        
+        Returns:
+            Tuple of (compacted transcript, metadata with block timestamps)
+        """
+        snippets = metadata.get("timestamps") or []
+        if not snippets:
+            return text, metadata
+        
+        entries = [(snippet["time"], snippet["text"]) for snippet in snippets]
+        budget = max(self.counter.context_tokens(model) - self.reserved_tokens, 1)
+        
+        block_seconds = self.block_seconds
+        while True:
+            blocks = build_blocks(entries, block_seconds)
+            compacted = "\n".join(f"{format_timestamp(start)} {block}" for start, block in blocks)
+            tokens = self.counter.count(compacted, model)
+            # Text over the chunk size is split anyway, whatever the context window
+            fits = tokens <= budget and len(compacted) <= self.chunk_max_chars
+            if fits or block_seconds * 2 > self.max_block_seconds:
+                break
+            block_seconds *= 2
+        
+        logger.info(
+            f"Compacted transcript: {len(snippets)} snippets -> {len(blocks)} blocks "
+            f"({block_seconds:g}s), {len(text)} -> {len(compacted)} chars, {tokens} tokens"
+        )
+        
+        timestamps = [
+            {"time": start, "timestamp": format_timestamp(start), "text": block}
+            for start, block in blocks
+        ]
+        return compacted, {**metadata, "timestamps": timestamps, "compacted_tokens": tokens}
+
+
+# Global transcript compactor instance
+transcript_compactor = TranscriptCompactor(token_counter)
@@ -0,0 +1,60 @@
+"""Per-host request politeness (concurrency and spacing)."""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+
+class _HostState:
+    """Limit of one host, the number of requests using it and its next start time."""
+    
+    def __init__(self, concurrency: int):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.users = 0
+        self.next_start = 0.0
+
+
+class HostLimiter:
+    """Limits requests to each upstream host.
+    
+    At most `concurrency` requests per host run at once, and their starts
+    are at least `delay` seconds apart. Only hosts with requests in flight,
+    waiting, or still inside the delay of their last start are kept.
+    """
+    
+    def __init__(self, concurrency: int, delay: float = 0.0):
+        self.concurrency = concurrency
+        self.delay = delay
+        self._hosts: dict[str, _HostState] = {}
+    
+    @asynccontextmanager
+    async def slot(self, host: str) -> AsyncIterator[None]:
+        """Hold a request slot of the host while inside the block."""
+        state = self._hosts.get(host)
+        if state is None:
+            state = _HostState(self.concurrency)
+            self._hosts[host] = state
+        
+        state.users += 1
+        try:
+            async with state.semaphore:
+                now = time.monotonic()
+                start = max(now, state.next_start)
+                state.next_start = start + self.delay
+                if start > now:
+                    await asyncio.sleep(start - now)
+                yield
+        finally:
+            state.users -= 1
+            if state.users == 0:
+                remaining = state.next_start - time.monotonic()
+                if remaining > 0:
+                    # Keep the spacing of the last start before forgetting the host
+                    asyncio.get_running_loop().call_later(remaining, self._drop_idle, host, state)
+                else:
+                    self._drop_idle(host, state)
+    
+    def _drop_idle(self, host: str, state: _HostState) -> None:
+        """Remove host state unless the host got busy again."""
+        if state.users == 0 and self._hosts.get(host) is state:
+            del self._hosts[host]
@@ -0,0 +1,90 @@
+"""Canonical forms of summary inputs (video IDs, URLs, text)."""
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from ...core.entities import SummaryMode
+from .youtube_provider import YouTubeProvider
+
+
+# Query parameters that only track the visitor and never change the page
+_TRACKING_PREFIXES = ("utm_",)
+_TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid",
+    "mc_cid", "mc_eid", "_ga", "_gl", "ref_src", "spm",
+}
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+_INLINE_SPACE = re.compile(r"[^\S\n]+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+def canonicalize_url(url: str) -> str:
+    """Canonicalize article URL.
+    
+    Lowercases scheme and host, drops default ports, fragments, tracking
+    parameters and trailing slashes, and sorts the remaining query.
+    
+    Args:
+        url: Article URL
+    
+    Returns:
+        Canonical URL
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    
+    netloc = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        netloc = f"{netloc}:{parts.port}"
+    if parts.username:
+        credentials = parts.username + (f":{parts.password}" if parts.password else "")
+        netloc = f"{credentials}@{netloc}"
+    
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name.lower() not in _TRACKING_PARAMS and not name.lower().startswith(_TRACKING_PREFIXES)
+    )
+    path = parts.path.rstrip("/")
+    
+    return urlunsplit((scheme, netloc, path, urlencode(query), ""))
+
+
+def fold_whitespace(text: str) -> str:
+    """Fold whitespace runs, keeping paragraph breaks.
+    
+    Args:
+        text: Input text
+    
+    Returns:
+        Text with single spaces, no trailing spaces and at most one blank line
+    """
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    lines = [_INLINE_SPACE.sub(" ", line).strip() for line in text.split("\n")]
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+
+class CanonicalInputNormalizer:
+    """Maps equivalent inputs to one canonical form before hashing and fetching."""
+    
+    def __init__(self, youtube_provider: YouTubeProvider | None = None):
+        self.youtube_provider = youtube_provider or YouTubeProvider()
+    
+    def normalize(self, input_data: str, mode: SummaryMode) -> str:
+        """Normalize input for its mode.
+        
+        Args:
+            input_data: Raw input text/URL/video_id
+            mode: Summary mode of the input
+        
+        Returns:
+            Canonical video ID, URL or whitespace-folded text
+        """
+        if mode == SummaryMode.YOUTUBE:
+            return self.youtube_provider._extract_video_id(input_data)
+        if mode == SummaryMode.URL:
+            return canonicalize_url(input_data)
+        return fold_whitespace(input_data)
+
+
+# Global input normalizer instance
+input_normalizer = CanonicalInputNormalizer()
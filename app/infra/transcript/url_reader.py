@@ -1,66 +1,191 @@
 """URL article text extraction."""
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import Optional
+from urllib.parse import urlsplit
 import httpx
 from bs4 import BeautifulSoup
 from readability import Document
 from loguru import logger
+from ..cache import http_cache, HTTPResponseCache
+from ..jobs import stage_limiter
+from .host_limiter import HostLimiter
+from ...config import settings
+
+try:
+    import lxml  # noqa: F401
+    _PARSER = "lxml"
+except ImportError:
+    _PARSER = "html.parser"
+
+
+def extract_article(html: str) -> str:
+    """Extract main article text from HTML (CPU-bound, runs in worker process).
+    
+    Args:
+        html: Page HTML
+        
+    Returns:
+        Article text with title heading
+    """
+    # Use readability to extract main content
+    doc = Document(html)
+    title = doc.title()
+    content_html = doc.summary()
+    
+    # Parse with BeautifulSoup to get clean text
+    soup = BeautifulSoup(content_html, _PARSER)
+    
+    # Remove script and style elements
+    for script in soup(["script", "style"]):
+        script.decompose()
+    
+    # Get text
+    text = soup.get_text(separator="\n", strip=True)
+    
+    # Clean up whitespace
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    text = "\n".join(lines)
+    
+    return f"# {title}\n\n{text}"
 
 
 class URLReader:
-    """Extracts text content from article URLs."""
+    """Extracts text content from article URLs.
     
-    def __init__(self, timeout: int = 30):
+    Uses one app-scoped pooled HTTP/2 client and revalidates cached pages
+    with conditional GETs (If-None-Match / If-Modified-Since).
+    """
+    
+    def __init__(self, timeout: int = 30, response_cache: Optional[HTTPResponseCache] = None):
         self.timeout = timeout
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
         }
+        self.response_cache = response_cache
+        self.fresh_seconds = settings.url_cache_fresh_seconds
+        self.max_html_chars = settings.html_max_chars
+        self.extract_workers = settings.html_extract_workers
+        self._client: Optional[httpx.AsyncClient] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._host_limiter = HostLimiter(settings.url_max_connections_per_host)
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get shared HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                http2=True,
+                headers=self.headers,
+                limits=httpx.Limits(
+                    max_connections=settings.url_max_connections,
+                    max_keepalive_connections=settings.url_max_connections
+                )
+            )
+        return self._client
+    
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """Get HTML extraction process pool (None means default thread pool)."""
+        if self._executor is None and self.extract_workers > 0:
+            self._executor = ProcessPoolExecutor(max_workers=self.extract_workers)
+        return self._executor
     
-    async def from_url(self, url: str) -> str:
+    async def close(self) -> None:
+        """Close shared HTTP client and extraction pool."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    async def _fetch(self, url: str, host_limiter: Optional[HostLimiter] = None) -> str:
+        """Fetch page HTML, using cached copy when still valid.
+        
+        Args:
+            url: Page URL
+            host_limiter: Extra per-host politeness for the request (e.g. batch runs)
+        
+        Returns:
+            Page HTML
+        """
+        cached = await self.response_cache.get(url) if self.response_cache else None
+        
+        if cached and time.time() - cached["fetched_at"] < self.fresh_seconds:
+            logger.info(f"Using cached page: {url}")
+            return cached["body"]
+        
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        
+        host = urlsplit(url).hostname or ""
+        polite = host_limiter.slot(host) if host_limiter else nullcontext()
+        async with polite, stage_limiter.limit("fetch"), self._host_limiter.slot(host):
+            response = await self._get_client().get(url, headers=headers)
+        
+        if response.status_code == 304 and cached:
+            logger.info(f"Page not modified: {url}")
+            cached["fetched_at"] = time.time()
+            await self.response_cache.set(url, cached)
+            return cached["body"]
+        
+        response.raise_for_status()
+        html = response.text
+        
+        if self.response_cache:
+            await self.response_cache.set(url, {
+                "body": html,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "fetched_at": time.time()
+            })
+        
+        return html
+    
+    async def from_url(self, url: str, host_limiter: Optional[HostLimiter] = None) -> str:
         """Extract main article text from URL.
         
         Args:
             url: Article URL
-            
+            host_limiter: Extra per-host politeness for the page request
+        
         Returns:
             Extracted article text
-            
+        
         Raises:
             RuntimeError: If extraction fails
         """
         try:
             logger.info(f"Fetching URL: {url}")
             
-            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-                response = await client.get(url, headers=self.headers)
-                response.raise_for_status()
-                html = response.text
-            
-            # Use readability to extract main content
-            doc = Document(html)
-            title = doc.title()
-            content_html = doc.summary()
-            
-            # Parse with BeautifulSoup to get clean text
-            soup = BeautifulSoup(content_html, "html.parser")
-            
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            # Get text
-            text = soup.get_text(separator="\n", strip=True)
+            html = await self._fetch(url, host_limiter)
             
-            # Clean up whitespace
-            lines = [line.strip() for line in text.splitlines() if line.strip()]
-            text = "\n".join(lines)
+            if len(html) > self.max_html_chars:
+                raise ValueError(
+                    f"Page is too large to extract ({len(html)} chars, limit {self.max_html_chars})"
+                )
             
-            result = f"# {title}\n\n{text}"
+            # Extraction is CPU-bound, keep it off the event loop
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._get_executor(), extract_article, html)
             
             logger.info(f"Extracted {len(result)} characters from URL")
             return result
-            
+        
         except httpx.HTTPError as e:
             logger.error(f"HTTP error fetching URL: {e}")
             raise RuntimeError(f"Failed to fetch URL: {str(e)}")
         except Exception as e:
             logger.error(f"Error extracting text from URL: {e}")
             raise RuntimeError(f"Failed to extract text: {str(e)}")
+
+
+# Global URL reader instance (shares one connection pool)
+url_reader = URLReader(response_cache=http_cache)
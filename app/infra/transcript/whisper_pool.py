@@ -0,0 +1,153 @@
+"""Dedicated process pool for local Whisper transcription."""
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+from loguru import logger
+from ...config import settings
+
+
+# Model loaded once per worker process and kept resident
+_model = None
+_model_name: Optional[str] = None
+
+# Upper bound of the default pool size; every worker holds a model copy
+_MAX_DEFAULT_WORKERS = 4
+
+
+def _default_workers() -> int:
+    """Get pool size for WHISPER_WORKERS=0 (half the CPUs, 1 to 4)."""
+    return max(1, min((os.cpu_count() or 1) // 2, _MAX_DEFAULT_WORKERS))
+
+
+def _init_worker(model_name: str, preload: bool) -> None:
+    """Worker process initializer."""
+    global _model_name
+    _model_name = model_name
+    if preload:
+        _get_model()
+
+
+def _get_model():
+    """Get resident Whisper model, loading it on first use."""
+    global _model
+    if _model is None:
+        import whisper
+        _model = whisper.load_model(_model_name)
+    return _model
+
+
+def _warm_up() -> bool:
+    """Load model in worker process."""
+    _get_model()
+    return True
+
+
+def _transcribe(audio_path: str) -> dict:
+    """Transcribe audio file in worker process.
+    
+    Returns:
+        Dict with full text and segments (start, end, text)
+    """
+    result = _get_model().transcribe(audio_path)
+    return {
+        "text": result["text"],
+        "segments": [
+            {"start": seg["start"], "end": seg["end"], "text": seg["text"]}
+            for seg in result.get("segments", [])
+        ]
+    }
+
+
+class WhisperPool:
+    """Runs local Whisper transcriptions on a bounded pool of processes.
+    
+    Each worker keeps its model in memory. Segments of a job are spread
+    across workers. At most `workers` + `queue_depth` jobs are admitted;
+    further requests are rejected right away.
+    """
+    
+    def __init__(
+        self,
+        model_name: str | None = None,
+        workers: int | None = None,
+        queue_depth: int | None = None,
+        preload: bool | None = None
+    ):
+        self.model_name = model_name or settings.whisper_model
+        self.workers = workers or settings.whisper_workers or _default_workers()
+        self.queue_depth = settings.whisper_queue_depth if queue_depth is None else queue_depth
+        self.preload = settings.whisper_preload if preload is None else preload
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Get process pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.model_name, self.preload)
+            )
+        return self._executor
+    
+    async def start(self) -> None:
+        """Start workers and load models ahead of the first request."""
+        logger.info(f"Warming up {self.workers} Whisper worker(s) with model: {self.model_name}")
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        await asyncio.gather(*(
+            loop.run_in_executor(executor, _warm_up) for _ in range(self.workers)
+        ))
+    
+    def close(self) -> None:
+        """Shut down worker processes."""
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    async def transcribe(self, audio_path: str) -> dict:
+        """Transcribe audio file.
+        
+        Args:
+            audio_path: Path to audio file
+        
+        Returns:
+            Dict with full text and segments (start, end, text)
+        
+        Raises:
+            RuntimeError: If the transcription queue is full
+        """
+        results = await self.transcribe_many([audio_path])
+        return results[0]
+    
+    async def transcribe_many(self, audio_paths: list[str]) -> list[dict]:
+        """Transcribe audio segments of one job in parallel across workers.
+        
+        The job takes one queue slot however many segments it has.
+        
+        Args:
+            audio_paths: Paths to audio segment files
+        
+        Returns:
+            Results in input order, each with text and segments
+        
+        Raises:
+            RuntimeError: If the transcription queue is full
+        """
+        if self._pending >= self.workers + self.queue_depth:
+            raise RuntimeError("Transcription queue is full, please try again later")
+        
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            return await asyncio.gather(*(
+                loop.run_in_executor(executor, _transcribe, path) for path in audio_paths
+            ))
+        finally:
+            self._pending -= 1
+
+
+# Global Whisper pool instance
+whisper_pool = WhisperPool()
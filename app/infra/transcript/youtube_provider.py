@@ -3,19 +3,43 @@ import re
 import tempfile
 from pathlib import Path
 import asyncio
+from contextlib import nullcontext
+from typing import Optional
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
-import yt_dlp
 from loguru import logger
 from ...config import settings
+from .audio_splitter import audio_splitter
+from .audio_downloader import audio_downloader
+from ..metrics import metrics
+from .whisper_pool import whisper_pool
+from ..jobs import stage_limiter
+from .host_limiter import HostLimiter
+
+
+# OpenAI transcription upload limit is 25 MB, keep a margin
+OPENAI_UPLOAD_LIMIT = 24 * 1024 * 1024
+
+# Caption and audio requests all go to YouTube, so they share one host slot
+YOUTUBE_HOST = "youtube.com"
 
 
 class YouTubeProvider:
-    """Provides transcripts from YouTube videos."""
+    """Provides transcripts from YouTube videos.
     
-    def __init__(self):
+    An optional host limiter adds politeness (e.g. for batch runs) around
+    the caption request and the audio download only, not transcription.
+    """
+    
+    def __init__(self, host_limiter: Optional[HostLimiter] = None):
         self.whisper_mode = settings.whisper_mode
         self.whisper_model = settings.whisper_model
+        self.segment_seconds = settings.whisper_segment_seconds
+        self.host_limiter = host_limiter
+    
+    def _host_slot(self):
+        """Get politeness context for a request to YouTube."""
+        return self.host_limiter.slot(YOUTUBE_HOST) if self.host_limiter else nullcontext()
     
     def _extract_video_id(self, url: str) -> str:
         """Extract video ID from YouTube URL.
@@ -27,10 +51,12 @@ class YouTubeProvider:
             Video ID
         """
         patterns = [
-            r'(?:youtube\.com\/watch\?v=|youtu\.be\/)([^&\n?#]+)',
-            r'youtube\.com\/embed\/([^&\n?#]+)',
+            r'(?:youtube\.com\/watch\?v=|youtu\.be\/)([^&\n?#/]+)',
+            r'youtube\.com\/watch\?(?:.*&)?v=([^&\n?#/]+)',
+            r'youtube\.com\/(?:embed|shorts|live|v)\/([^&\n?#/]+)',
         ]
         
+        url = url.strip()
         for pattern in patterns:
             match = re.search(pattern, url)
             if match:
@@ -58,6 +84,7 @@ class YouTubeProvider:
             return transcript, metadata
         except (TranscriptsDisabled, NoTranscriptFound) as e:
             logger.warning(f"No transcript available via API: {e}, falling back to Whisper")
+            metrics.whisper_fallback(self.whisper_mode)
             if self.whisper_mode == "disabled":
                 raise ValueError(
                     f"No transcript available for this video and Whisper is disabled. "
@@ -84,18 +111,35 @@ class YouTubeProvider:
         def get_transcript():
             return api.fetch(video_id)
         
-        fetched_transcript = await loop.run_in_executor(
-            None,
-            get_transcript
-        )
+        async with self._host_slot(), stage_limiter.limit("fetch"):
+            fetched_transcript = await loop.run_in_executor(
+                None,
+                get_transcript
+            )
         
-        # Format transcript with timestamps
+        entries = [(snippet.start, snippet.text) for snippet in fetched_transcript.snippets]
+        transcript, timestamps = self._format_transcript(entries)
+        metadata = {
+            "has_timestamps": True,
+            "timestamps": timestamps,
+            "source": "youtube_api"
+        }
+        
+        return transcript, metadata
+    
+    def _format_transcript(self, entries: list[tuple[float, str]]) -> tuple[str, list[dict]]:
+        """Format transcript lines with [mm:ss] timestamps.
+        
+        Args:
+            entries: List of (start seconds, text)
+            
+        Returns:
+            Tuple of (transcript text, timestamps list)
+        """
         lines = []
         timestamps = []
         
-        for snippet in fetched_transcript.snippets:
-            start = snippet.start
-            text = snippet.text
+        for start, text in entries:
             minutes = int(start // 60)
             seconds = int(start % 60)
             timestamp = f"[{minutes:02d}:{seconds:02d}]"
@@ -107,14 +151,7 @@ class YouTubeProvider:
                 "text": text
             })
         
-        transcript = "\n".join(lines)
-        metadata = {
-            "has_timestamps": True,
-            "timestamps": timestamps,
-            "source": "youtube_api"
-        }
-        
-        return transcript, metadata
+        return "\n".join(lines), timestamps
     
     async def _get_transcript_whisper(self, video_id: str) -> tuple[str, dict]:
         """Get transcript using yt-dlp + Whisper.
@@ -126,32 +163,11 @@ class YouTubeProvider:
             Tuple of (transcript text, metadata dict)
         """
         with tempfile.TemporaryDirectory() as tmpdir:
-            audio_path = Path(tmpdir) / "audio.mp3"
-            
-            # Download audio with yt-dlp
+            # Smallest audio stream, stored as 16 kHz mono Opus
             logger.info(f"Downloading audio for video: {video_id}")
-            ydl_opts = {
-                'format': 'bestaudio/best',
-                'postprocessors': [{
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': 'mp3',
-                    'preferredquality': '192',
-                }],
-                'outtmpl': str(audio_path.with_suffix('')),
-                'quiet': True,
-                'no_warnings': True,
-                'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'extractor_args': {'youtube': {'player_client': ['android', 'web']}},
-            }
-            
-            loop = asyncio.get_event_loop()
             try:
-                await loop.run_in_executor(
-                    None,
-                    self._download_audio,
-                    video_id,
-                    ydl_opts
-                )
+                async with self._host_slot(), stage_limiter.limit("fetch"):
+                    audio_path = await audio_downloader.download(video_id, Path(tmpdir))
             except Exception as e:
                 logger.error(f"Failed to download audio: {e}")
                 raise ValueError(
@@ -159,72 +175,99 @@ class YouTubeProvider:
                     f"Try a different video or check if Whisper is properly configured."
                 ) from e
             
-            # Transcribe with Whisper
-            if self.whisper_mode == "local":
-                transcript = await self._transcribe_local(audio_path)
-            else:
-                transcript = await self._transcribe_openai(audio_path)
+            # Transcribe with Whisper (long audio is split and transcribed in parallel)
+            async with stage_limiter.limit("transcribe"):
+                if self.whisper_mode == "local":
+                    entries = await self._transcribe_local(audio_path)
+                else:
+                    entries = await self._transcribe_openai(audio_path)
             
+            transcript, timestamps = self._format_transcript(entries)
             metadata = {
-                "has_timestamps": False,
+                "has_timestamps": bool(timestamps),
+                "timestamps": timestamps,
                 "source": f"whisper_{self.whisper_mode}"
             }
             
             return transcript, metadata
     
-    def _download_audio(self, video_id: str, ydl_opts: dict) -> None:
-        """Download audio using yt-dlp (blocking)."""
-        url = f"https://www.youtube.com/watch?v={video_id}"
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            ydl.download([url])
-    
-    async def _transcribe_local(self, audio_path: Path) -> str:
+    async def _transcribe_local(self, audio_path: Path) -> list[tuple[float, str]]:
         """Transcribe audio using local Whisper model.
         
         Args:
             audio_path: Path to audio file
             
         Returns:
-            Transcribed text
+            List of (start seconds, text) segments
         """
-        import whisper
-        
         logger.info(f"Transcribing with local Whisper model: {self.whisper_model}")
         
-        loop = asyncio.get_event_loop()
-        model = await loop.run_in_executor(
-            None,
-            whisper.load_model,
-            self.whisper_model
+        segments = await audio_splitter.split(
+            audio_path,
+            target_seconds=self.segment_seconds,
+            max_seconds=self.segment_seconds * 1.5
         )
         
-        result = await loop.run_in_executor(
-            None,
-            model.transcribe,
-            str(audio_path)
-        )
+        # Runs on the dedicated pool where the model stays loaded
+        results = await whisper_pool.transcribe_many([str(path) for path, _ in segments])
         
-        return result["text"]
+        entries = []
+        for (_, offset), result in zip(segments, results):
+            for seg in result["segments"]:
+                entries.append((offset + seg["start"], seg["text"].strip()))
+        return entries
     
-    async def _transcribe_openai(self, audio_path: Path) -> str:
+    async def _transcribe_openai(self, audio_path: Path) -> list[tuple[float, str]]:
         """Transcribe audio using OpenAI Whisper API.
         
+        Segments are uploaded concurrently and sized to stay under the
+        API upload limit.
+        
         Args:
             audio_path: Path to audio file
             
         Returns:
-            Transcribed text
+            List of (start seconds, text) segments
         """
-        from openai import AsyncOpenAI
+        from ..llm import llm_factory
         
         logger.info("Transcribing with OpenAI Whisper API")
         
-        client = AsyncOpenAI(api_key=settings.openai_api_key)
+        client = llm_factory.get_base_client("openai").client
         
-        with open(audio_path, "rb") as audio_file:
-            response = await client.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_file
-            )
+        # Keep each upload under the limit at the file's average bitrate
+        duration = await audio_splitter.probe_duration(audio_path)
+        bytes_per_second = audio_path.stat().st_size / max(duration, 1.0)
+        max_seconds = min(self.segment_seconds * 1.5, OPENAI_UPLOAD_LIMIT / bytes_per_second)
+        segments = await audio_splitter.split(
+            audio_path,
+            target_seconds=min(self.segment_seconds, max_seconds * 0.8),
+            max_seconds=max_seconds
+        )
         
-        return response.text
+        semaphore = asyncio.Semaphore(settings.whisper_openai_concurrency)
+        
+        async def transcribe_segment(path: Path, offset: float) -> list[tuple[float, str]]:
+            async with semaphore:
+                with open(path, "rb") as audio_file:
+                    response = await client.audio.transcriptions.create(
+                        model="whisper-1",
+                        file=audio_file,
+                        response_format="verbose_json"
+                    )
+            
+            segments = getattr(response, "segments", None) or []
+            if not segments:
+                return [(offset, response.text.strip())]
+            return [
+                (offset + _segment_field(seg, "start"), _segment_field(seg, "text").strip())
+                for seg in segments
+            ]
+        
+        results = await asyncio.gather(*(transcribe_segment(path, offset) for path, offset in segments))
+        return [entry for result in results for entry in result]
+
+
+def _segment_field(segment, name: str):
+    """Read field from API segment (dict or object)."""
+    return segment[name] if isinstance(segment, dict) else getattr(segment, name)
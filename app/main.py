@@ -6,8 +6,11 @@ from fastapi.staticfiles import StaticFiles
 from loguru import logger
 
 from .config import settings
-from .web.routes import pages_router
-from .infra.cache import redis_cache
+from .web.routes import pages_router, jobs_router, batch_router, metrics_router
+from .infra.cache import redis_cache, summary_cache
+from .infra.llm import llm_factory
+from .infra.transcript import url_reader, whisper_pool, audio_downloader
+from .core.usecases import prompt_loader
 
 
 # Configure logging
@@ -36,12 +39,29 @@ async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
     logger.info("Application startup")
+    # Fails fast on invalid templates; requests only read the loaded registry
+    prompt_loader.load()
+    if settings.prompts_watch:
+        prompt_loader.start_watching(settings.prompts_watch_interval)
     await redis_cache.connect()
+    await summary_cache.start()
+    # Create the pooled LLM clients up front; they live until shutdown
+    llm_factory.get_client(settings.llm_default)
+    if settings.whisper_mode == "local" and settings.whisper_preload:
+        await whisper_pool.start()
+    if settings.metrics_enabled and not settings.metrics_token and not settings.is_dev:
+        logger.warning("METRICS_ENABLED is set without METRICS_TOKEN, /metrics is not served")
     
     yield
     
     # Shutdown
     logger.info("Application shutdown")
+    await prompt_loader.stop_watching()
+    await llm_factory.close()
+    await url_reader.close()
+    whisper_pool.close()
+    audio_downloader.close()
+    await summary_cache.close()
     await redis_cache.disconnect()
 
 
@@ -60,6 +80,9 @@ app.mount("/static", StaticFiles(directory="app/web/static"), name="static")
 
 # Include routers
 app.include_router(pages_router)
+app.include_router(jobs_router)
+app.include_router(batch_router)
+app.include_router(metrics_router)
 
 
 @app.get("/api/info")
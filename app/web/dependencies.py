@@ -1,39 +1,93 @@
 """Dependency injection for web layer."""
+from functools import partial
+from typing import Optional
+from ..config import settings
 from ..infra.llm import llm_factory
-from ..infra.transcript import URLReader, YouTubeProvider
-from ..infra.cache import redis_cache
-from ..core.usecases import SummarizeUseCase
+from ..infra.transcript import (
+    url_reader, YouTubeProvider, HostLimiter, input_normalizer, transcript_compactor
+)
+from ..infra.cache import summary_cache, single_flight, source_cache, similarity_index
+from ..infra.jobs import stage_limiter, StageLimitedLLMClient
+from ..infra.metrics import metrics
+from ..core.usecases import SummarizeUseCase, BatchSummarizeUseCase
 
 
 class TranscriptProviderAdapter:
-    """Adapter to combine URL and YouTube providers into single interface."""
+    """Adapter to combine URL and YouTube providers into single interface.
     
-    def __init__(self):
-        self.url_reader = URLReader()
-        self.youtube_provider = YouTubeProvider()
+    Extracted text is cached per source, so summarizing it again at another
+    detail level or with another model skips fetching and transcription.
+    An optional host limiter adds per-host politeness to upstream requests.
+    """
+    
+    def __init__(self, host_limiter: Optional[HostLimiter] = None):
+        self.url_reader = url_reader
+        self.youtube_provider = YouTubeProvider(host_limiter)
+        self.source_cache = source_cache
+        self.host_limiter = host_limiter
     
     async def from_url(self, url: str) -> str:
-        return await self.url_reader.from_url(url)
+        cached = await self.source_cache.get("url", url)
+        if cached:
+            return cached[0]
+        
+        text = await self.url_reader.from_url(url, self.host_limiter)
+        await self.source_cache.set("url", url, text, {})
+        return text
     
     async def from_youtube(self, video_id: str) -> tuple[str, dict]:
-        return await self.youtube_provider.from_youtube(video_id)
+        cached = await self.source_cache.get("youtube", video_id)
+        if cached:
+            return cached
+        
+        text, metadata = await self.youtube_provider.from_youtube(video_id)
+        await self.source_cache.set("youtube", video_id, text, metadata)
+        return text, metadata
 
 
-def get_summarize_usecase(model: str) -> SummarizeUseCase:
+def get_summarize_usecase(model: str, host_limiter: Optional[HostLimiter] = None) -> SummarizeUseCase:
     """Get SummarizeUseCase instance with dependencies.
     
     Args:
         model: LLM model string
+        host_limiter: Per-host politeness for transcript requests
         
     Returns:
         Configured SummarizeUseCase
     """
-    llm_client = llm_factory.get_client(model)
-    transcript_provider = TranscriptProviderAdapter()
-    cache_provider = redis_cache
+    llm_client = StageLimitedLLMClient(llm_factory.get_client(model), stage_limiter)
+    transcript_provider = TranscriptProviderAdapter(host_limiter)
+    cache_provider = summary_cache
     
     return SummarizeUseCase(
         llm_client=llm_client,
         transcript_provider=transcript_provider,
-        cache_provider=cache_provider
+        cache_provider=cache_provider,
+        coalescer=single_flight,
+        normalizer=input_normalizer,
+        similarity_index=similarity_index if settings.similarity_enabled else None,
+        flag_approximate=settings.similarity_flag_approximate,
+        compactor=transcript_compactor,
+        metrics=metrics,
+        chunk_max_chars=settings.summary_chunk_chars,
+        max_concurrency=settings.summary_max_concurrency
+    )
+
+
+def get_batch_usecase(default_model: str, max_concurrency: int | None = None) -> BatchSummarizeUseCase:
+    """Get BatchSummarizeUseCase instance with dependencies.
+    
+    Args:
+        default_model: LLM model string for items without one
+        max_concurrency: Items processed at once (defaults to settings)
+        
+    Returns:
+        Configured BatchSummarizeUseCase
+    """
+    # Politeness applies to page and YouTube requests of the batch, not to LLM calls
+    host_limiter = HostLimiter(settings.batch_per_host_concurrency, settings.batch_host_delay)
+    return BatchSummarizeUseCase(
+        usecase_factory=partial(get_summarize_usecase, host_limiter=host_limiter),
+        default_model=default_model,
+        max_concurrency=max_concurrency or settings.batch_max_concurrency
     )
@@ -1,4 +1,7 @@
 """Web routes."""
 from .pages import router as pages_router
+from .jobs import router as jobs_router
+from .batch import router as batch_router
+from .metrics import router as metrics_router
 
-__all__ = ["pages_router"]
+__all__ = ["pages_router", "jobs_router", "batch_router", "metrics_router"]
@@ -0,0 +1,44 @@
+"""Batch summarization API."""
+from fastapi import APIRouter, Request, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from loguru import logger
+
+from ...config import settings
+from ...core.entities import BatchItem
+from ..dependencies import get_batch_usecase
+from .pages import require_auth
+
+
+router = APIRouter()
+
+
+class BatchRequest(BaseModel):
+    """Batch of inputs to summarize."""
+    items: list[BatchItem]
+
+
+@router.post("/api/batch")
+async def summarize_batch(request: Request, batch: BatchRequest):
+    """Summarize a batch of inputs, streaming one JSON result per line.
+    
+    Results are written as items complete (not in input order); each
+    carries the item's index and id.
+    """
+    require_auth(request)
+    
+    if len(batch.items) > settings.batch_max_items:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many items ({len(batch.items)}, limit {settings.batch_max_items})"
+        )
+    
+    # Configured model unless the item asks for one
+    usecase = get_batch_usecase(settings.llm_default)
+    logger.info(f"Batch of {len(batch.items)} items started")
+    
+    async def result_lines():
+        async for result in usecase.run(batch.items):
+            yield result.model_dump_json() + "\n"
+    
+    return StreamingResponse(result_lines(), media_type="application/x-ndjson")
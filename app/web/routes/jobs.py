@@ -0,0 +1,132 @@
+"""Background job routes (enqueue, status polling, result)."""
+from fastapi import APIRouter, Request, Form, HTTPException
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from loguru import logger
+
+from ...config import settings
+from ...infra.cache import summary_cache
+from ...infra.i18n import locale_manager
+from ...infra.jobs import job_queue
+from ...core.entities import SummaryOptions, SummaryMode, DetailLevel, Job, JobStatus, SummaryResult
+from ..dependencies import get_summarize_usecase
+from .pages import templates, get_locale_from_request, get_translations, require_auth
+
+
+router = APIRouter()
+
+
+async def _get_job_result(job: Job) -> SummaryResult | None:
+    """Get summary of a finished job.
+    
+    Looked up by cache key, which outlives the history entry of the result
+    id; jobs finished before cache keys were recorded fall back to the id.
+    """
+    if job.cache_key:
+        result = await get_summarize_usecase(job.options.model).get_by_key(job.cache_key)
+        if result:
+            return result
+    return await summary_cache.get(job.result_id)
+
+
+@router.post("/jobs")
+async def create_job(
+    request: Request,
+    mode: str = Form(...),
+    input_data: str = Form(...),
+    detail: str = Form(...)
+):
+    """Enqueue summarization job and redirect to its status page."""
+    require_auth(request)
+    
+    # Without workers a queued job would never run
+    if not settings.jobs_enabled:
+        raise HTTPException(status_code=404)
+    
+    locale = get_locale_from_request(request)
+    
+    if not input_data or not input_data.strip():
+        context = {
+            "request": request,
+            "error": locale_manager.get("error_empty_input", locale),
+            **get_translations(request)
+        }
+        return templates.TemplateResponse("error.html", context, status_code=400)
+    
+    try:
+        # Configured model ("auto" routes between providers)
+        model = settings.llm_default
+        
+        options = SummaryOptions(
+            mode=SummaryMode(mode),
+            detail=DetailLevel(detail),
+            model=model,
+            locale=locale
+        )
+        job = await job_queue.enqueue(input_data, options)
+    except Exception as e:
+        logger.error(f"Error enqueuing job: {e}")
+        context = {
+            "request": request,
+            "error": str(e),
+            **get_translations(request)
+        }
+        return templates.TemplateResponse("error.html", context, status_code=503)
+    
+    return RedirectResponse(url=f"/jobs/{job.id}", status_code=303)
+
+
+@router.get("/jobs/{job_id}", response_class=HTMLResponse)
+async def job_page(request: Request, job_id: str):
+    """Job status page (polls the status endpoint until the job finishes)."""
+    require_auth(request)
+    
+    job = await job_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    if job.status == JobStatus.DONE:
+        result = await _get_job_result(job)
+        if not result:
+            raise HTTPException(status_code=404, detail="Summary not found")
+        return RedirectResponse(url=f"/summary/{result.id}", status_code=303)
+    
+    context = {
+        "request": request,
+        "job": job,
+        **get_translations(request)
+    }
+    return templates.TemplateResponse("job.html", context)
+
+
+@router.get("/api/jobs/{job_id}")
+async def job_status(request: Request, job_id: str):
+    """Get job status as JSON."""
+    require_auth(request)
+    
+    job = await job_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    return job.model_dump(mode="json")
+
+
+@router.get("/api/jobs/{job_id}/result")
+async def job_result(request: Request, job_id: str):
+    """Get job result as JSON (202 with status while the job is not done)."""
+    require_auth(request)
+    
+    job = await job_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    if job.status == JobStatus.FAILED:
+        raise HTTPException(status_code=500, detail=job.error)
+    if job.status != JobStatus.DONE:
+        return JSONResponse(job.model_dump(mode="json"), status_code=202)
+    
+    result = await _get_job_result(job)
+    if not result:
+        raise HTTPException(status_code=404, detail="Summary not found")
+    
+    return result.model_dump(mode="json")
+
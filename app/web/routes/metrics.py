@@ -0,0 +1,32 @@
+"""Prometheus metrics endpoint."""
+import secrets
+from fastapi import APIRouter, Request, HTTPException
+from fastapi.responses import Response
+
+from ...config import settings
+from ...infra.metrics import metrics
+
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def prometheus_metrics(request: Request):
+    """Export metrics for Prometheus.
+    
+    Not behind the login session; METRICS_TOKEN makes the scraper send a
+    bearer token. Outside development the endpoint is not served without
+    one.
+    """
+    if not settings.metrics_enabled or not metrics.enabled:
+        raise HTTPException(status_code=404)
+    if not settings.metrics_token and not settings.is_dev:
+        raise HTTPException(status_code=404)
+    
+    if settings.metrics_token:
+        expected = f"Bearer {settings.metrics_token}".encode()
+        if not secrets.compare_digest(request.headers.get("Authorization", "").encode(), expected):
+            raise HTTPException(status_code=401)
+    
+    body, content_type = metrics.render()
+    return Response(content=body, headers={"Content-Type": content_type})
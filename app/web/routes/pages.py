@@ -1,13 +1,14 @@
 """Page routes (SSR with Jinja2)."""
+import json
 from fastapi import APIRouter, Request, Form, Response, HTTPException
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from loguru import logger
 
 from ...config import settings
 from ...infra.auth import session_manager
 from ...infra.i18n import locale_manager
-from ...infra.cache import redis_cache
+from ...infra.cache import summary_cache
 from ...core.entities import SummaryOptions, SummaryMode, DetailLevel
 from ..dependencies import get_summarize_usecase
 
@@ -116,6 +117,7 @@ async def index(request: Request):
     context = {
         "request": request,
         "username": username,
+        "jobs_enabled": settings.jobs_enabled,
         **get_translations(request)
     }
     return templates.TemplateResponse("index.html", context)
@@ -142,8 +144,8 @@ async def summarize(
         return templates.TemplateResponse("error.html", context, status_code=400)
     
     try:
-        # Always use gpt-4o-mini
-        model = "openai:gpt-4o-mini"
+        # Configured model ("auto" routes between providers)
+        model = settings.llm_default
         
         # Parse options
         options = SummaryOptions(
@@ -177,13 +179,71 @@ async def summarize(
         return templates.TemplateResponse("error.html", context, status_code=500)
 
 
+def _sse_event(event: str, data) -> str:
+    """Format a Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post("/summarize/stream")
+async def summarize_stream(
+    request: Request,
+    mode: str = Form(...),
+    input_data: str = Form(...),
+    detail: str = Form(...)
+):
+    """Handle summarization request, streaming the summary as SSE.
+    
+    Emits `delta` events with markdown fragments, then a `done` event with
+    the summary id and approximate flag (or an `error` event).
+    """
+    require_auth(request)
+    
+    locale = get_locale_from_request(request)
+    
+    if not input_data or not input_data.strip():
+        raise HTTPException(status_code=400, detail=locale_manager.get("error_empty_input", locale))
+    
+    try:
+        # Configured model ("auto" routes between providers)
+        model = settings.llm_default
+        
+        options = SummaryOptions(
+            mode=SummaryMode(mode),
+            detail=DetailLevel(detail),
+            model=model,
+            locale=locale
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    usecase = get_summarize_usecase(model)
+    
+    async def event_stream():
+        try:
+            async for item in usecase.execute_stream(input_data, options):
+                if isinstance(item, str):
+                    yield _sse_event("delta", item)
+                else:
+                    logger.info(f"Summarization completed: {item.id}")
+                    yield _sse_event("done", {"id": item.id, "approximate": bool(item.meta.get("approximate"))})
+        except Exception as e:
+            logger.error(f"Summarization error: {e}")
+            yield _sse_event("error", {"message": str(e)})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/history", response_class=HTMLResponse)
 async def history(request: Request):
     """History page."""
     require_auth(request)
     
     # Get recent summaries
-    recent = await redis_cache.list_recent(settings.cache_max_items)
+    recent = await summary_cache.list_recent(settings.cache_max_items)
     
     context = {
         "request": request,
@@ -194,12 +254,12 @@ async def history(request: Request):
 
 
 @router.get("/summary/{summary_id}", response_class=HTMLResponse)
-async def view_summary(request: Request, summary_id: str):
-    """View a specific summary by ID."""
+async def view_summary(request: Request, summary_id: str, approximate: bool = False):
+    """View a specific summary by ID (approximate: reused for a similar text)."""
     require_auth(request)
     
     # Get summary from cache
-    result = await redis_cache.get(summary_id)
+    result = await summary_cache.get(summary_id)
     
     if not result:
         raise HTTPException(status_code=404, detail="Summary not found")
@@ -207,6 +267,7 @@ async def view_summary(request: Request, summary_id: str):
     context = {
         "request": request,
         "result": result,
+        "approximate": approximate,
         **get_translations(request)
     }
     return templates.TemplateResponse("result.html", context)
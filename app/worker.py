@@ -0,0 +1,145 @@
+"""Background worker processing summarization jobs.
+
+Run one or more worker processes next to the web app:
+
+    python -m app.worker
+"""
+import asyncio
+import os
+import signal
+import socket
+import sys
+from loguru import logger
+
+from .config import settings
+from .core.entities import Job, JobStatus
+from .core.usecases import prompt_loader
+from .infra.cache import redis_cache, summary_cache
+from .infra.jobs import job_queue
+from .infra.llm import llm_factory
+from .infra.metrics import metrics
+from .infra.transcript import url_reader, whisper_pool, audio_downloader
+from .web.dependencies import get_summarize_usecase
+
+
+logger.remove()
+logger.add(
+    sys.stderr,
+    format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}",
+    level="INFO" if settings.is_prod else "DEBUG",
+    serialize=settings.is_prod
+)
+
+
+class Worker:
+    """Takes jobs from the queue and runs them with bounded concurrency."""
+    
+    def __init__(self, concurrency: int | None = None):
+        self.concurrency = concurrency or settings.job_worker_concurrency
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self._tasks: set[asyncio.Task] = set()
+        self._stopping = asyncio.Event()
+    
+    def stop(self) -> None:
+        """Stop taking new jobs (running ones are finished)."""
+        logger.info("Worker stopping, finishing running jobs")
+        self._stopping.set()
+    
+    async def run(self) -> None:
+        """Process jobs until stopped."""
+        logger.info(f"Worker {self.consumer} started (concurrency {self.concurrency})")
+        
+        while not self._stopping.is_set():
+            free = self.concurrency - len(self._tasks)
+            if free <= 0:
+                await asyncio.wait(self._tasks, return_when=asyncio.FIRST_COMPLETED)
+                continue
+            
+            try:
+                claimed = await job_queue.claim(self.consumer, free, block_ms=2000)
+            except Exception as e:
+                logger.error(f"Error reading job queue: {e}")
+                await asyncio.sleep(1)
+                continue
+            
+            for message_id, job_id, input_data in claimed:
+                task = asyncio.create_task(self._process(message_id, job_id, input_data))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+        
+        if self._tasks:
+            await asyncio.wait(self._tasks)
+    
+    async def _heartbeat(self, message_id: str) -> None:
+        """Keep a running job from being claimed by another worker."""
+        while True:
+            await asyncio.sleep(job_queue.claim_idle / 3)
+            try:
+                await job_queue.touch(self.consumer, message_id)
+            except Exception as e:
+                logger.warning(f"Job heartbeat failed: {e}")
+    
+    async def _process(self, message_id: str, job_id: str, input_data: str) -> None:
+        """Run one job, record its outcome and remove it from the queue."""
+        heartbeat = asyncio.create_task(self._heartbeat(message_id))
+        try:
+            job = await job_queue.get(job_id)
+            if job is not None and not job.finished:
+                job = await job_queue.start(job)
+                if job is None:
+                    logger.error(f"Job {job_id} exceeded max attempts")
+                else:
+                    await self._run(job, input_data)
+            await job_queue.ack(message_id)
+        except Exception as e:
+            # Redis unavailable: the message stays pending and is claimed again later
+            logger.error(f"Error processing job {job_id}: {e}")
+        finally:
+            heartbeat.cancel()
+    
+    async def _run(self, job: Job, input_data: str) -> None:
+        """Summarize job input and store the result id or error."""
+        logger.info(f"Processing job {job.id} ({job.options.mode})")
+        try:
+            usecase = get_summarize_usecase(job.options.model)
+            result = await usecase.execute(input_data, job.options.model_copy())
+        except Exception as e:
+            logger.error(f"Job {job.id} failed: {e}")
+            await job_queue.update(job, status=JobStatus.FAILED, error=str(e))
+            return
+        
+        await job_queue.update(job, status=JobStatus.DONE, result_id=result.id, cache_key=result.input_fingerprint)
+        logger.info(f"Job {job.id} done: {result.id}")
+
+
+async def main() -> None:
+    """Worker process entry point."""
+    prompt_loader.load()
+    if settings.prompts_watch:
+        prompt_loader.start_watching(settings.prompts_watch_interval)
+    await redis_cache.connect()
+    await summary_cache.start()
+    if settings.whisper_mode == "local" and settings.whisper_preload:
+        await whisper_pool.start()
+    if settings.metrics_worker_port:
+        metrics.start_server(settings.metrics_worker_port)
+    
+    worker = Worker()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+    
+    try:
+        await worker.run()
+    finally:
+        await prompt_loader.stop_watching()
+        await llm_factory.close()
+        await url_reader.close()
+        whisper_pool.close()
+        audio_downloader.close()
+        await summary_cache.close()
+        await redis_cache.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,51 @@
+"""Shared test fixtures."""
+import os
+
+# Settings without defaults; tests never talk to real services
+os.environ.setdefault("APP_SECRET", "test-secret")
+os.environ.setdefault("APP_LOGIN_PASSWORD", "test-password")
+
+import fakeredis
+import pytest
+import redis.asyncio as aioredis
+
+from app.core.entities import SummaryOptions, SummaryResult
+from app.infra.cache.redis_cache import RedisCache, TimedRedis
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio only."""
+    return "asyncio"
+
+
+@pytest.fixture
+def make_result():
+    """Factory of text summary results."""
+    def make(result_id: str, content: str = "# Title\n\nSummary text") -> SummaryResult:
+        return SummaryResult(
+            id=result_id,
+            mode="text",
+            options=SummaryOptions(mode="text"),
+            input_fingerprint=f"fp-{result_id}",
+            content_md=content,
+        )
+    return make
+
+
+@pytest.fixture
+async def redis_cache(monkeypatch):
+    """Connected RedisCache on an in-memory Redis server (Lua included)."""
+    server = fakeredis.FakeServer()
+    
+    def from_url(cls, url, **kwargs):
+        pool = aioredis.ConnectionPool(
+            connection_class=fakeredis.aioredis.FakeConnection, server=server, **kwargs
+        )
+        return cls(connection_pool=pool)
+    
+    monkeypatch.setattr(TimedRedis, "from_url", classmethod(from_url))
+    cache = RedisCache("redis://test")
+    await cache.connect()
+    yield cache
+    await cache.disconnect()
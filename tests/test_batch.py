@@ -0,0 +1,71 @@
+"""Tests for batch summarization."""
+import asyncio
+import time
+
+import pytest
+
+from app.core.entities import BatchItem, SummaryMode
+from app.core.usecases.batch import BatchSummarizeUseCase, infer_mode
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize("value, mode", [
+    ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", SummaryMode.YOUTUBE),
+    ("youtu.be/dQw4w9WgXcQ", SummaryMode.YOUTUBE),
+    ("dQw4w9WgXcQ", SummaryMode.YOUTUBE),
+    ("  a_b-C1d2E3f \n", SummaryMode.YOUTUBE),
+    ("https://example.com/article", SummaryMode.URL),
+    ("dQw4w9WgXcQx", SummaryMode.TEXT),
+    ("hello world", SummaryMode.TEXT),
+    ("shortword", SummaryMode.TEXT),
+])
+def test_infer_mode(value, mode):
+    assert infer_mode(value) == mode
+
+
+class FakeUseCase:
+    """Summarize use case answering from a set of cached inputs."""
+    
+    def __init__(self, make_result, cached: set[str], work: float):
+        self.make_result = make_result
+        self.cached = cached
+        self.work = work
+    
+    async def get_cached(self, input_data, options):
+        if input_data in self.cached:
+            return self.make_result(f"cached-{input_data}")
+        return None
+    
+    async def execute(self, input_data, options):
+        await asyncio.sleep(self.work)
+        return self.make_result(f"new-{input_data}")
+
+
+async def collect(usecase: BatchSummarizeUseCase, items: list[BatchItem]) -> list:
+    return sorted([result async for result in usecase.run(items)], key=lambda result: result.index)
+
+
+async def test_items_of_one_host_are_not_serialized(make_result):
+    fake = FakeUseCase(make_result, cached=set(), work=0.2)
+    usecase = BatchSummarizeUseCase(lambda model: fake, default_model="openai:gpt-4o-mini", max_concurrency=4)
+    items = [BatchItem(input_data=f"video{i:06d}") for i in range(4)]
+    
+    started = time.monotonic()
+    results = await collect(usecase, items)
+    
+    # Politeness is left to the transcript provider, so only max_concurrency bounds items
+    assert time.monotonic() - started < 0.4
+    assert [result.status for result in results] == ["done"] * 4
+
+
+async def test_cached_items_skip_execute(make_result):
+    fake = FakeUseCase(make_result, cached={"known"}, work=0)
+    usecase = BatchSummarizeUseCase(lambda model: fake, default_model="openai:gpt-4o-mini", max_concurrency=2)
+    
+    results = await collect(usecase, [BatchItem(input_data="known"), BatchItem(input_data="fresh text")])
+    
+    assert [(result.status, result.summary_id) for result in results] == [
+        ("cached", "cached-known"),
+        ("done", "new-fresh text"),
+    ]
@@ -0,0 +1,108 @@
+"""Tests for text chunking and map-reduce condensing."""
+import re
+
+import pytest
+
+from app.core.entities import SummaryOptions
+from app.core.usecases.chunker import TextChunker
+from app.core.usecases.summarize import SummarizeUseCase
+
+
+def words(text: str) -> list[str]:
+    return text.split()
+
+
+def test_short_text_is_one_chunk():
+    assert TextChunker(100).split("  short text \n") == ["short text"]
+    assert TextChunker(100).split("   ") == []
+
+
+def test_chunks_keep_all_text_in_order():
+    paragraphs = [" ".join(f"p{p}w{w}." for w in range(30)) for p in range(20)]
+    text = "\n\n".join(paragraphs)
+    
+    chunks = TextChunker(500).split(text)
+    
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 500 for chunk in chunks)
+    assert words(" ".join(chunks)) == words(text)
+
+
+def test_timestamp_lines_are_never_split():
+    lines = [f"[{m:02d}:{s:02d}] " + " ".join(f"word{m}{s}{w}" for w in range(8)) for m in range(10) for s in (0, 30)]
+    text = "\n".join(lines)
+    
+    chunks = TextChunker(300).split(text)
+    
+    assert len(chunks) > 1
+    for chunk in chunks:
+        for line in chunk.split("\n"):
+            assert re.match(r"^\[\d\d:\d\d\] ", line)
+            assert line in lines
+
+
+def test_long_line_falls_back_to_sentences_and_words():
+    text = "First sentence is here. " * 40 + "x" * 10
+    
+    chunks = TextChunker(100).split(text.strip())
+    
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert words(" ".join(chunks)) == words(text)
+
+
+def test_line_without_boundaries_is_hard_split():
+    text = "a" * 250
+    
+    chunks = TextChunker(100).split(text)
+    
+    assert chunks == ["a" * 100, "a" * 100, "a" * 50]
+
+
+def test_rejects_non_positive_size():
+    with pytest.raises(ValueError):
+        TextChunker(0)
+
+
+class FakeLLM:
+    """LLM client returning a fixed fraction of its input."""
+    
+    def __init__(self, ratio: float):
+        self.ratio = ratio
+        self.calls: list[str] = []
+    
+    async def summarize(self, text, options, prompt_template) -> str:
+        self.calls.append(text)
+        return text[:max(int(len(text) * self.ratio), 1)]
+
+
+def make_usecase(llm: FakeLLM, chunk_max_chars: int) -> SummarizeUseCase:
+    return SummarizeUseCase(llm_client=llm, transcript_provider=None, cache_provider=None, chunk_max_chars=chunk_max_chars)
+
+
+@pytest.mark.anyio
+async def test_condense_leaves_short_text_alone():
+    llm = FakeLLM(0.1)
+    
+    assert await make_usecase(llm, 1000)._condense("short", SummaryOptions(mode="text")) == "short"
+    assert llm.calls == []
+
+
+@pytest.mark.anyio
+async def test_condense_fits_one_chunk():
+    llm = FakeLLM(0.3)
+    text = "\n\n".join("word " * 40 for _ in range(50))
+    
+    condensed = await make_usecase(llm, 500)._condense(text, SummaryOptions(mode="text"))
+    
+    assert len(condensed) <= 500
+    assert len(llm.calls) > 1
+
+
+@pytest.mark.anyio
+async def test_condense_fits_one_chunk_when_summaries_do_not_shrink():
+    llm = FakeLLM(1.0)
+    text = "\n\n".join("word " * 40 for _ in range(50))
+    
+    condensed = await make_usecase(llm, 500)._condense(text, SummaryOptions(mode="text"))
+    
+    assert len(condensed) <= 500
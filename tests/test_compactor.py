@@ -0,0 +1,101 @@
+"""Tests for transcript compaction and token counting."""
+from app.infra.llm import tokenizer
+from app.infra.transcript.compactor import TranscriptCompactor, build_blocks
+
+
+class FakeCounter:
+    """Counts a token per four characters in a fixed context window."""
+    
+    def __init__(self, context: int):
+        self.context = context
+    
+    def count(self, text: str, model: str) -> int:
+        return len(text) // 4
+    
+    def context_tokens(self, model: str) -> int:
+        return self.context
+
+
+def captions(seconds: int, step: int = 2) -> dict:
+    snippets = [
+        {"time": float(start), "text": f"word{start} next{start}."}
+        for start in range(0, seconds, step)
+    ]
+    return {"timestamps": snippets}
+
+
+def test_build_blocks_drops_rolling_caption_overlap():
+    entries = [(0.0, "we talk about"), (1.0, "talk about caching"), (2.0, "about caching today.")]
+    
+    assert build_blocks(entries, block_seconds=30) == [(0.0, "we talk about caching today.")]
+
+
+def test_build_blocks_splits_at_sentence_after_block_length():
+    entries = [(0.0, "first part."), (31.0, "second part.")]
+    
+    assert build_blocks(entries, block_seconds=30) == [(0.0, "first part."), (31.0, "second part.")]
+
+
+def test_keeps_short_blocks_when_transcript_fits():
+    compactor = TranscriptCompactor(FakeCounter(100_000), block_seconds=30, max_block_seconds=240,
+                                    reserved_tokens=0, chunk_max_chars=100_000)
+    
+    _, metadata = compactor.compact("", captions(600), "openai:test")
+    
+    assert len(metadata["timestamps"]) == 20
+
+
+def test_grows_blocks_to_fit_context():
+    compactor = TranscriptCompactor(FakeCounter(1370), block_seconds=30, max_block_seconds=240,
+                                    reserved_tokens=100, chunk_max_chars=100_000)
+    
+    _, metadata = compactor.compact("", captions(600), "openai:test")
+    
+    assert metadata["compacted_tokens"] <= 1270
+    assert len(metadata["timestamps"]) == 10
+
+
+def test_grows_blocks_to_fit_chunk_size_of_large_context_models():
+    compactor = TranscriptCompactor(FakeCounter(1_000_000), block_seconds=30, max_block_seconds=240,
+                                    reserved_tokens=0, chunk_max_chars=5100)
+    
+    text, metadata = compactor.compact("", captions(600), "openai:test")
+    
+    assert len(text) <= 5100
+    assert len(metadata["timestamps"]) == 10
+
+
+def test_stops_at_max_block_length():
+    compactor = TranscriptCompactor(FakeCounter(10), block_seconds=30, max_block_seconds=60,
+                                    reserved_tokens=0, chunk_max_chars=100_000)
+    
+    _, metadata = compactor.compact("", captions(600), "openai:test")
+    
+    assert len(metadata["timestamps"]) == 10
+
+
+def test_failed_encoding_load_is_retried(monkeypatch):
+    loads = []
+    
+    class FakeTiktoken:
+        @staticmethod
+        def get_encoding(name):
+            loads.append(name)
+            if len(loads) == 1:
+                raise OSError("download failed")
+            return "encoding"
+    
+    now = 1000.0
+    monkeypatch.setattr(tokenizer, "tiktoken", FakeTiktoken)
+    monkeypatch.setattr(tokenizer, "_encodings", {})
+    monkeypatch.setattr(tokenizer, "_retry_at", {})
+    monkeypatch.setattr(tokenizer.time, "monotonic", lambda: now)
+    
+    assert tokenizer._encoding("o200k_base") is None
+    assert tokenizer._encoding("o200k_base") is None
+    assert len(loads) == 1
+    
+    now += tokenizer._RETRY_SECONDS
+    assert tokenizer._encoding("o200k_base") == "encoding"
+    assert tokenizer._encoding("o200k_base") == "encoding"
+    assert len(loads) == 2
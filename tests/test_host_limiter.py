@@ -0,0 +1,146 @@
+"""Tests for per-host request politeness."""
+import asyncio
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.infra.transcript import HostLimiter, URLReader, YouTubeProvider
+from app.infra.transcript import youtube_provider as youtube_module
+
+pytestmark = pytest.mark.anyio
+
+PAGE = "<html><head><title>Page</title></head><body><article><p>{}</p></article></body></html>"
+
+
+class Recorder:
+    """Records request start times and the most requests running at once."""
+    
+    def __init__(self, work: float = 0.05):
+        self.work = work
+        self.starts: list[float] = []
+        self.running = 0
+        self.max_running = 0
+    
+    async def run(self) -> None:
+        self.starts.append(time.monotonic())
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.work)
+        finally:
+            self.running -= 1
+
+
+def gaps(starts: list[float]) -> list[float]:
+    starts = sorted(starts)
+    return [b - a for a, b in zip(starts, starts[1:])]
+
+
+async def test_slot_limits_concurrency_per_host():
+    limiter = HostLimiter(2)
+    recorder = Recorder()
+    
+    async def request(host: str) -> None:
+        async with limiter.slot(host):
+            await recorder.run()
+    
+    await asyncio.gather(*(request("a.example") for _ in range(6)))
+    
+    assert recorder.max_running == 2
+
+
+async def test_slot_spaces_starts_of_same_host():
+    limiter = HostLimiter(4, delay=0.1)
+    recorder = Recorder(work=0)
+    
+    async def request() -> None:
+        async with limiter.slot("a.example"):
+            await recorder.run()
+    
+    await asyncio.gather(*(request() for _ in range(3)))
+    
+    assert all(gap >= 0.09 for gap in gaps(recorder.starts))
+
+
+async def test_hosts_do_not_wait_for_each_other():
+    limiter = HostLimiter(1, delay=0.5)
+    
+    async with limiter.slot("a.example"):
+        started = time.monotonic()
+        async with limiter.slot("b.example"):
+            pass
+    
+    assert time.monotonic() - started < 0.1
+
+
+async def test_idle_host_is_forgotten_after_delay():
+    limiter = HostLimiter(1, delay=0.05)
+    
+    async with limiter.slot("a.example"):
+        pass
+    assert "a.example" in limiter._hosts
+    
+    await asyncio.sleep(0.1)
+    assert limiter._hosts == {}
+
+
+async def test_idle_host_without_delay_is_forgotten_at_once():
+    limiter = HostLimiter(1)
+    
+    async with limiter.slot("a.example"):
+        pass
+    
+    assert limiter._hosts == {}
+
+
+@pytest.fixture
+def reader():
+    """URLReader whose requests are answered in-process."""
+    recorder = Recorder()
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await recorder.run()
+        return httpx.Response(200, text=PAGE.format("Article body " * 20))
+    
+    reader = URLReader()
+    reader.extract_workers = 0
+    reader._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    reader.recorder = recorder
+    return reader
+
+
+async def test_url_reader_applies_extra_host_limiter(reader):
+    limiter = HostLimiter(1, delay=0.1)
+    
+    texts = await asyncio.gather(*(
+        reader.from_url(f"https://a.example/{i}", host_limiter=limiter) for i in range(3)
+    ))
+    
+    assert all("Article body" in text for text in texts)
+    assert reader.recorder.max_running == 1
+    assert all(gap >= 0.09 for gap in gaps(reader.recorder.starts))
+
+
+async def test_url_reader_without_extra_limiter_is_not_spaced(reader):
+    await asyncio.gather(*(reader.from_url(f"https://a.example/{i}") for i in range(3)))
+    
+    assert reader.recorder.max_running > 1
+
+
+async def test_youtube_provider_spaces_caption_requests(monkeypatch):
+    starts: list[float] = []
+    
+    class FakeTranscriptApi:
+        def fetch(self, video_id: str):
+            starts.append(time.monotonic())
+            return SimpleNamespace(snippets=[SimpleNamespace(start=0.0, text=video_id)])
+    
+    monkeypatch.setattr(youtube_module, "YouTubeTranscriptApi", FakeTranscriptApi)
+    provider = YouTubeProvider(HostLimiter(1, delay=0.1))
+    
+    results = await asyncio.gather(*(provider.from_youtube(f"video{i:06d}") for i in range(3)))
+    
+    assert [metadata["source"] for _, metadata in results] == ["youtube_api"] * 3
+    assert all(gap >= 0.09 for gap in gaps(starts))
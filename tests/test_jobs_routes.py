@@ -0,0 +1,67 @@
+"""Tests for the background job routes."""
+import httpx
+import pytest
+
+from app.config import settings
+from app.core.entities import Job, JobStatus, SummaryOptions
+from app.core.usecases.summarize import SummarizeUseCase
+from app.main import app
+from app.web.routes import jobs
+from app.web.routes.pages import session_manager
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeLLM:
+    """LLM client answering with a numbered summary."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    async def summarize(self, text, options, prompt_template) -> str:
+        self.calls += 1
+        return f"# Summary {self.calls}"
+
+
+@pytest.fixture
+async def client():
+    transport = httpx.ASGITransport(app=app)
+    cookies = {settings.session_cookie_name: session_manager.create_session("admin")}
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", cookies=cookies) as client:
+        yield client
+
+
+async def test_create_job_is_not_served_without_workers(client, monkeypatch):
+    monkeypatch.setattr(settings, "jobs_enabled", False)
+    
+    response = await client.post("/jobs", data={"mode": "text", "input_data": "text", "detail": "medium"})
+    
+    assert response.status_code == 404
+
+
+async def test_finished_job_resolves_trimmed_result_by_cache_key(client, monkeypatch, redis_cache):
+    redis_cache.max_items = 2
+    usecase = SummarizeUseCase(llm_client=FakeLLM(), transcript_provider=None, cache_provider=redis_cache)
+    options = SummaryOptions(mode="text")
+    first = await usecase.execute("first text", options)
+    await usecase.execute("second text", options)
+    await usecase.execute("third text", options)
+    assert await redis_cache.get(first.id) is None
+    
+    job = Job(id="job-1", status=JobStatus.DONE, options=options, result_id=first.id, cache_key=first.input_fingerprint)
+    
+    async def get_job(job_id):
+        return job if job_id == job.id else None
+    
+    monkeypatch.setattr(jobs.job_queue, "get", get_job)
+    monkeypatch.setattr(jobs, "get_summarize_usecase", lambda model: usecase)
+    monkeypatch.setattr(jobs, "summary_cache", redis_cache)
+    
+    response = await client.get("/api/jobs/job-1/result")
+    assert response.status_code == 200
+    assert response.json()["id"] == first.id
+    
+    response = await client.get("/jobs/job-1")
+    assert response.status_code == 303
+    assert response.headers["location"] == f"/summary/{first.id}"
+    assert await redis_cache.get(first.id) is not None
@@ -0,0 +1,35 @@
+"""Tests for LLM client construction."""
+import pytest
+
+from app.config import settings
+from app.infra.llm.anthropic_client import AnthropicClient
+from app.infra.llm.factory import LLMFactory
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_http_client_waits_for_long_responses():
+    client = LLMFactory()._build_http_client()
+    try:
+        assert client.timeout.connect == settings.llm_connect_timeout == 10.0
+        assert client.timeout.read == settings.llm_read_timeout == 600.0
+    finally:
+        await client.aclose()
+
+
+async def test_provider_client_uses_configured_timeout():
+    factory = LLMFactory()
+    try:
+        client = factory.get_base_client("anthropic")
+        assert client.client.timeout.read == settings.llm_read_timeout
+    finally:
+        await factory.close()
+
+
+async def test_anthropic_default_client_has_configured_timeout():
+    client = AnthropicClient(api_key="test")
+    try:
+        assert client.client.timeout.read == settings.llm_read_timeout
+        assert client.client.timeout.connect == settings.llm_connect_timeout
+    finally:
+        await client.close()
@@ -0,0 +1,63 @@
+"""Tests for canonical input forms (they decide the cache keys)."""
+import pytest
+
+from app.core.entities import SummaryMode
+from app.infra.transcript.normalizer import CanonicalInputNormalizer, canonicalize_url, fold_whitespace
+
+
+@pytest.mark.parametrize("url", [
+    "https://example.com/post",
+    "https://example.com/post/",
+    "HTTPS://Example.COM/post",
+    "https://example.com:443/post",
+    "https://example.com/post#comments",
+    "https://example.com/post?utm_source=x&utm_medium=y",
+    "https://example.com/post?fbclid=abc&gclid=def",
+    "  https://example.com/post/#top  ",
+])
+def test_equivalent_urls_share_one_form(url):
+    assert canonicalize_url(url) == "https://example.com/post"
+
+
+def test_url_keeps_meaningful_query_sorted():
+    assert canonicalize_url("https://example.com/p?b=2&utm_campaign=x&a=1") == "https://example.com/p?a=1&b=2"
+
+
+def test_url_keeps_non_default_port_and_path_case():
+    assert canonicalize_url("http://Example.com:8080/Post/") == "http://example.com:8080/Post"
+
+
+@pytest.mark.parametrize("text", [
+    "Hello world.\n\nSecond paragraph.",
+    "Hello   world.\n\nSecond\tparagraph.",
+    "  Hello world.  \r\n\r\n\r\nSecond paragraph.\n",
+    "Hello world. \n \n \nSecond  paragraph.",
+])
+def test_whitespace_variants_fold_to_one_form(text):
+    assert fold_whitespace(text) == "Hello world.\n\nSecond paragraph."
+
+
+def test_single_line_breaks_are_kept():
+    assert fold_whitespace("line one\nline two") == "line one\nline two"
+
+
+@pytest.mark.parametrize("url", [
+    "dQw4w9WgXcQ",
+    " dQw4w9WgXcQ ",
+    "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+    "https://youtube.com/watch?feature=share&v=dQw4w9WgXcQ&t=42",
+    "https://youtu.be/dQw4w9WgXcQ",
+    "https://youtu.be/dQw4w9WgXcQ?si=tracking",
+    "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+    "https://www.youtube.com/embed/dQw4w9WgXcQ",
+    "https://m.youtube.com/watch?v=dQw4w9WgXcQ#t=10",
+])
+def test_video_links_normalize_to_id(url):
+    assert CanonicalInputNormalizer().normalize(url, SummaryMode.YOUTUBE) == "dQw4w9WgXcQ"
+
+
+def test_normalize_dispatches_by_mode():
+    normalizer = CanonicalInputNormalizer()
+    
+    assert normalizer.normalize("https://Example.com/a/", SummaryMode.URL) == "https://example.com/a"
+    assert normalizer.normalize("a  b", SummaryMode.TEXT) == "a b"
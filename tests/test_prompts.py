@@ -0,0 +1,74 @@
+"""Tests for prompt template parsing and the prompt registry."""
+from pathlib import Path
+
+import pytest
+
+from app.core.entities import DetailLevel, PromptTemplate, SummaryMode
+from app.core.usecases.prompt_loader import PromptLoader
+
+
+def test_parse_splits_instructions_from_content_paragraph():
+    template = PromptTemplate.parse("Summarize briefly.\nUse bullets.\n\nTranscript:\n{content}\n")
+    
+    assert template.instructions == "Summarize briefly.\nUse bullets."
+    assert template.content_template == "Transcript:\n{content}"
+    assert template.render("text") == "Transcript:\ntext"
+
+
+def test_parse_without_paragraph_break_keeps_everything_as_instructions():
+    template = PromptTemplate.parse("Summarize: {content}")
+    
+    assert template.instructions == "Summarize:"
+    assert template.content_template == "{content}"
+
+
+@pytest.mark.parametrize("text, message", [
+    ("Summarize the text.", "exactly once"),
+    ("Summarize {content}.\n\nAgain: {content}", "exactly once"),
+    ("Summarize:\n\n{content}\n\nAnswer in English.", "last paragraph"),
+])
+def test_parse_rejects_invalid_placeholder(text, message):
+    with pytest.raises(ValueError, match=message):
+        PromptTemplate.parse(text)
+
+
+def write_prompt(root, locale: str, name: str, text: str) -> None:
+    (root / locale).mkdir(exist_ok=True)
+    (root / locale / f"{name}.txt").write_text(text, encoding="utf-8")
+
+
+def test_missing_locale_prompt_falls_back_to_english(tmp_path):
+    write_prompt(tmp_path, "en", "text_short", "English rules.\n\n{content}")
+    write_prompt(tmp_path, "ru", "text_long", "Russian rules.\n\n{content}")
+    loader = PromptLoader(str(tmp_path))
+    
+    assert loader.load_prompt(SummaryMode.TEXT, DetailLevel.LONG, "ru").instructions == "Russian rules."
+    assert loader.load_prompt(SummaryMode.TEXT, DetailLevel.SHORT, "ru").instructions == "English rules."
+    assert loader.load_prompt(SummaryMode.TEXT, DetailLevel.SHORT, "de").instructions == "English rules."
+
+
+def test_missing_english_prompt_falls_back_to_default(tmp_path):
+    write_prompt(tmp_path, "ru", "url_short", "Russian rules.\n\n{content}")
+    loader = PromptLoader(str(tmp_path))
+    
+    default = PromptTemplate.parse(loader._get_default_prompt("url", "medium"))
+    assert loader.load_prompt(SummaryMode.URL, DetailLevel.MEDIUM, "ru") == default
+    assert loader.load_prompt(SummaryMode.URL, DetailLevel.MEDIUM, "en") == default
+    assert "brief" in loader.load_prompt(SummaryMode.URL, DetailLevel.SHORT, "en").instructions
+
+
+def test_invalid_template_file_fails_load(tmp_path):
+    write_prompt(tmp_path, "en", "text_short", "Summarize:\n\n{content}\n\nBe brief.")
+    loader = PromptLoader(str(tmp_path))
+    
+    with pytest.raises(ValueError, match="text_short.txt"):
+        loader.load()
+
+
+def test_shipped_prompts_are_valid():
+    loader = PromptLoader(str(Path(__file__).parent.parent / "prompts"))
+    loader.load()
+    
+    for mode in SummaryMode:
+        for detail in DetailLevel:
+            assert "{content}" in loader.load_prompt(mode, detail, "ru").content_template
@@ -0,0 +1,154 @@
+"""Tests for the Redis summary cache and its Lua scripts."""
+import asyncio
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_set_indexes_history_and_reads_back(redis_cache, make_result):
+    await redis_cache.set("a", make_result("a", "# First"), add_to_history=True)
+    await redis_cache.set("b", make_result("b", "# Second"), add_to_history=True)
+    
+    assert (await redis_cache.get("a")).content_md == "# First"
+    recent = await redis_cache.list_recent(10)
+    assert [preview.id for preview in recent] == ["b", "a"]
+    assert recent[0].title == "Second"
+
+
+async def test_set_without_history_is_not_listed(redis_cache, make_result):
+    await redis_cache.set("hash", make_result("x"), add_to_history=False)
+    
+    assert await redis_cache.get("hash") is not None
+    assert await redis_cache.list_recent(10) == []
+
+
+async def test_set_evicts_oldest_beyond_limit_atomically(redis_cache, make_result):
+    redis_cache.max_items = 3
+    client = await redis_cache.get_client()
+    pubsub = client.pubsub()
+    await pubsub.subscribe(redis_cache.invalidate_channel)
+    
+    for index in range(5):
+        await redis_cache.set(f"id{index}", make_result(f"id{index}", f"# Summary {index}"), add_to_history=True)
+    
+    assert [preview.id for preview in await redis_cache.list_recent(10)] == ["id4", "id3", "id2"]
+    assert await redis_cache.get("id0") is None
+    assert await redis_cache.get("id1") is None
+    assert await client.hlen(redis_cache.previews_hash_key) == 3
+    
+    evicted = []
+    for _ in range(5):
+        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=0.1)
+        if message is not None:
+            evicted.extend(message["data"].split(","))
+    assert evicted == ["id0", "id1"]
+    await pubsub.aclose()
+
+
+async def test_trim_to_limit(redis_cache, make_result):
+    for index in range(4):
+        await redis_cache.set(f"id{index}", make_result(f"id{index}", f"# Summary {index}"), add_to_history=True)
+    
+    await redis_cache.trim_to_limit(2)
+    
+    assert [preview.id for preview in await redis_cache.list_recent(10)] == ["id3", "id2"]
+    assert await redis_cache.get("id0") is None
+
+
+async def test_delete_removes_entry_and_history(redis_cache, make_result):
+    await redis_cache.set("a", make_result("a"), add_to_history=True)
+    
+    await redis_cache.delete("a")
+    
+    assert await redis_cache.get("a") is None
+    assert await redis_cache.list_recent(10) == []
+
+
+async def test_ttl_applies_to_entries_outside_history(redis_cache, make_result):
+    client = await redis_cache.get_client()
+    
+    await redis_cache.set("dedup", make_result("x"), ttl=100)
+    await redis_cache.set("kept", make_result("y"), add_to_history=True)
+    
+    assert 0 < await client.ttl("summary:dedup") <= 100
+    assert await client.ttl("summary:kept") == -1
+
+
+async def test_concurrent_sets_keep_history_within_limit(redis_cache, make_result):
+    redis_cache.max_items = 5
+    
+    await asyncio.gather(*(
+        redis_cache.set(f"id{index}", make_result(f"id{index}", f"# Summary {index}"), add_to_history=True)
+        for index in range(20)
+    ))
+    
+    client = await redis_cache.get_client()
+    assert await client.zcard(redis_cache.recent_zset_key) == 5
+    assert await client.hlen(redis_cache.previews_hash_key) == 5
+    assert len(await redis_cache.list_recent(10)) == 5
+
+
+async def blob_keys(redis_cache) -> list[str]:
+    client = await redis_cache.get_client()
+    return [key async for key in client.scan_iter("summary:blob:*")]
+
+
+async def test_identical_entries_share_one_blob(redis_cache, make_result):
+    result = make_result("a")
+    
+    await redis_cache.set("a", result, add_to_history=True)
+    await redis_cache.set("hash-a", result, ttl=100)
+    
+    assert len(await blob_keys(redis_cache)) == 1
+    assert (await redis_cache.get("a")).content_md == result.content_md
+    assert (await redis_cache.get("hash-a")).content_md == result.content_md
+
+
+async def test_blob_outlives_deleted_alias(redis_cache, make_result):
+    result = make_result("a")
+    await redis_cache.set("a", result, add_to_history=True)
+    await redis_cache.set("hash-a", result)
+    
+    await redis_cache.delete("a")
+    
+    assert await redis_cache.get("a") is None
+    assert (await redis_cache.get("hash-a")).id == "a"
+    assert len(await blob_keys(redis_cache)) == 1
+    
+    await redis_cache.delete("hash-a")
+    
+    assert await blob_keys(redis_cache) == []
+    client = await redis_cache.get_client()
+    assert [key async for key in client.scan_iter("summary:refs:*")] == []
+
+
+async def test_overwrite_releases_previous_blob(redis_cache, make_result):
+    await redis_cache.set("a", make_result("a", "# Old"))
+    await redis_cache.set("a", make_result("a", "# New"))
+    
+    assert len(await blob_keys(redis_cache)) == 1
+    assert (await redis_cache.get("a")).content_md == "# New"
+
+
+async def test_blob_expires_with_longest_lived_alias(redis_cache, make_result):
+    client = await redis_cache.get_client()
+    result = make_result("a")
+    
+    await redis_cache.set("short", result, ttl=100)
+    await redis_cache.set("long", result, ttl=1000)
+    [blob_key] = await blob_keys(redis_cache)
+    assert 100 < await client.ttl(blob_key) <= 1000
+    
+    await redis_cache.set("kept", result)
+    assert await client.ttl(blob_key) == -1
+
+
+async def test_get_many_resolves_shared_blob(redis_cache, make_result):
+    result = make_result("a")
+    await redis_cache.set("a", result)
+    await redis_cache.set("hash-a", result)
+    
+    found = await redis_cache.get_many(["a", "hash-a", "missing"])
+    
+    assert [entry.id if entry else None for entry in found] == ["a", "a", None]
@@ -0,0 +1,144 @@
+"""Tests for LLM rate limiting, retries and circuit breaking."""
+import asyncio
+
+import httpx
+import pytest
+
+from app.infra.llm.resilience import CircuitBreaker, RedisRateLimiter, ResilientLLMClient
+
+pytestmark = pytest.mark.anyio
+
+
+def http_error(status: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://llm.test")
+    return httpx.HTTPStatusError("error", request=request, response=httpx.Response(status, request=request))
+
+
+class FakeClient:
+    """LLM client answering with queued outcomes."""
+    
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+    
+    def estimate_tokens(self, text, options, prompt_template) -> int:
+        return 1
+    
+    async def summarize(self, text, options, prompt_template) -> str:
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class OpenLimiter:
+    """Rate limiter that never waits."""
+    
+    async def acquire(self, tokens: int) -> None:
+        pass
+    
+    async def throttle(self, seconds: float) -> None:
+        pass
+
+
+class BlockingLimiter(OpenLimiter):
+    """Rate limiter that waits until cancelled."""
+    
+    def __init__(self):
+        self.entered = asyncio.Event()
+    
+    async def acquire(self, tokens: int) -> None:
+        self.entered.set()
+        await asyncio.Event().wait()
+
+
+def make_client(client, breaker=None, limiter=None, max_retries: int = 2) -> ResilientLLMClient:
+    return ResilientLLMClient(
+        client,
+        limiter=limiter or OpenLimiter(),
+        breaker=breaker or CircuitBreaker(threshold=5, cooldown=60),
+        max_retries=max_retries,
+        backoff_base=0.001,
+        backoff_max=0.001
+    )
+
+
+def test_breaker_opens_at_threshold_and_lets_one_trial_through():
+    breaker = CircuitBreaker(threshold=2, cooldown=0)
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+    
+    breaker.before_call()
+    with pytest.raises(RuntimeError):
+        breaker.before_call()
+    
+    breaker.record_success()
+    breaker.before_call()
+    breaker.before_call()
+
+
+def test_breaker_rejects_during_cooldown():
+    breaker = CircuitBreaker(threshold=1, cooldown=60)
+    breaker.record_failure()
+    
+    assert breaker.is_open
+    with pytest.raises(RuntimeError):
+        breaker.before_call()
+
+
+async def test_retries_retryable_errors():
+    client = FakeClient(http_error(503), http_error(429), "summary")
+    
+    assert await make_client(client).summarize("text", None, None) == "summary"
+    assert client.calls == 3
+
+
+async def test_does_not_retry_client_errors():
+    client = FakeClient(http_error(400), "summary")
+    
+    with pytest.raises(httpx.HTTPStatusError):
+        await make_client(client).summarize("text", None, None)
+    assert client.calls == 1
+
+
+async def test_gives_up_after_max_retries():
+    client = FakeClient(*(http_error(503) for _ in range(3)))
+    
+    with pytest.raises(httpx.HTTPStatusError):
+        await make_client(client, max_retries=2).summarize("text", None, None)
+    assert client.calls == 3
+
+
+async def test_cancelled_trial_during_acquire_frees_breaker():
+    breaker = CircuitBreaker(threshold=1, cooldown=0)
+    breaker.record_failure()
+    limiter = BlockingLimiter()
+    task = asyncio.create_task(make_client(FakeClient(), breaker, limiter).summarize("text", None, None))
+    await limiter.entered.wait()
+    
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    
+    # The next call becomes the trial instead of being rejected for good
+    assert await make_client(FakeClient("summary"), breaker).summarize("text", None, None) == "summary"
+    assert not breaker.is_open
+
+
+async def test_rate_limiter_waits_for_budget(redis_cache):
+    limiter = RedisRateLimiter(redis_cache, "test", rpm=2, tpm=0)
+    
+    await limiter.acquire(1)
+    await limiter.acquire(1)
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(limiter.acquire(1), timeout=0.2)
+
+
+async def test_rate_limiter_counts_tokens(redis_cache):
+    limiter = RedisRateLimiter(redis_cache, "test", rpm=0, tpm=1000)
+    
+    await limiter.acquire(900)
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(limiter.acquire(200), timeout=0.2)
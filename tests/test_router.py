@@ -0,0 +1,142 @@
+"""Tests for latency aware LLM routing and hedging."""
+import asyncio
+
+import pytest
+
+from app.core.entities import SummaryOptions
+from app.infra.llm.resilience import CircuitBreaker
+from app.infra.llm.router import LLMRouter
+
+pytestmark = pytest.mark.anyio
+
+SHORT = SummaryOptions(mode="text", detail="short")
+
+
+class FakeModel:
+    """LLM client answering after a delay, or failing."""
+    
+    def __init__(self, name: str, delay: float = 0.0, error: BaseException | None = None):
+        self.name = name
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.closed_streams = 0
+    
+    async def summarize(self, text, options, prompt_template) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.name
+    
+    async def summarize_stream(self, text, options, prompt_template):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+            if self.error is not None:
+                raise self.error
+            yield self.name
+            yield "!"
+        finally:
+            self.closed_streams += 1
+
+
+def make_router(*clients: FakeModel, **kwargs) -> LLMRouter:
+    by_name = {client.name: client for client in clients}
+    kwargs.setdefault("hedge", False)
+    return LLMRouter(list(by_name), by_name.__getitem__, explore_ratio=0.0, **kwargs)
+
+
+def warm_up(router: LLMRouter, model: str, kind: str, seconds: float, samples: int = 5) -> None:
+    for _ in range(samples):
+        router.stats[model].record(kind, seconds)
+
+
+async def test_prefers_fastest_model():
+    router = make_router(FakeModel("slow"), FakeModel("fast"))
+    warm_up(router, "slow", "complete", 1.0)
+    warm_up(router, "fast", "complete", 0.1)
+    
+    assert await router.summarize("text", SHORT, None) == "fast"
+
+
+async def test_falls_back_when_model_fails():
+    failing = FakeModel("a", error=RuntimeError("down"))
+    router = make_router(failing, FakeModel("b"))
+    
+    assert await router.summarize("text", SHORT, None) == "b"
+    assert failing.calls == 1
+    assert router.stats["a"].error_rate > 0
+
+
+async def test_falls_back_when_call_is_cancelled_from_inside():
+    router = make_router(FakeModel("a", error=asyncio.CancelledError()), FakeModel("b"))
+    
+    assert await router.summarize("text", SHORT, None) == "b"
+
+
+async def test_raises_last_error_when_all_models_fail():
+    router = make_router(FakeModel("a", error=RuntimeError("a down")), FakeModel("b", error=RuntimeError("b down")))
+    
+    with pytest.raises(RuntimeError, match="b down"):
+        await router.summarize("text", SHORT, None)
+
+
+async def test_hedges_slow_call_with_next_model():
+    slow = FakeModel("a", delay=5.0)
+    router = make_router(slow, FakeModel("b"), hedge=True, hedge_min_samples=5, hedge_max_ratio=1.0)
+    warm_up(router, "a", "complete", 0.01)
+    warm_up(router, "b", "complete", 0.02)
+    
+    result = await asyncio.wait_for(router.summarize("text", SHORT, None), timeout=2)
+    
+    assert result == "b"
+    assert router._hedges == 1
+
+
+async def test_does_not_hedge_without_enough_samples():
+    router = make_router(FakeModel("a", delay=0.1), FakeModel("b"), hedge=True, hedge_min_samples=10, hedge_max_ratio=1.0)
+    warm_up(router, "a", "complete", 0.01)
+    warm_up(router, "b", "complete", 0.02)
+    
+    assert await router.summarize("text", SHORT, None) == "a"
+    assert router._hedges == 0
+
+
+async def test_hedging_respects_budget():
+    router = make_router(FakeModel("a", delay=0.05), FakeModel("b"), hedge=True, hedge_min_samples=1, hedge_max_ratio=0.0)
+    warm_up(router, "a", "complete", 0.01)
+    warm_up(router, "b", "complete", 0.02)
+    
+    assert await router.summarize("text", SHORT, None) == "a"
+    assert router._hedges == 0
+
+
+async def test_hedged_stream_closes_losing_stream():
+    slow = FakeModel("a", delay=5.0)
+    fast = FakeModel("b")
+    router = make_router(slow, fast, hedge=True, hedge_min_samples=5, hedge_max_ratio=1.0)
+    warm_up(router, "a", "first_delta", 0.01)
+    warm_up(router, "b", "first_delta", 0.02)
+    
+    deltas = [delta async for delta in router.summarize_stream("text", SHORT, None)]
+    await asyncio.sleep(0)
+    
+    assert deltas == ["b", "!"]
+    assert slow.closed_streams == 1
+    assert fast.closed_streams == 1
+
+
+def test_abandoned_call_keeps_trial_of_another_call():
+    breaker = CircuitBreaker(threshold=1, cooldown=0)
+    breaker.record_success()
+    other = breaker.before_call()
+    breaker.record_failure()
+    trial = breaker.before_call()
+    
+    breaker.record_abandoned(other)
+    
+    assert trial and not other
+    assert breaker.is_open
+    breaker.record_abandoned(trial)
+    assert not breaker.is_open
@@ -0,0 +1,75 @@
+"""Tests for cached summary serialization."""
+import pytest
+
+from app.core.entities import SummaryOptions, SummaryResult
+from app.infra.cache import serializer
+from app.infra.cache.serializer import CompressedSerializer, JSONSerializer, decode, get_serializer
+
+
+@pytest.fixture
+def result() -> SummaryResult:
+    return SummaryResult(
+        id="a",
+        mode="youtube",
+        options=SummaryOptions(mode="youtube", detail="long"),
+        input_fingerprint="fp",
+        content_md="# Заголовок\n\n- point",
+        meta={"timestamps": [{"time": float(i), "text": f"snippet {i}"} for i in range(200)]},
+    )
+
+
+@pytest.mark.parametrize("compression", ["zstd", "zlib", "none"])
+def test_round_trip(compression, result):
+    codec = get_serializer(compression)
+    
+    assert codec.loads(codec.dumps(result)) == result
+
+
+@pytest.mark.parametrize("codec, marker", [("zstd", b"z"), ("zlib", b"d")])
+def test_compressed_entries_carry_version_header(codec, marker, result):
+    data = CompressedSerializer(codec).dumps(result)
+    
+    assert data[:4] == b"CZ" + bytes([1]) + marker
+    assert len(data) < len(JSONSerializer().dumps(result))
+
+
+def test_none_writes_plain_json(result):
+    assert JSONSerializer().dumps(result).startswith(b"{")
+
+
+@pytest.mark.parametrize("data", [
+    lambda result: result.model_dump_json(),
+    lambda result: result.model_dump_json().encode(),
+])
+def test_reads_legacy_plain_json(data, result):
+    assert decode(data(result)) == result
+
+
+def test_every_serializer_reads_every_format(result):
+    entries = [get_serializer(compression).dumps(result) for compression in ("zstd", "zlib", "none")]
+    
+    for compression in ("zstd", "zlib", "none"):
+        assert all(get_serializer(compression).loads(entry) == result for entry in entries)
+
+
+def test_rejects_unknown_version(result):
+    data = CompressedSerializer("zlib").dumps(result)
+    
+    with pytest.raises(ValueError, match="version"):
+        decode(data[:2] + bytes([2]) + data[3:])
+
+
+def test_rejects_unknown_codec(result):
+    data = CompressedSerializer("zlib").dumps(result)
+    
+    with pytest.raises(ValueError, match="codec"):
+        decode(data[:3] + b"?" + data[4:])
+
+
+def test_falls_back_to_zlib_without_zstandard(monkeypatch, result):
+    monkeypatch.setattr(serializer, "zstandard", None)
+    
+    codec = CompressedSerializer("zstd")
+    
+    assert codec.codec == "zlib"
+    assert codec.loads(codec.dumps(result)) == result
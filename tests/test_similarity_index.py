@@ -0,0 +1,114 @@
+"""Tests for near-duplicate detection (a hit returns another text's summary)."""
+import random
+
+import pytest
+
+from app.core.entities import SummaryOptions
+from app.core.usecases.summarize import SummarizeUseCase
+from app.infra.cache.similarity_index import MinHashIndex, minhash_signature
+
+pytestmark = pytest.mark.anyio
+
+
+def make_text(seed: int, words: int = 300) -> str:
+    rng = random.Random(seed)
+    return " ".join(f"w{rng.randrange(5000)}" for _ in range(words))
+
+
+def edited(text: str, changes: int) -> str:
+    words = text.split()
+    for index in range(changes):
+        words[index * 20] = f"edit{index}"
+    return " ".join(words)
+
+
+def estimate(index: MinHashIndex, a: str, b: str) -> float:
+    num_perm = index.bands * index.rows
+    first = minhash_signature(a, num_perm, index.shingle_words)
+    second = minhash_signature(b, num_perm, index.shingle_words)
+    return sum(x == y for x, y in zip(first, second)) / num_perm
+
+
+async def test_finds_identical_and_slightly_edited_text(redis_cache):
+    index = MinHashIndex(redis_cache, threshold=0.8, min_chars=100)
+    original = make_text(1)
+    await index.add(original, "scope", "key-1")
+    
+    assert await index.find(original, "scope") == ("key-1", 1.0)
+    key, similarity = await index.find(edited(original, 2), "scope")
+    assert key == "key-1" and 0.8 <= similarity < 1.0
+
+
+async def test_unrelated_text_is_not_matched(redis_cache):
+    index = MinHashIndex(redis_cache, threshold=0.5, min_chars=100)
+    await index.add(make_text(1), "scope", "key-1")
+    
+    assert await index.find(make_text(2), "scope") is None
+
+
+async def test_threshold_boundary(redis_cache):
+    original = make_text(1)
+    query = edited(original, 6)
+    similarity = estimate(MinHashIndex(redis_cache, threshold=0.5), original, query)
+    assert 0 < similarity < 1
+    
+    at_threshold = MinHashIndex(redis_cache, threshold=similarity, min_chars=100)
+    above_threshold = MinHashIndex(redis_cache, threshold=similarity + 1e-9, min_chars=100)
+    await at_threshold.add(original, "scope", "key-1")
+    
+    assert await at_threshold.find(query, "scope") == ("key-1", similarity)
+    assert await above_threshold.find(query, "scope") is None
+
+
+async def test_texts_below_min_chars_are_ignored(redis_cache):
+    index = MinHashIndex(redis_cache, threshold=0.8, min_chars=200)
+    text = make_text(1)[:200]
+    
+    await index.add(text[:199], "scope", "short")
+    await index.add(text, "scope", "long")
+    
+    assert await index.find(text[:199], "scope") is None
+    assert await index.find(text, "scope") == ("long", 1.0)
+    client = await redis_cache.get_client()
+    assert await client.exists(index._signature_key("short")) == 0
+
+
+async def test_scopes_are_separate(redis_cache):
+    index = MinHashIndex(redis_cache, threshold=0.8, min_chars=100)
+    text = make_text(1)
+    await index.add(text, "medium:en:openai:gpt-4o-mini", "key-1")
+    
+    assert await index.find(text, "short:en:openai:gpt-4o-mini") is None
+
+
+class FakeLLM:
+    """LLM client answering with a numbered summary."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    async def summarize(self, text, options, prompt_template) -> str:
+        self.calls += 1
+        return f"# Summary {self.calls}"
+
+
+@pytest.mark.parametrize("change", [
+    {"detail": "short"},
+    {"locale": "ru"},
+    {"model": "anthropic:claude-3-5-haiku-latest"},
+])
+async def test_usecase_reuses_summaries_only_within_scope(redis_cache, change):
+    llm = FakeLLM()
+    index = MinHashIndex(redis_cache, threshold=0.8, min_chars=100)
+    usecase = SummarizeUseCase(llm_client=llm, transcript_provider=None, cache_provider=redis_cache, similarity_index=index)
+    options = SummaryOptions(mode="text", model="openai:gpt-4o-mini")
+    text = make_text(1)
+    original = await usecase.execute(text, options)
+    
+    reused = await usecase.execute(edited(text, 2), options)
+    assert reused.id == original.id
+    assert reused.meta["approximate"] is True
+    
+    other = await usecase.execute(edited(text, 2), options.model_copy(update=change))
+    assert other.id != original.id
+    assert llm.calls == 2
@@ -0,0 +1,113 @@
+"""Tests for single-flight request coalescing."""
+import asyncio
+
+import pytest
+
+from app.infra.cache import SingleFlight
+
+pytestmark = pytest.mark.anyio
+
+
+class Tracker:
+    """Counts leaders, checking that no two run at the same time."""
+    
+    def __init__(self):
+        self.leaders = 0
+        self.running = 0
+        self.max_running = 0
+    
+    async def run(self, flight: SingleFlight, key: str, work: float = 0.05, fail: bool = False) -> bool:
+        async with flight.flight(key) as leader:
+            if not leader:
+                return False
+            self.leaders += 1
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            try:
+                await asyncio.sleep(work)
+                if fail:
+                    raise RuntimeError("leader failed")
+            finally:
+                self.running -= 1
+            return True
+
+
+async def test_concurrent_callers_share_one_leader(redis_cache):
+    flight = SingleFlight(redis_cache, timeout=5)
+    tracker = Tracker()
+    
+    results = await asyncio.gather(*(tracker.run(flight, "k") for _ in range(10)))
+    
+    assert results.count(True) == 1
+    assert tracker.leaders == 1
+
+
+async def test_failed_leader_is_replaced_by_one_waiter(redis_cache):
+    flight = SingleFlight(redis_cache, timeout=5)
+    tracker = Tracker()
+    
+    first = asyncio.create_task(tracker.run(flight, "k", fail=True))
+    await asyncio.sleep(0.01)
+    waiters = [asyncio.create_task(tracker.run(flight, "k")) for _ in range(5)]
+    
+    with pytest.raises(RuntimeError):
+        await first
+    results = await asyncio.gather(*waiters)
+    
+    # One waiter took over; the others waited for it instead of computing
+    assert results.count(True) == 1
+    assert tracker.leaders == 2
+    assert tracker.max_running == 1
+
+
+async def test_waiter_in_other_worker_gets_leader_result(redis_cache):
+    worker_a = SingleFlight(redis_cache, timeout=5)
+    worker_b = SingleFlight(redis_cache, timeout=5)
+    tracker = Tracker()
+    
+    leader = asyncio.create_task(tracker.run(worker_a, "k", work=0.2))
+    await asyncio.sleep(0.05)
+    
+    assert await tracker.run(worker_b, "k") is False
+    assert await leader is True
+
+
+async def test_waiter_in_other_worker_takes_over_failed_leader(redis_cache):
+    worker_a = SingleFlight(redis_cache, timeout=5)
+    worker_b = SingleFlight(redis_cache, timeout=5)
+    tracker = Tracker()
+    
+    leader = asyncio.create_task(tracker.run(worker_a, "k", work=0.2, fail=True))
+    await asyncio.sleep(0.05)
+    
+    assert await tracker.run(worker_b, "k") is True
+    with pytest.raises(RuntimeError):
+        await leader
+    assert tracker.max_running == 1
+
+
+async def test_lock_is_renewed_while_leader_works(redis_cache):
+    worker_a = SingleFlight(redis_cache, timeout=5, lock_ttl=0.3)
+    worker_b = SingleFlight(redis_cache, timeout=5, lock_ttl=0.3)
+    tracker = Tracker()
+    
+    # The leader works for several lock lifetimes
+    leader = asyncio.create_task(tracker.run(worker_a, "k", work=1.0))
+    await asyncio.sleep(0.05)
+    
+    assert await tracker.run(worker_b, "k") is False
+    assert await leader is True
+    assert tracker.max_running == 1
+
+
+async def test_waiter_times_out_while_leader_still_works(redis_cache):
+    flight = SingleFlight(redis_cache, timeout=1)
+    tracker = Tracker()
+    
+    leader = asyncio.create_task(tracker.run(flight, "k", work=1.5))
+    await asyncio.sleep(0.01)
+    
+    with pytest.raises(TimeoutError):
+        await tracker.run(flight, "k")
+    assert await leader is True
+    assert tracker.leaders == 1
@@ -0,0 +1,64 @@
+"""Tests for the summarization use case."""
+import pytest
+
+from app.core.entities import SummaryOptions
+from app.core.usecases.summarize import SummarizeUseCase
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeLLM:
+    """LLM client answering with a numbered summary."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    async def summarize(self, text, options, prompt_template) -> str:
+        self.calls += 1
+        return f"# Summary {self.calls}"
+    
+    async def summarize_stream(self, text, options, prompt_template):
+        yield await self.summarize(text, options, prompt_template)
+
+
+@pytest.fixture
+def usecase(redis_cache):
+    redis_cache.max_items = 2
+    return SummarizeUseCase(llm_client=FakeLLM(), transcript_provider=None, cache_provider=redis_cache)
+
+
+async def test_cache_hit_restores_trimmed_history_entry(usecase, redis_cache):
+    options = SummaryOptions(mode="text")
+    first = await usecase.execute("first text", options)
+    await usecase.execute("second text", options)
+    await usecase.execute("third text", options)
+    assert await redis_cache.get(first.id) is None
+    
+    hit = await usecase.execute("first text", options)
+    
+    assert hit.id == first.id
+    assert usecase.llm_client.calls == 3
+    assert (await redis_cache.get(first.id)).content_md == first.content_md
+    assert (await redis_cache.list_recent(10))[0].id == first.id
+
+
+async def test_streamed_cache_hit_restores_trimmed_history_entry(usecase, redis_cache):
+    options = SummaryOptions(mode="text")
+    first = await usecase.execute("first text", options)
+    await usecase.execute("second text", options)
+    await usecase.execute("third text", options)
+    
+    items = [item async for item in usecase.execute_stream("first text", options)]
+    
+    assert items[-1].id == first.id
+    assert await redis_cache.get(first.id) is not None
+
+
+async def test_get_cached_restores_trimmed_history_entry(usecase, redis_cache):
+    options = SummaryOptions(mode="text")
+    first = await usecase.execute("first text", options)
+    await usecase.execute("second text", options)
+    await usecase.execute("third text", options)
+    
+    assert (await usecase.get_cached("first text", options)).id == first.id
+    assert await redis_cache.get(first.id) is not None
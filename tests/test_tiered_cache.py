@@ -0,0 +1,74 @@
+"""Tests for the two-tier summary cache."""
+import asyncio
+
+import pytest
+
+from app.infra.cache.tiered_cache import TieredCache
+
+pytestmark = pytest.mark.anyio
+
+
+async def wait_until_discarded(cache: TieredCache, key: str) -> None:
+    for _ in range(50):
+        if cache._lookup(key) is None:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"{key} is still in the local tier")
+
+
+async def test_overwrite_invalidates_other_workers(redis_cache, make_result):
+    writer = TieredCache(redis_cache, max_bytes=1_000_000, ttl=300)
+    reader = TieredCache(redis_cache, max_bytes=1_000_000, ttl=300)
+    await reader.start()
+    try:
+        await writer.set("a", make_result("a", "# Old"))
+        assert (await reader.get("a")).content_md == "# Old"
+        await asyncio.sleep(0.05)
+        
+        await writer.set("a", make_result("a", "# New"))
+        
+        await wait_until_discarded(reader, "a")
+        assert (await reader.get("a")).content_md == "# New"
+    finally:
+        await reader.close()
+
+
+async def test_rewriting_same_content_keeps_local_entries(redis_cache, make_result):
+    client = await redis_cache.get_client()
+    pubsub = client.pubsub()
+    await pubsub.subscribe(redis_cache.invalidate_channel)
+    cache = TieredCache(redis_cache, max_bytes=1_000_000, ttl=300)
+    result = make_result("a")
+    
+    await cache.set("a", result)
+    await cache.set("a", result)
+    
+    for _ in range(3):
+        assert await pubsub.get_message(ignore_subscribe_messages=True, timeout=0.05) is None
+    await pubsub.aclose()
+
+
+async def test_local_entry_expires_with_shorter_redis_ttl(redis_cache, monkeypatch, make_result):
+    cache = TieredCache(redis_cache, max_bytes=1_000_000, ttl=300)
+    now = 1000.0
+    monkeypatch.setattr("app.infra.cache.tiered_cache.time.monotonic", lambda: now)
+    
+    await cache.set("a", make_result("a"), ttl=10)
+    assert cache._lookup("a") is not None
+    
+    now += 11
+    assert cache._lookup("a") is None
+
+
+async def test_results_are_copies(redis_cache, make_result):
+    cache = TieredCache(redis_cache, max_bytes=1_000_000, ttl=300)
+    result = make_result("a", "# Original")
+    await cache.set("a", result)
+    
+    result.content_md = "# Changed by caller"
+    cached = await cache.get("a")
+    cached.meta["changed"] = True
+    
+    again = await cache.get("a")
+    assert again.content_md == "# Original"
+    assert "changed" not in again.meta